@@ -0,0 +1,471 @@
+#   Times the data layer on synthetic schools, to catch regressions
+
+#   Libraries
+import argparse
+import json
+import gc
+import os
+import pickle
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+import constants
+import data
+import storage
+
+
+#   Code
+FNAMES = ('Maria', 'Jose', 'Juan', 'Ana', 'Mark', 'Angel', 'John', 'Paolo',
+	'Kristine', 'Michael', 'Angelica', 'Joshua', 'Nicole', 'Christian', 'Jasmine',
+	'Carlo', 'Patricia', 'Gabriel', 'Andrea', 'Miguel', 'Camille', 'Rafael', 'Bea',
+	'Daniel', 'Sofia', 'Luis', 'Isabel', 'Ramon', 'Teresa', 'Paulo')
+LNAMES = ('Santos', 'Reyes', 'Cruz', 'Bautista', 'Ocampo', 'Garcia', 'Mendoza',
+	'Torres', 'Tomas', 'Andrada', 'Castillo', 'Flores', 'Villanueva', 'Ramos',
+	'Castro', 'Rivera', 'Aquino', 'Navarro', 'Salazar', 'Mercado', 'Dela Cruz',
+	'Gonzales', 'Lopez', 'Del Rosario', 'Aguilar', 'Pascual', 'Domingo', 'Soriano')
+STREETS = ('Mabini St.', 'Rizal Ave.', 'Bonifacio St.', 'Luna St.', 'Quezon Blvd.',
+	'Del Pilar St.', 'Aguinaldo Hwy.', 'Burgos St.')
+SECTION_NAMES = ('Sampaguita', 'Narra', 'Molave', 'Ilang-Ilang', 'Rosal', 'Acacia',
+	'Dama de Noche', 'Kamagong', 'Yakal', 'Camia', 'Adelfa', 'Banaba')
+
+class School:
+	"""A synthetic school written to a directory: sections spread across
+	constants.GRADE_LVLS, students placed in the sections of their grade, and
+	teachers advising and teaching them."""
+
+	def __init__(self, directory: str, students: int, teachers: int,
+		sections: int, seed: int=0) -> None:
+		"""
+		Args:
+			directory (str): Where the sections, students and teachers
+			directories are made.
+			students (int): The number of students.
+			teachers (int): The number of teachers.
+			sections (int): The number of sections.
+			seed (int): The seed of the random values. Defaults to 0.
+		"""
+
+		self.directory = directory
+		self.random = random.Random(seed)
+		self.sections: List[data.Section] = []
+		self.students: List[data.Student] = []
+		self.teachers: List[data.Teacher] = []
+		self.counts = {'students': students, 'teachers': teachers, 'sections': sections}
+
+	def path(self, kind: str, name: str) -> str:
+		return os.path.join(self.directory, kind, name)
+
+	def name(self) -> Dict[str, Optional[str]]:
+		"""Get a random first, middle and last name."""
+
+		return {
+			'fname': self.random.choice(FNAMES),
+			'mname': self.random.choice(LNAMES) if self.random.random() < 0.9 else None,
+			'lname': self.random.choice(LNAMES)
+		}
+
+	def build(self) -> None:
+		"""Make the records, without writing them."""
+
+		year = date.today().year
+		for i in range(self.counts['sections']):
+			grade = constants.GRADE_LVLS[i % len(constants.GRADE_LVLS)]
+			name = f'{SECTION_NAMES[i // len(constants.GRADE_LVLS) % len(SECTION_NAMES)]} {i}'
+			self.sections.append(data.Section(self.path('sections',
+				constants.FILENAME_FORMATS.SECTION.value.format(
+					glvl=grade.replace(' ', ''), name=name.replace(' ', ''))),
+				name, grade))
+
+		for i in range(self.counts['teachers']):
+			name = self.name()
+			teacher = data.Teacher(self.path('teachers', f'teacher_{i}.pkl'), None,
+				name['fname'], date(self.random.randint(1960, 1998),
+				self.random.randint(1, 12), self.random.randint(1, 28)),
+				f'{self.random.randint(1, 999)} {self.random.choice(STREETS)}',
+				self.random.choice(constants.GENDERS), sections=[],
+				contact_no=f'09{self.random.randint(0, 999999999):09}',
+				mname=name['mname'], lname=name['lname'])
+			self.teachers.append(teacher)
+			if self.sections:
+				section = self.sections[i % len(self.sections)]
+				if i < len(self.sections):
+					section.adviser = teacher.uid
+					teacher.advisory_cls = section.uid
+				else:
+					section.add(teacher)
+				teacher.sections.append(section.uid)
+
+		by_grade: Dict[str, List[data.Section]] = {}
+		for section in self.sections:
+			by_grade.setdefault(section.grade, []).append(section)
+
+		for i in range(self.counts['students']):
+			name = self.name()
+			level = self.random.randrange(len(constants.GRADE_LVLS))
+			grade = constants.GRADE_LVLS[level]
+			section = self.random.choice(by_grade[grade]) if grade in by_grade else None
+			student = data.Student(self.path('students', f'student_{i}.pkl'), None,
+				name['fname'], date(year - 5 - level, self.random.randint(1, 12),
+				self.random.randint(1, 28)),
+				f'{self.random.randint(1, 999)} {self.random.choice(STREETS)}',
+				self.random.choice(constants.GENDERS), f'{self.random.randint(0, 10**12 - 1):012}',
+				(year, year + 1), [f"{self.random.choice(FNAMES)} {name['lname']}"],
+				grade, section.uid if section else None, mname=name['mname'],
+				lname=name['lname'])
+			self.students.append(student)
+			if section is not None:
+				section.add(student)
+
+	def write(self) -> None:
+		"""Write every record in one transaction."""
+
+		for kind in ('sections', 'students', 'teachers'):
+			os.makedirs(os.path.join(self.directory, kind), exist_ok=True)
+		with data.Transaction():
+			for record in self.sections + self.students + self.teachers:
+				record.dump()
+
+	def loaders(self, workers: int=0, lazy: bool=False) -> List[data.PathLoader]:
+		"""Get new loaders of the school's records."""
+
+		references = data.References()
+		return [data.SectionLoader(os.path.join(self.directory, 'sections'), workers, 
+				lazy=lazy, references=references),
+			data.StudentLoader(os.path.join(self.directory, 'students'), workers, 
+				lazy=lazy, references=references),
+			data.TeacherLoader(os.path.join(self.directory, 'teachers'), workers, 
+				lazy=lazy, references=references)]
+
+class Benchmark:
+	"""Runs timed cases and collects their results."""
+
+	def __init__(self, repeat: int=5) -> None:
+
+		self.repeat = repeat
+		self.results: Dict[str, Dict[str, Any]] = {}
+
+	def time(self, name: str, function: Callable[[], Any],
+		setup: Optional[Callable[[], Any]]=None, repeat: Optional[int]=None,
+		**info) -> Any:
+		"""Time a case, keeping the seconds of each run.
+
+		Args:
+			name (str): The name of the case.
+			function (Callable[[], Any]): What is timed.
+			setup (Callable[[], Any]): Called untimed before each run.
+			Defaults to None.
+			repeat (int): The number of runs. Defaults to self.repeat.
+			**info: Kept with the results, such as the number of matches.
+
+		Returns:
+			Any: What the last run returned.
+		"""
+
+		runs = []
+		result = None
+		for _ in range(repeat or self.repeat):
+			if setup is not None:
+				setup()
+			start = time.perf_counter()
+			result = function()
+			runs.append(time.perf_counter() - start)
+
+		self.results[name] = {
+			'runs': runs,
+			'min': min(runs),
+			'median': statistics.median(runs),
+			**info
+		}
+		print(f'{name:<36}{min(runs)*1000:>10.2f} ms  (median '
+			f'{statistics.median(runs)*1000:.2f} ms)', file=sys.stderr)
+		return result
+
+	def memory(self, name: str, function: Callable[[], Any], records: int, 
+		**info) -> Any:
+		"""Measure the memory held by what a case returns, with tracemalloc.
+
+		Args:
+			name (str): The name of the case.
+			function (Callable[[], Any]): What is measured. What it returns 
+			is kept until the memory is read.
+			records (int): The number of records it makes, to get the bytes 
+			per record.
+			**info: Kept with the results.
+
+		Returns:
+			Any: What the case returned.
+		"""
+
+		gc.collect()
+		tracemalloc.start()
+		try:
+			result = function()
+			size = tracemalloc.get_traced_memory()[0]
+		finally:
+			tracemalloc.stop()
+
+		per_record = size / records if records else 0
+		self.results[name] = {
+			'bytes': size,
+			'records': records,
+			'per_record': per_record,
+			**info
+		}
+		print(f'{name:<36}{size/1e6:>10.1f} MB  ({per_record:.0f} B/record)', 
+			file=sys.stderr)
+		return result
+
+def check(name: str, indexed: List[Any], linear: List[Any]) -> None:
+	"""Make sure the index found the same records as checking each one did, 
+	so a faster index is never a different answer.
+
+	Raises:
+		AssertionError: If the results differ.
+	"""
+
+	if indexed != linear:
+		raise AssertionError(f'{name}: the index found {len(indexed)} records, '
+			f'checking each one found {len(linear)}')
+
+def commit() -> Optional[str]:
+	"""Get the commit being benchmarked, if run from a git checkout."""
+
+	try:
+		return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+			capture_output=True, text=True, check=True,
+			cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+	"""Generate a school and time the data layer on it.
+
+	Args:
+		args (argparse.Namespace): The parsed command line.
+
+	Returns:
+		Dict[str, Any]: The parameters and the results.
+	"""
+
+	if args.directory is not None:
+		return measure(args, args.directory)
+	with tempfile.TemporaryDirectory(prefix='sds_bench_') as directory:
+		return measure(args, directory)
+
+def measure(args: argparse.Namespace, directory: str) -> Dict[str, Any]:
+	"""Generate a school in a directory and time the data layer on it, in 
+	the storage given by the command line.
+
+	Args:
+		args (argparse.Namespace): The parsed command line.
+		directory (str): Where the school is written.
+
+	Returns:
+		Dict[str, Any]: The parameters and the results.
+	"""
+
+	default = data.DataLoader.storage
+	if args.storage == 'sqlite':
+		data.DataLoader.storage = storage.SQLiteStorage(os.path.join(directory, 'records.db'))
+	elif args.storage == 'journal':
+		data.DataLoader.storage = storage.JournalStorage(storage.FileStorage(),
+			os.path.join(directory, 'journal.log'), sync=False)
+
+	try:
+		results = time_all(args, directory)
+	finally:
+		#   Closed so the directory can be removed
+		if data.DataLoader.storage is not default:
+			data.DataLoader.storage.close()
+			data.DataLoader.storage = default
+
+	return {
+		'commit': commit(),
+		'python': platform.python_version(),
+		'platform': platform.platform(),
+		'params': {
+			'students': args.students,
+			'teachers': args.teachers,
+			'sections': args.sections,
+			'storage': args.storage,
+			'workers': args.workers,
+			'lazy': args.lazy,
+			'repeat': args.repeat,
+			'seed': args.seed,
+			'memory': args.memory,
+			'directory': args.directory
+		},
+		'results': results
+	}
+
+def time_all(args: argparse.Namespace, directory: str) -> Dict[str, Dict[str, Any]]:
+	"""Run every timed case.
+
+	Returns:
+		Dict[str, Dict[str, Any]]: The results of each case, by name.
+	"""
+
+	bench = Benchmark(args.repeat)
+	school = School(directory, args.students, args.teachers, args.sections, args.seed)
+	bench.time('generate', school.build, repeat=1)
+	bench.time('write_all', school.write, repeat=1,
+		records=args.students + args.teachers + args.sections)
+
+	holder = {}
+	def cold() -> None:
+		holder['loaders'] = school.loaders(args.workers, args.lazy)
+		for loader in holder['loaders']:
+			loader.load()
+	bench.time('load_cold', cold)
+	sectionloader, studentloader, teacherloader = holder['loaders']
+
+	def warm() -> None:
+		for loader in holder['loaders']:
+			loader.load()
+	bench.time('load_warm', warm)
+
+	changed = school.students[::max(1, len(school.students) // 100)]
+	def touch() -> None:
+		with data.Transaction():
+			for student in changed:
+				student.dump()
+	bench.time('load_after_1pct_changed', warm, setup=touch, changed=len(changed))
+
+	grade = constants.GRADE_LVLS[len(constants.GRADE_LVLS) // 2]
+	section = school.sections[0].uid if school.sections else None
+	student = school.students[0] if school.students else None
+	filters = {
+		'grade': {'grade_lvl': grade},
+		'grade_and_sex': {'grade_lvl': grade, 'sex': constants.GENDERS[1]},
+		'section': {'section': section},
+		#   Profiles keep the full name, not its parts
+		'full_name': {'name': student.get_full_name()} if student else {},
+		'no_match': {'name': 'Nobody'},
+		#   Values a string field cannot be a part of
+		'no_section': {'section': None},
+		'lrn_number': {'lrn': 5}
+	}
+	items = studentloader.items
+	for shape, query in filters.items():
+		matches = bench.time(f'search_linear_{shape}',
+			lambda: data.search(items, query))
+		found = bench.time(f'search_indexed_{shape}', lambda: studentloader.search(query),
+			matches=len(matches))
+		check(f'search_{shape}', found, matches)
+	year = date.today().year
+	queries = {
+		'bday_range': data.Range('bday', date(year - 12, 1, 1), date(year - 9, 12, 31)),
+		'grade_in': data.In('grade_lvl', constants.GRADE_LVLS[:3]),
+		'name_prefix_ci': data.Prefix('name', 'ma', ignore_case=True),
+		'compound': data.In('grade_lvl', constants.GRADE_LVLS[:3]) & 
+			~data.Eq('sex', constants.GENDERS[0], ignore_case=True) | 
+			data.Range('sy', year + 1)
+	}
+	for shape, predicate in queries.items():
+		matches = bench.time(f'query_linear_{shape}', lambda: 
+			[item for item in items if predicate.matches(data.get_profile(item))])
+		found = bench.time(f'query_indexed_{shape}', lambda: studentloader.query(predicate),
+			matches=len(matches))
+		check(f'query_{shape}', found, matches)
+	bench.time('query_ordered_limit', lambda: studentloader.query(queries['grade_in'], 
+		order_by='bday', limit=50))
+	for text in ('s', 'san', student.lname.lower() if student else 'santos'):
+		bench.time(f'find_{text}', lambda: studentloader.find(text, 200))
+
+	bench.time('resolve_student_sections', lambda: [sectionloader.resolve(item.section) 
+		for item in studentloader.items], records=len(studentloader.items))
+
+	saved = school.students[:min(100, len(school.students))]
+	def save_each() -> None:
+		for record in saved:
+			record.dump()
+	def save_batch() -> None:
+		with data.Transaction():
+			for record in saved:
+				record.dump()
+	bench.time('save_each', save_each, records=len(saved))
+	bench.time('save_batch', save_batch, records=len(saved))
+
+	renamed = saved[:min(20, len(saved))]
+	def rename_batch() -> None:
+		with data.Transaction() as transaction:
+			for record in renamed:
+				root, ext = os.path.splitext(record.path)
+				record.path = root[:-1] + ('b' if root.endswith('a') else 'a') + ext
+				record.dump()
+		studentloader.refresh(transaction.paths)
+	#   Renamed back and forth between names ending in _a and _b
+	for record in renamed:
+		record.path = os.path.splitext(record.path)[0] + '_a.pkl'
+	studentloader.load()
+	bench.time('rename_batch_and_refresh', rename_batch, records=len(renamed))
+
+	def rename_cascade() -> None:
+		with data.Transaction() as transaction:
+			for record in renamed:
+				root, ext = os.path.splitext(record.path)
+				record.path = root[:-1] + ('b' if root.endswith('a') else 'a') + ext
+				record.dump()
+				sectionloader.relink(record)
+		for loader in holder['loaders']:
+			loader.refresh(transaction.paths)
+	bench.time('rename_cascade_and_refresh', rename_cascade, records=len(renamed))
+
+	if school.sections and school.students:
+		target = data.Section(school.path('sections', 'section_bench.pkl'), 'Bench', grade)
+		def reset() -> None:
+			target.students = []
+		bench.time('section_add', lambda: [target.add(s) for s in school.students],
+			setup=reset, records=len(school.students))
+		bench.time('section_add_many', lambda: target.add_many(school.students),
+			setup=reset, records=len(school.students))
+		bench.time('section_remove_many', lambda: target.remove_many(school.students),
+			setup=lambda: target.add_many(school.students), records=len(school.students))
+
+	if args.memory:
+		#   Unpickled as the loaders do, so the field values shared on load are
+		#   only counted once
+		pickles = [pickle.dumps(record) for record in school.students]
+		bench.memory('memory_students', lambda: [pickle.loads(s) for s in pickles], 
+			len(pickles))
+
+	return bench.results
+
+def main(argv: Optional[List[str]]=None) -> int:
+
+	parser = argparse.ArgumentParser(description='Time the data layer on a synthetic school.')
+	parser.add_argument('--students', type=int, default=10000)
+	parser.add_argument('--teachers', type=int, default=400)
+	parser.add_argument('--sections', type=int, default=90)
+	parser.add_argument('--storage', choices=('pickle', 'sqlite', 'journal'), default='pickle')
+	parser.add_argument('--workers', type=int, default=0, help='Threads loading records.')
+	parser.add_argument('--lazy', action='store_true', help='Only load record summaries.')
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--seed', type=int, default=0)
+	parser.add_argument('--memory', action='store_true', help='Also measure the memory '
+		'of each loaded student with tracemalloc, such as with --students 100000.')
+	parser.add_argument('--directory', help='Where to write the school, which is kept. A '
+		'temporary directory removed afterwards if not given.')
+	parser.add_argument('--output', help='Write the results as JSON to this file '
+		'instead of stdout, such as bench_output.txt.')
+	args = parser.parse_args(argv)
+
+	report = run(args)
+	if args.output:
+		with open(args.output, 'w', encoding='utf-8') as file:
+			json.dump(report, file, indent=1)
+	else:
+		json.dump(report, sys.stdout, indent=1)
+		print()
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -3,8 +3,7 @@
 #   Libraries
 import os.path
 from enum import Enum
-
-from PIL import Image
+from typing import Any, List
 
 
 #   Code
@@ -12,10 +11,20 @@ class DEFAULT_SETTINGS(Enum):
 	EXPAND: bool = False
 	RESTORE_LAST: bool = False
 	TITLE: str = 'School Database System'
+	#   Either 'pickle' for one file per record or 'sqlite' for a database
+	STORAGE: str = 'pickle'
+	#   Append saves to a journal, applied to the storage in the background. 
+	#   Off by default, as records only reach their files when it is compacted
+	JOURNAL: bool = False
+	#   A key of gui.Theme.THEMES
+	THEME: str = 'default'
 
 class PATHS(Enum):
 	APPSTATE: str = os.path.join('data', 'appstate.pkl')
 	SETTINGS: str = os.path.join('data', 'settings.pkl')
+	DATABASE: str = os.path.join('data', 'records.db')
+	JOURNAL: str = os.path.join('data', 'journal.log')
+	THUMBNAILS: str = os.path.join('data', 'thumbnails')
 
 	SECTIONS: str = os.path.join('data', 'sections')
 	STUDENTS: str = os.path.join('data', 'students')
@@ -28,9 +37,19 @@ class FILENAME_FORMATS(Enum):
 
 TITLE = 'School Database System'
 
-SUPPORTED_IMG_TYPES = [[f'{f} File', ext] for ext
-	, f in Image.registered_extensions().items() if f in Image.OPEN]
-SUPPORTED_IMG_TYPES.insert(0, ['All Files', '*'])
 GRADE_LVLS = ('Preparatory', 'Kinder I', 'Kinder II', 'Grade I', 'Grade II', 
 	'Grade III', 'Grade IV', 'Grade V', 'Grade VI')
 GENDERS = ('Male', 'Female')
+
+def __getattr__(name: str) -> Any:
+	#   SUPPORTED_IMG_TYPES makes PIL load every image plugin, so it is only 
+	#   worked out the first time a file dialog needs it
+	if name == 'SUPPORTED_IMG_TYPES':
+		from PIL import Image
+
+		types: List[List[str]] = [[f'{f} File', ext] for ext
+			, f in Image.registered_extensions().items() if f in Image.OPEN]
+		types.insert(0, ['All Files', '*'])
+		globals()[name] = types
+		return types
+	raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,25 +1,43 @@
 #   Manages everything related to data
 
 #   Libraries
+import copy
+import hashlib
+import heapq
+import itertools
 import os
 import pickle
+import queue
+import sys
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import MutableSet
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
-from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union
-
-from PIL import ImageTk
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Set, Tuple, Type, Union
 
 import constants
+import storage
 
 #	TODO:
 #	- Do teacher advisory cls
-#	- Do section advisor
 #	- Do section path changing
 
 #   Code
 class DataLoader(ABC):
+	#   Records are kept in slots instead of a __dict__ to save memory, and are 
+	#   pickled as a dict of them so older pickles still load
+	__slots__ = ('_path', 'uid')
+	#   Fields whose values repeat across records, shared when loaded
+	SHARED: Tuple[str, ...] = ()
+
+	#   Where every record is read from and written to
+	storage: 'storage.Storage' = storage.FileStorage()
+
 	def __init__(self, path: str) -> None:
 		self._path = path
+		#   Other records reference this one by it, so it never changes
+		self.uid: str = self.new_uid()
 
 	@property
 	def path(self) -> str:
@@ -29,11 +47,48 @@ class DataLoader(ABC):
 	def path(self, value: str) -> None:
 		#   Prevents changing paths if given value is the same
 		if self._path != value:
-			os.remove(self._path)
+			old = self._path
+
+			transaction = Transaction.current()
+			if transaction is not None:
+				if transaction.origin(self) is None and not transaction.exists(old):
+					raise FileNotFoundError(old)
+				transaction.move(self, old)
+				self._path = value
+				return
+
 			self._path = value
 			#   Automatically transfers the information to the new path
-			self.dump()
+			try:
+				self.storage.move(old, value, self.dumps(), self)
+			except OSError:
+				self._path = old
+				raise
+
+	@property
+	def kind(self) -> str:
+		return type(self).__name__
 	
+	@staticmethod
+	def new_uid() -> str:
+		"""Get a new ID for a record."""
+
+		return os.urandom(6).hex()
+
+	@staticmethod
+	def legacy_uid(path: str) -> str:
+		"""Get the ID of a record saved before records had IDs, the same 
+		every time it is loaded until it is saved with it.
+
+		Args:
+			path (str): The path the record was loaded from.
+
+		Returns:
+			str: The ID.
+		"""
+
+		return hashlib.sha1(os.path.normpath(path).encode('utf-8')).hexdigest()[:12]
+
 	@staticmethod
 	def construct(path: str) -> Type['DataLoader']:
 		"""Construct a DataLoader from a path.
@@ -45,8 +100,7 @@ class DataLoader(ABC):
 			DataLoader: The loaded DataLoader.
 		"""
 
-		with open(path, 'rb') as f:
-			return pickle.load(f, encoding='utf-8')
+		return DataLoader.constructs(DataLoader.storage.read(path))
 
 	@staticmethod
 	def constructs(s: bytes) -> Type['DataLoader']:
@@ -69,8 +123,7 @@ class DataLoader(ABC):
 		"""
 
 		try:
-			with open(self.path, 'rb') as f:
-				d: DataLoader = pickle.load(f, encoding='utf-8')
+			d: DataLoader = pickle.loads(self.storage.read(self.path), encoding='utf-8')
 		except OSError:
 			self.dump()
 			d = self
@@ -91,11 +144,16 @@ class DataLoader(ABC):
 		return d
 
 	def dump(self) -> None:
-		"""Dump the data onto a file specified in __init__.
+		"""Dump the data onto a file specified in __init__. Inside a 
+		Transaction, it is only written when the transaction ends.
 		"""
 
-		with open(self.path, 'wb') as f:
-			pickle.dump(self, f)
+		transaction = Transaction.current()
+		if transaction is not None:
+			transaction.add(self)
+			return
+
+		self.storage.write(self.path, self.dumps(), self)
 
 	def dumps(self) -> bytes:
 		"""Dump the data onto a byte string.
@@ -103,35 +161,443 @@ class DataLoader(ABC):
 
 		return pickle.dumps(self)
 
+	def __getstate__(self) -> Dict[str, Any]:
+
+		return {name: getattr(self, name) for name in self.fields() 
+			if hasattr(self, name)}
+
+	def __setstate__(self, state: Union[Dict[str, Any], Tuple[Dict[str, Any], Dict[str, Any]]]
+		) -> None:
+
+		#   Pickled with the default slots state, (__dict__, slots)
+		if isinstance(state, tuple):
+			state = {**(state[0] or {}), **(state[1] or {})}
+
+		for name, value in state.items():
+			if name in self.SHARED and isinstance(value, str):
+				value = sys.intern(value)
+			try:
+				object.__setattr__(self, name, value)
+			except AttributeError:
+				#   Fields that no longer exist
+				continue
+
+		if getattr(self, 'uid', None) is None:
+			self.uid = self.legacy_uid(self._path)
+
+	@classmethod
+	def fields(cls) -> Tuple[str, ...]:
+		"""Get the names of the slots of the record, from its bases down.
+
+		Returns:
+			Tuple[str, ...]: The names of the slots.
+		"""
+
+		return tuple(name for klass in reversed(cls.__mro__) 
+			for name in klass.__dict__.get('__slots__', ()))
+
+	def summary(self) -> Dict[str, Any]:
+		"""Get the fields needed to list and search the record, which are 
+		stored apart from it so they can be read without loading it.
+
+		Returns:
+			Dict[str, Any]: The fields of the summary.
+		"""
+
+		return {'kind': self.kind, 'uid': self.uid}
+
+class Transaction:
+	"""Collects the records dumped or moved inside a with block and writes 
+	them all at once when it ends, through Storage.apply. Each record is 
+	written once however many times it was dumped, and nothing is written if 
+	the block raises. A transaction started inside another joins it.
+
+	After it ends, paths holds every path that was written or removed, for 
+	refreshing only those records. Given a SaveQueue, the records are handed 
+	to it instead and written on its thread, and paths is left empty.
+	"""
+
+	_local = threading.local()
+
+	def __init__(self, saves: Optional['SaveQueue']=None, 
+		callback: Optional[Callable[[Optional[Exception]], None]]=None) -> None:
+		"""
+		Args:
+			saves (SaveQueue): Write the records on this queue instead. 
+			Defaults to None.
+			callback (Callable[[Optional[Exception]], None]): Passed to the 
+			queue to be called once the records are written. Defaults to None.
+		"""
+
+		self.paths: Set[str] = set()
+		self._records: Dict[int, DataLoader] = {}
+		#   id of a moved record -> its path before the transaction
+		self._origins: Dict[int, str] = {}
+		self._outer: Optional[Transaction] = None
+		self._saves = saves
+		self._callback = callback
+
+	@classmethod
+	def current(cls) -> Optional['Transaction']:
+		"""Get the transaction running on this thread, if there is one."""
+
+		return getattr(cls._local, 'current', None)
+
+	def __enter__(self) -> 'Transaction':
+		self._outer = self.current()
+		if self._outer is not None:
+			return self._outer
+		Transaction._local.current = self
+		return self
+
+	def __exit__(self, exc_type, exc, tb) -> None:
+		if self._outer is not None:
+			return
+		Transaction._local.current = None
+		if exc_type is None:
+			self.commit()
+
+	def add(self, record: DataLoader) -> None:
+		"""Mark a record to be written.
+
+		Args:
+			record (DataLoader): The record.
+		"""
+
+		self._records.setdefault(id(record), record)
+
+	def move(self, record: DataLoader, old: str) -> None:
+		"""Mark a record to be moved from a path.
+
+		Args:
+			record (DataLoader): The record.
+			old (str): The path the record is moved from.
+		"""
+
+		self._origins.setdefault(id(record), old)
+		self.add(record)
+
+	def origin(self, record: DataLoader) -> Optional[str]:
+		"""Get the path a record had before it was moved in the transaction.
+		"""
+
+		return self._origins.get(id(record))
+
+	def exists(self, path: str) -> bool:
+		"""Check if a record exists at a path, or will once the saves queued 
+		before this transaction are written."""
+
+		return DataLoader.storage.exists(path) or \
+			(self._saves is not None and self._saves.pending(path))
+
+	def commit(self) -> None:
+		"""Write every marked record, or queue them if given a SaveQueue."""
+
+		if self._saves is not None:
+			self._saves.put(self._records.values(), self._origins, self._callback)
+		else:
+			ops = self.operations(((record, self._origins.get(key)) 
+				for key, record in self._records.items()), self.paths)
+			if ops:
+				DataLoader.storage.apply(ops)
+		self._records.clear()
+		self._origins.clear()
+
+	@staticmethod
+	def operations(records: Iterable[Tuple[DataLoader, Optional[str]]], 
+		paths: Set[str]) -> List[tuple]:
+		"""Get the Storage.apply operations writing some records.
+
+		Args:
+			records (Iterable[Tuple[DataLoader, Optional[str]]]): The records 
+			and the paths they were moved from, or None if not moved.
+			paths (Set[str]): Gets every path written or removed.
+
+		Returns:
+			List[tuple]: The operations.
+		"""
+
+		ops = []
+		for record, old in records:
+			s = record.dumps()
+			if old is not None and old != record.path:
+				ops.append(('move', old, record.path, s, record))
+				paths.add(old)
+			else:
+				ops.append(('write', record.path, s, record))
+			paths.add(record.path)
+		return ops
+
+class SaveQueue:
+	"""Writes records on a worker thread so saving never blocks the caller. 
+	Records queued again before they are written are only written once, in 
+	their latest state.
+
+	Each batch written is reported on done as (paths, error, callbacks): the 
+	paths written or removed, the exception if it failed, and the callbacks 
+	of the saves in it. They are meant to be called on the thread that 
+	reads done, with the error.
+	"""
+
+	def __init__(self) -> None:
+
+		self.done: queue.Queue = queue.Queue()
+		self._cond = threading.Condition()
+		#   id of a record -> (record, copy of it to write, path it was moved from)
+		self._pending: Dict[int, Tuple[DataLoader, DataLoader, Optional[str]]] = {}
+		self._writing: Dict[int, Tuple[DataLoader, DataLoader, Optional[str]]] = {}
+		self._callbacks: List[Callable[[Optional[Exception]], None]] = []
+		#   id of a record that failed to move -> (record, path it still is at)
+		self._origins: Dict[int, Tuple[DataLoader, str]] = {}
+		self._thread: Optional[threading.Thread] = None
+
+	def put(self, records: Iterable[DataLoader], origins: Optional[Dict[int, str]]=None, 
+		callback: Optional[Callable[[Optional[Exception]], None]]=None) -> None:
+		"""Queue records to be written. They are copied, so they may be 
+		changed again right away.
+
+		Args:
+			records (Iterable[DataLoader]): The records.
+			origins (Dict[int, str]): id of a moved record -> the path it was 
+			moved from. Defaults to None.
+			callback (Callable[[Optional[Exception]], None]): Called once they 
+			are written. Defaults to None.
+		"""
+
+		if origins is None:
+			origins = {}
+		with self._cond:
+			for record in records:
+				key = id(record)
+				queued = self._pending.get(key)
+				if queued is not None:
+					origin = queued[2]
+				else:
+					origin = self._origins.pop(key, (None, None))[1] or origins.get(key)
+				self._pending[key] = (record, copy.deepcopy(record), origin)
+			if callback is not None:
+				self._callbacks.append(callback)
+
+			if self._thread is None:
+				self._thread = threading.Thread(target=self._run, daemon=True)
+				self._thread.start()
+			self._cond.notify_all()
+
+	def pending(self, path: str) -> bool:
+		"""Check if a record is waiting to be written at a path."""
+
+		with self._cond:
+			return any(snapshot.path == path 
+				for queued in (self._pending, self._writing) 
+				for _, snapshot, _ in queued.values())
+
+	def flush(self, timeout: Optional[float]=None) -> bool:
+		"""Wait until every queued record is written.
+
+		Args:
+			timeout (float): The most seconds to wait. Defaults to None.
+
+		Returns:
+			bool: Whether all of them were.
+		"""
+
+		with self._cond:
+			return self._cond.wait_for(
+				lambda: not self._pending and not self._writing, timeout)
+
+	def _run(self) -> None:
+
+		while True:
+			with self._cond:
+				self._cond.wait_for(lambda: self._pending)
+				self._writing, self._pending = self._pending, {}
+				callbacks, self._callbacks = self._callbacks, []
+
+			paths = set()
+			error = None
+			try:
+				ops = Transaction.operations(((snapshot, origin) 
+					for _, snapshot, origin in self._writing.values()), paths)
+				DataLoader.storage.apply(ops)
+			except Exception as e:
+				error = e
+
+			with self._cond:
+				#   Nothing was moved, so the next save of each record must move it
+				if error is not None:
+					for key, (record, _, origin) in self._writing.items():
+						if origin is None:
+							continue
+						queued = self._pending.get(key)
+						if queued is None:
+							self._origins[key] = (record, origin)
+						elif queued[2] is None:
+							self._pending[key] = (queued[0], queued[1], origin)
+				self._writing = {}
+				self._cond.notify_all()
+			self.done.put((paths, error, callbacks))
+
+class Members(MutableSet):
+	"""The members of a Section, a set of the IDs of records kept in the 
+	order they were added. Sections saved before records had IDs hold paths 
+	instead, which are kept until the member is added again. Members saved 
+	as [name, ID] lists are kept as they are and found by their ID, so 
+	either form can be checked or removed.
+	"""
+
+	__slots__ = ('_items',)
+
+	def __init__(self, items: Iterable[Union[str, List[str]]]=()) -> None:
+
+		#   ID -> member as it was added
+		self._items: Dict[str, Union[str, List[str]]] = {}
+		for item in items:
+			self.add(item)
+
+	@staticmethod
+	def key(item: Union[str, List[str]]) -> str:
+		"""Get the ID, or path, of a member."""
+
+		return item[1] if isinstance(item, (list, tuple)) else item
+
+	def __contains__(self, item: Union[str, List[str]]) -> bool:
+		try:
+			return self.key(item) in self._items
+		except TypeError:
+			return False
+
+	def __iter__(self) -> Iterable[Union[str, List[str]]]:
+		return iter(self._items.values())
+
+	def __len__(self) -> int:
+		return len(self._items)
+
+	def __repr__(self) -> str:
+		return f'{type(self).__name__}({list(self._items.values())!r})'
+
+	def add(self, item: Union[str, List[str]]) -> None:
+		"""Add a member, keeping its place if it is already one."""
+
+		self._items.setdefault(self.key(item), item)
+
+	def discard(self, item: Union[str, List[str]]) -> None:
+		"""Remove a member if it is one."""
+
+		self._items.pop(self.key(item), None)
+
 class Section(DataLoader):
+	__slots__ = ('name', 'grade', 'adviser', '_teachers', '_students')
+	SHARED = ('grade',)
+	#   Saved as lists under these names, as they were before Members, so 
+	#   sections saved before still load. Older builds still cannot read new 
+	#   files, since FileStorage puts a header and summary before the pickle
+	MEMBERS = ('teachers', 'students')
+
 	def __init__(self, path: str, name: str, grade: str) -> None:
 		super().__init__(path)
 
 		self.name: str = name
 		self.grade: str = grade
 		self.adviser: str = None
-		self.teachers: List[str] = []
-		self.students: List[str] = []
+		self.teachers: Members = Members()
+		self.students: Members = Members()
+
+	@property
+	def teachers(self) -> Members:
+		return self._teachers
+
+	@teachers.setter
+	def teachers(self, value: Iterable[Union[str, List[str]]]) -> None:
+		self._teachers = Members(value or ())
+
+	@property
+	def students(self) -> Members:
+		return self._students
+
+	@students.setter
+	def students(self, value: Iterable[Union[str, List[str]]]) -> None:
+		self._students = Members(value or ())
+
+	def __getstate__(self) -> Dict[str, Any]:
+
+		state = super().__getstate__()
+		for name in self.MEMBERS:
+			if '_' + name in state:
+				state[name] = list(state.pop('_' + name))
+		return state
+
+	def _members(self, value: Union['Teacher', 'Student']) -> Members:
+		"""Get the members a record would be one of."""
 
-	def add(self, value: Union['Teacher', 'Student']) -> None:
-		
 		if isinstance(value, Teacher):
-			if value.path not in self.teachers and not value.path == self.adviser.path:
-				self.teachers.append(value.path)
+			return self.teachers
 		elif isinstance(value, Student):
-			if value.path not in self.students:
-				self.students.append(value.path)
-		else:
-			raise TypeError(f'Unsupported type: {type(value)}.')
+			return self.students
+		raise TypeError(f'Unsupported type: {type(value)}.')
+
+	@staticmethod
+	def _key(members: Members, value: Union['Teacher', 'Student']) -> str:
+		"""Get what a record is a member by, its path if it was added before 
+		records had IDs and its ID otherwise."""
+
+		return value.path if value.path in members else value.uid
+
+	def add(self, value: Union['Teacher', 'Student']) -> None:
+		"""Add a teacher or student. The adviser is not added as a teacher.
+
+		Args:
+			value (Union[Teacher, Student]): The record to be added.
+		"""
+		
+		members = self._members(value)
+		if not (isinstance(value, Teacher) and self.adviser in (value.uid, value.path)):
+			members.add(self._key(members, value))
 
 	def remove(self, value: Union['Teacher', 'Student']) -> None:
+		"""Remove a teacher or student.
 
-		if isinstance(value, Teacher):
-			self.teachers.remove(value.path)
-		elif isinstance(value, Student):
-			self.students.remove(value.path)
-		else:
-			raise TypeError(f'Unsupported type: {type(value)}.')
+		Args:
+			value (Union[Teacher, Student]): The record to be removed.
+
+		Raises:
+			ValueError: If the record is not a member.
+		"""
+
+		members = self._members(value)
+		key = self._key(members, value)
+		#   Raised as the list the members used to be did
+		if key not in members:
+			raise ValueError(f'\'{value.get_full_name()}\' is not a member of the section.')
+		members.discard(key)
+
+	def add_many(self, values: Iterable[Union['Teacher', 'Student']]) -> None:
+		"""Add several teachers or students, such as a whole class, to be 
+		saved with a single dump.
+
+		Args:
+			values (Iterable[Union[Teacher, Student]]): The records to be 
+			added.
+		"""
+
+		for value in values:
+			self.add(value)
+
+	def remove_many(self, values: Iterable[Union['Teacher', 'Student']]) -> None:
+		"""Remove several teachers or students, skipping the ones that are 
+		not members.
+
+		Args:
+			values (Iterable[Union[Teacher, Student]]): The records to be 
+			removed.
+		"""
+
+		for value in values:
+			members = self._members(value)
+			members.discard(self._key(members, value))
+
+	def summary(self) -> Dict[str, Any]:
+
+		return {**super().summary(), 'name': self.name, 'grade': self.grade}
 
 	def load(self) -> 'Section':
 
@@ -156,6 +622,10 @@ class Section(DataLoader):
 		return d
 
 class Person(DataLoader):
+	__slots__ = ('_lname', '_fname', '_mname', 'pic', 'bday', 'address', 'sex', 
+		'contact_no', 'email')
+	SHARED = ('sex',)
+
 	def __init__(self, path: str, pic: str, 
 		fname: str, bday: date, address: str, 
 		sex: Literal['male', 'female'], contact_no: str=None, 
@@ -184,11 +654,11 @@ class Person(DataLoader):
 
 	@property
 	def fname(self) -> str:
-		return self.fname
+		return self._fname
 
 	@property
 	def mname(self) -> str:
-		return self.mname
+		return self._mname
 	
 	@lname.setter
 	def lname(self, value: Optional[str]) -> None:
@@ -219,6 +689,11 @@ class Person(DataLoader):
 		"""
 		return fmt.format(f=self.fname, m=self.mname, l=self.lname)
 
+	def summary(self) -> Dict[str, Any]:
+
+		return {**super().summary(), 'fname': self.fname, 'mname': self.mname, 
+			'lname': self.lname}
+
 	def load(self) -> Type['Person']:
 		
 		d: Person = super().load()
@@ -250,6 +725,9 @@ class Person(DataLoader):
 		return d
 
 class Student(Person):
+	__slots__ = ('parents', 'grade_lvl', 'lrn', 'sy', 'section')
+	SHARED = Person.SHARED + ('grade_lvl', 'section')
+
 	def __init__(self, path: str, pic: str, 
 		fname: str, bday: date, address: str, 
 		sex: Literal['male', 'female'], lrn: str, 
@@ -268,6 +746,11 @@ class Student(Person):
 		self.sy: Tuple[int, int] = sy
 		self.section: str = section
 
+	def summary(self) -> Dict[str, Any]:
+
+		return {**super().summary(), 'grade': self.grade_lvl, 'lrn': self.lrn, 
+			'section': self.section}
+
 	def load(self) -> 'Student':
 
 		d: Student = super().load()
@@ -293,6 +776,9 @@ class Student(Person):
 		return d
 
 class Teacher(Person):
+	__slots__ = ('advisory_cls', 'sections')
+	SHARED = Person.SHARED + ('advisory_cls',)
+
 	def __init__(self, path: str, pic: str, 
 		fname: str, bday: date, address: str, 
 		sex: Literal['male', 'female'], 
@@ -325,67 +811,1289 @@ class Teacher(Person):
 
 		return d
 
-class PathLoader(ABC):
-	def __init__(self, path: str) -> None:
+class Summary:
+	"""Stands in for a record in lazy loaders, holding only what is needed to 
+	list and search it. Use load() to get the whole record."""
+
+	__slots__ = ('path', 'kind', 'fname', 'mname', 'lname', 'name', 'grade', 
+		'lrn', 'section', 'uid')
+
+	def __init__(self, path: str, kind: str, fname: str=None, mname: str=None, 
+		lname: str=None, name: str=None, grade: str=None, lrn: str=None, 
+		section: str=None, uid: str=None) -> None:
+
 		self.path: str = path
-		self.items: List[Type['DataLoader']] = []
+		self.kind: str = kind
+		self.fname: str = fname
+		self.mname: str = mname
+		self.lname: str = lname
+		self.name: str = name
+		self.grade: str = grade
+		self.lrn: str = lrn
+		self.section: str = section
+		self.uid: str = uid or DataLoader.legacy_uid(path)
 
-	def get_all(self) -> List[str]:
-		return [f for f in os.listdir(self.path) if f.endswith('.pkl')]
+	def get_full_name(self, fmt: str='{f} {m} {l}') -> str:
+		"""Return the full name of the Person with a format.
+
+		Args:
+			fmt (str): The format to be used.
+		"""
+
+		if self.kind == 'Section':
+			raise AttributeError('A Section has no full name.')
+		return fmt.format(f=self.fname, m=self.mname, l=self.lname)
+
+	def profile(self) -> Dict[str, Any]:
+		"""Get the fields that can be searched, named as in the record.
+
+		Returns:
+			Dict[str, Any]: The searchable fields.
+		"""
+
+		if self.kind == 'Section':
+			return {'type': self.kind, 'uid': self.uid, 'name': self.name, 
+				'grade': self.grade}
+
+		profile = {'type': self.kind, 'uid': self.uid, 'name': self.get_full_name()}
+		if self.kind == 'Student':
+			profile.update(grade_lvl=self.grade, lrn=self.lrn, section=self.section)
+		return profile
+
+	def load(self) -> DataLoader:
+		"""Load the whole record.
+
+		Returns:
+			DataLoader: The loaded record.
+		"""
+
+		return DataLoader.construct(self.path)
+
+class Index:
+	"""An inverted index over the search profiles of records, mapping each 
+	field value, and each word of the string values, to the keys of the 
+	records holding it."""
+
+	def __init__(self) -> None:
+		#   Field -> string value -> keys
+		self.strings: Dict[str, Dict[str, Set[str]]] = {}
+		#   Field -> hashable value -> keys
+		self.values: Dict[str, Dict[Any, Set[str]]] = {}
+		#   Field -> key -> unhashable value
+		self.others: Dict[str, Dict[str, Any]] = {}
+		#   Field -> word -> keys
+		self.tokens: Dict[str, Dict[str, Set[str]]] = {}
+		#   Key -> profile it was indexed with
+		self.profiles: Dict[str, Dict[str, Any]] = {}
+
+	@staticmethod
+	def tokenize(value: str) -> Set[str]:
+		return set(value.lower().split())
+
+	@staticmethod
+	def substrings(value: str) -> Set[str]:
+		return {value[i:j] for i in range(len(value) + 1) 
+			for j in range(i, len(value) + 1)}
+
+	def add(self, key: str, record: Union['Person', 'Section']) -> None:
+		"""Index a record, replacing the one with the same key.
+
+		Args:
+			key (str): The key of the record.
+			record (Union[Person, Section]): The record to be indexed.
+		"""
+
+		self.remove(key)
+		profile = get_profile(record)
+		self.profiles[key] = profile
+
+		for field, value in profile.items():
+			if isinstance(value, str):
+				self.strings.setdefault(field, {}).setdefault(value, set()).add(key)
+				tokens = self.tokens.setdefault(field, {})
+				for token in self.tokenize(value):
+					tokens.setdefault(token, set()).add(key)
+			else:
+				try:
+					self.values.setdefault(field, {}).setdefault(value, set()).add(key)
+				except TypeError:
+					self.others.setdefault(field, {})[key] = value
+
+	def remove(self, key: str) -> None:
+		"""Remove a record from the index. Does nothing if it is not indexed.
+
+		Args:
+			key (str): The key of the record.
+		"""
+
+		profile = self.profiles.pop(key, None)
+		if profile is None:
+			return
+
+		for field, value in profile.items():
+			if isinstance(value, str):
+				self._discard(self.strings[field], value, key)
+				for token in self.tokenize(value):
+					self._discard(self.tokens[field], token, key)
+			elif key in self.others.get(field, {}):
+				del self.others[field][key]
+			else:
+				self._discard(self.values[field], value, key)
+
+	@staticmethod
+	def _discard(mapping: Dict[Any, Set[str]], value: Any, key: str) -> None:
+		keys = mapping.get(value)
+		if keys is not None:
+			keys.discard(key)
+			if not keys:
+				del mapping[value]
+
+	def match(self, filters: Dict[str, Any]) -> Set[str]:
+		"""Get the keys of the records matching every filter, with the same 
+		rules as search.
+
+		Args:
+			filters (Dict[str, Any]): The filters to be matched.
+
+		Returns:
+			Set[str]: The keys of the matching records.
+		"""
+
+		hits = set(self.profiles)
+		for field, value in filters.items():
+			hits &= self.lookup(field, value)
+			if not hits:
+				break
+		return hits
+
+	def lookup(self, field: str, value: Any) -> Set[str]:
+		"""Get the keys of the records matching a single filter.
+
+		Args:
+			field (str): The field of the filter.
+			value (Any): The value of the filter.
+
+		Returns:
+			Set[str]: The keys of the matching records.
+		"""
+
+		keys = set()
+
+		#   String fields match if they are a part of the filter value
+		strings = self.strings.get(field, {})
+		if strings:
+			if isinstance(value, str):
+				for part in self.substrings(value):
+					keys |= strings.get(part, set())
+			elif isinstance(value, (list, tuple, set, frozenset, dict)):
+				for part in value:
+					if isinstance(part, str):
+						keys |= strings.get(part, set())
+			else:
+				#   Values that cannot hold a string, such as None, match none
+				for string, string_keys in strings.items():
+					try:
+						if string in value:
+							keys |= string_keys
+					except TypeError:
+						break
+
+		#   Everything else has to be equal to it
+		values = self.values.get(field, {})
+		try:
+			keys |= values.get(value, set())
+		except TypeError:
+			for other, other_keys in values.items():
+				if other == value:
+					keys |= other_keys
+		for key, other in self.others.get(field, {}).items():
+			if other == value:
+				keys.add(key)
+
+		return keys
+
+	def find(self, field: str, text: str) -> Set[str]:
+		"""Get the keys of the records whose field contains every word of a 
+		text, ignoring case.
+
+		Args:
+			field (str): The field to be searched.
+			text (str): The words to be found.
+
+		Returns:
+			Set[str]: The keys of the matching records.
+		"""
+
+		tokens = self.tokens.get(field, {})
+		hits = None
+		for token in self.tokenize(text):
+			keys = tokens.get(token, set())
+			hits = set(keys) if hits is None else hits & keys
+			if not hits:
+				return set()
+		return hits if hits is not None else set()
+
+class NameIndex:
+	"""A prefix and trigram index over the names of records, LRNs and section 
+	names, for searching as the user types."""
+
+	def __init__(self) -> None:
+		#   Key -> text shown for the record
+		self.labels: Dict[str, str] = {}
+		#   Key -> lowercase text that is searched
+		self.texts: Dict[str, str] = {}
+		#   Three letters inside a word -> keys
+		self.trigrams: Dict[str, Set[str]] = {}
+		#   First one or two letters of a word -> keys
+		self.prefixes: Dict[str, Set[str]] = {}
+		#   Keys ordered by label, rebuilt on the first query after a change
+		self._order: Optional[List[str]] = None
+
+	@staticmethod
+	def describe(record: Union['Person', 'Section']) -> Tuple[str, str]:
+		"""Get the label and searchable text of a record.
+
+		Args:
+			record (Union[Person, Section]): The record to be described.
+
+		Returns:
+			Tuple[str, str]: The label and the text.
+		"""
+
+		if record.kind != 'Section':
+			name = ' '.join(n for n in (record.fname, record.mname, record.lname) if n)
+			terms = [name, getattr(record, 'lrn', None)]
+			label = f'{name} ({record.kind})'
+		else:
+			terms = [record.name, record.grade]
+			label = f'{record.name} ({record.grade})'
+		return label, ' '.join(str(t) for t in terms if t).lower()
+
+	@staticmethod
+	def grams(text: str) -> Tuple[Set[str], Set[str]]:
+		trigrams, prefixes = set(), set()
+		for word in text.split():
+			prefixes.update((word[:1], word[:2]))
+			trigrams.update(word[i:i + 3] for i in range(len(word) - 2))
+		return trigrams, prefixes
+
+	def add(self, key: str, record: Union['Person', 'Section']) -> None:
+		"""Index a record, replacing the one with the same key.
+
+		Args:
+			key (str): The key of the record.
+			record (Union[Person, Section]): The record to be indexed.
+		"""
+
+		self.remove(key)
+		self._order = None
+		self.labels[key], self.texts[key] = self.describe(record)
+		trigrams, prefixes = self.grams(self.texts[key])
+		for gram in trigrams:
+			self.trigrams.setdefault(gram, set()).add(key)
+		for gram in prefixes:
+			self.prefixes.setdefault(gram, set()).add(key)
+
+	def remove(self, key: str) -> None:
+		"""Remove a record from the index. Does nothing if it is not indexed.
+
+		Args:
+			key (str): The key of the record.
+		"""
+
+		text = self.texts.pop(key, None)
+		if text is None:
+			return
+		self._order = None
+		del self.labels[key]
+		trigrams, prefixes = self.grams(text)
+		for grams, mapping in ((trigrams, self.trigrams), (prefixes, self.prefixes)):
+			for gram in grams:
+				Index._discard(mapping, gram, key)
+
+	def query(self, text: str, limit: Optional[int]=None) -> List[str]:
+		"""Get the keys of the records matching a query. Every word of the 
+		query has to be a part of a word in the record, and words shorter than 
+		three letters have to start it. Case is ignored.
+
+		Args:
+			text (str): The query.
+			limit (Optional[int]): The maximum number of keys to return. 
+			Defaults to None.
+
+		Returns:
+			List[str]: The matching keys, ordered by label.
+		"""
+
+		words = text.lower().split()
+		if not words:
+			return []
+
+		#   Check the longest words first since they narrow it down the most
+		words.sort(key=len, reverse=True)
+		hits = None
+		verify = []
+		for word in words:
+			if len(word) < 3:
+				keys = self.prefixes.get(word, set())
+			else:
+				keys = None
+				for i in range(len(word) - 2):
+					gram = self.trigrams.get(word[i:i + 3], set())
+					keys = gram if keys is None else keys & gram
+					if not keys:
+						break
+				if len(word) > 3:
+					verify.append(word)
+			hits = keys if hits is None else hits & keys
+			if not hits:
+				return []
+
+		#   The trigrams of longer words could come from different places
+		if verify:
+			hits = [key for key in hits 
+				if all(word in self.texts[key] for word in verify)]
+
+		if limit is None:
+			return sorted(hits, key=self.labels.__getitem__)
+		if len(hits) < limit * 8:
+			return heapq.nsmallest(limit, hits, key=self.labels.__getitem__)
+
+		#   Broad queries match most records, so the first ones in label 
+		#   order are found quickly
+		if self._order is None:
+			self._order = sorted(self.labels, key=self.labels.__getitem__)
+		if not isinstance(hits, set):
+			hits = set(hits)
+		return list(itertools.islice((key for key in self._order if key in hits), limit))
+
+class References:
+	"""Which records exist and which records reference them, shared by the 
+	loaders of every kind so references across kinds are found. A Section 
+	references its adviser, teachers and students, a Student its section and 
+	a Teacher its advisory class and sections.
+
+	References are record IDs, or paths in records saved before records had 
+	IDs, and both are resolved to the path the record is loaded from. Lazy 
+	loaders only index what their summaries hold, which is the section of 
+	each Student.
+	"""
+
+	def __init__(self) -> None:
+		#   Path -> kind of every existing record
+		self.kinds: Dict[str, str] = {}
+		#   ID -> path, and path -> ID, of every existing record
+		self.ids: Dict[str, str] = {}
+		self.uids: Dict[str, str] = {}
+		#   Reference -> paths of the records holding it
+		self.referrers: Dict[str, Set[str]] = {}
+		#   Path -> references a record holds
+		self.targets: Dict[str, Set[str]] = {}
+
+	@staticmethod
+	def refs(record: Union['Person', 'Section', 'Summary']) -> Set[str]:
+		"""Get the references a record holds. Members saved as [name, ID] 
+		are read as their ID.
+
+		Args:
+			record (Union[Person, Section, Summary]): The record.
+
+		Returns:
+			Set[str]: The references.
+		"""
+
+		values = [getattr(record, field, None) 
+			for field in ('adviser', 'section', 'advisory_cls')]
+		for field in ('teachers', 'students', 'sections'):
+			values.extend(getattr(record, field, None) or ())
+
+		refs = set()
+		for value in values:
+			if isinstance(value, (list, tuple)) and len(value) > 1:
+				value = value[1]
+			if isinstance(value, str):
+				refs.add(value)
+		return refs
+
+	def add(self, path: str, record: Union['Person', 'Section', 'Summary']) -> None:
+		"""Mark a record as existing and index its references, replacing the 
+		ones it had.
+
+		Args:
+			path (str): The path of the record.
+			record (Union[Person, Section, Summary]): The record.
+		"""
+
+		self.remove(path)
+		self.kinds[path] = record.kind
+		self.ids[record.uid] = path
+		self.uids[path] = record.uid
+		targets = self.refs(record)
+		if targets:
+			self.targets[path] = targets
+			for target in targets:
+				self.referrers.setdefault(target, set()).add(path)
+
+	def remove(self, path: str) -> None:
+		"""Forget a record and its references. Records referencing it keep 
+		their references, so they are found again if it comes back.
+
+		Args:
+			path (str): The path of the record.
+		"""
+
+		self.kinds.pop(path, None)
+		uid = self.uids.pop(path, None)
+		if uid is not None and self.ids.get(uid) == path:
+			del self.ids[uid]
+		for target in self.targets.pop(path, ()):
+			Index._discard(self.referrers, target, path)
+
+	def resolve(self, ref: Optional[str]) -> Optional[str]:
+		"""Get the path of the record a reference is to, without touching the 
+		disk.
+
+		Args:
+			ref (str): The ID, or path, of the record.
+
+		Returns:
+			Optional[str]: The path, or None if no such record is loaded.
+		"""
+
+		path = self.ids.get(ref)
+		if path is None and ref in self.kinds:
+			path = ref
+		return path
+
+	def exists(self, ref: Optional[str]) -> bool:
+		"""Check if the record of a reference is loaded."""
+
+		return self.resolve(ref) is not None
+
+	def referencing(self, ref: str, kind: Optional[str]=None) -> Set[str]:
+		"""Get the paths of the records referencing a record, whether by its 
+		ID or its path.
+
+		Args:
+			ref (str): The ID, or path, of the record.
+			kind (str): Only get records of this kind, such as 'Section'. 
+			Defaults to None.
+
+		Returns:
+			Set[str]: The paths of the referencing records.
+		"""
+
+		path = self.resolve(ref) or ref
+		paths = set(self.referrers.get(path, ()))
+		paths.update(self.referrers.get(self.uids.get(path, ref), ()))
+		if kind is None:
+			return paths
+		return {p for p in paths if self.kinds.get(p) == kind}
+
+	def prune(self, items: Iterable[Union[str, List[str]]]) -> List[Union[str, List[str]]]:
+		"""Drop the references to records that do not exist.
+
+		Args:
+			items (Iterable[Union[str, List[str]]]): References, or 
+			[name, reference] lists.
+
+		Returns:
+			List[Union[str, List[str]]]: The items of existing records.
+		"""
+
+		return [item for item in items if self.exists(Members.key(item))]
+
+class Predicate(ABC):
+	"""A condition on the search profiles of records, see get_profile, built 
+	once and then checked against any number of them. Predicates are 
+	combined with & (And), | (Or) and ~ (Not).
+
+	A field missing from a profile never matches, so a Not of it does.
+	"""
+
+	def __and__(self, other: 'Predicate') -> 'And':
+		return And(self, other)
+
+	def __or__(self, other: 'Predicate') -> 'Or':
+		return Or(self, other)
+
+	def __invert__(self) -> 'Not':
+		return Not(self)
 
 	@abstractmethod
-	def load(self) -> None:
-		self.items.clear()
-		for path in self.get_all():
-			self.items.append(DataLoader.construct(os.path.join(self.path, path)))
+	def matches(self, profile: Dict[str, Any]) -> bool:
+		"""Check a profile against the predicate."""
 
-class SectionLoader(PathLoader):
-	def load(self) -> None:
-		self.items.clear()
-		for path in self.get_all():
-			self.items.append(Section.construct(os.path.join(self.path, path)))
+	def keys(self, index: Index) -> Optional[Set[str]]:
+		"""Get the keys of the records matching the predicate from an index, 
+		or None if the index cannot answer it.
 
-class StudentLoader(PathLoader):
-	def load(self) -> None:
-		self.items.clear()
-		for path in self.get_all():
-			self.items.append(Student.construct(os.path.join(self.path, path)))
+		Args:
+			index (Index): The index of the records.
 
-class TeacherLoader(PathLoader):
-	def load(self) -> None:
-		self.items.clear()
-		for path in self.get_all():
-			self.items.append(Teacher.construct(os.path.join(self.path, path)))
+		Returns:
+			Optional[Set[str]]: The keys of every matching record.
+		"""
 
-def search(profiles: List[Union[Person, Section]], filters: Dict[str, Any]) -> List[Dict[str, Any]]:
-	
-	results = []
+		return None
+
+	def select(self, index: Index) -> Set[str]:
+		"""Get the keys of the records in an index matching the predicate, 
+		checking their profiles one by one only if the index cannot answer it.
+		"""
 
-	for p in profiles:
-		profile = {key: value for key, value in p.__dict__.items() if not key.startswith('_')}
-		profile['type'] = type(p).__name__
+		keys = self.keys(index)
+		if keys is None:
+			keys = {key for key, profile in index.profiles.items() if self.matches(profile)}
+		return keys
 
+class Field(Predicate):
+	"""A predicate on the value of a single field. It is answered by an 
+	index by checking each distinct value of the field once instead of each 
+	record."""
+
+	def __init__(self, field: str) -> None:
+		self.field = field
+
+	@abstractmethod
+	def test(self, value: Any) -> bool:
+		"""Check the value of the field, which is never missing."""
+
+	def matches(self, profile: Dict[str, Any]) -> bool:
 		try:
-			profile['name'] = p.get_full_name()
-			profile.pop('fname')
-			profile.pop('mname')
-			profile.pop('lname')
-		except AttributeError:
+			return self.test(profile[self.field])
+		except KeyError:
+			return False
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+
+		keys = set()
+		for mapping in (index.strings.get(self.field, {}), index.values.get(self.field, {})):
+			for value, value_keys in mapping.items():
+				if self.test(value):
+					keys |= value_keys
+		for key, value in index.others.get(self.field, {}).items():
+			if self.test(value):
+				keys.add(key)
+		return keys
+
+class Eq(Field):
+	"""The field is equal to a value, ignoring the case of strings if asked.
+	"""
+
+	def __init__(self, field: str, value: Any, ignore_case: bool=False) -> None:
+		"""
+		Args:
+			field (str): The field.
+			value (Any): The value.
+			ignore_case (bool): Compare strings ignoring case. Defaults to 
+			False.
+		"""
+
+		super().__init__(field)
+		self.ignore_case = ignore_case and isinstance(value, str)
+		self.value = value.casefold() if self.ignore_case else value
+
+	def test(self, value: Any) -> bool:
+
+		if self.ignore_case:
+			return isinstance(value, str) and value.casefold() == self.value
+		try:
+			return value == self.value
+		except TypeError:
+			return False
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+
+		if self.ignore_case:
+			return super().keys(index)
+
+		#   Looked up directly, unless the value cannot be a dict key
+		try:
+			keys = set(index.strings.get(self.field, {}).get(self.value, ()))
+			keys |= index.values.get(self.field, {}).get(self.value, set())
+		except TypeError:
+			return super().keys(index)
+		for key, value in index.others.get(self.field, {}).items():
+			if self.test(value):
+				keys.add(key)
+		return keys
+
+class In(Field):
+	"""The field is one of several values, ignoring the case of strings if 
+	asked."""
+
+	def __init__(self, field: str, values: Iterable[Any], ignore_case: bool=False) -> None:
+		"""
+		Args:
+			field (str): The field.
+			values (Iterable[Any]): The values. Unhashable ones are compared 
+			one by one.
+			ignore_case (bool): Compare strings ignoring case. Defaults to 
+			False.
+		"""
+
+		super().__init__(field)
+		self.ignore_case = ignore_case
+		self.values: Set[Any] = set()
+		self.others: List[Any] = []
+		for value in values:
+			if ignore_case and isinstance(value, str):
+				value = value.casefold()
+			try:
+				self.values.add(value)
+			except TypeError:
+				self.others.append(value)
+
+	def test(self, value: Any) -> bool:
+
+		if self.ignore_case and isinstance(value, str):
+			value = value.casefold()
+		try:
+			if value in self.values:
+				return True
+		except TypeError:
 			pass
+		return any(value == other for other in self.others)
 
+class Range(Field):
+	"""The field is between two values, both included. Numbers saved as 
+	strings are compared as numbers, and a pair such as a school year is 
+	compared by its first value, so ranges work on bday and sy. Values that 
+	cannot be compared with the bounds never match.
+	"""
+
+	def __init__(self, field: str, low: Any=None, high: Any=None) -> None:
+		"""
+		Args:
+			field (str): The field.
+			low (Any): The lowest value, such as a date for bday or a year 
+			for sy. No limit if None.
+			high (Any): The highest value. No limit if None.
+		"""
+
+		super().__init__(field)
+		self.low = self.scalar(low)
+		self.high = self.scalar(high)
+
+	@staticmethod
+	def scalar(value: Any) -> Any:
+		"""Get what a value is compared by."""
+
+		if isinstance(value, (list, tuple)):
+			value = value[0] if value else None
+		if isinstance(value, str):
+			try:
+				return int(value)
+			except ValueError:
+				return value
+		return value
+
+	def test(self, value: Any) -> bool:
+
+		value = self.scalar(value)
+		if value is None:
+			return False
 		try:
-			checks = []
+			return (self.low is None or self.low <= value) and \
+				(self.high is None or value <= self.high)
+		except TypeError:
+			return False
+
+class Prefix(Field):
+	"""The field is a string starting with a prefix, ignoring case if asked.
+	"""
+
+	def __init__(self, field: str, prefix: str, ignore_case: bool=False) -> None:
+		"""
+		Args:
+			field (str): The field.
+			prefix (str): The prefix.
+			ignore_case (bool): Ignore the case of the field and the prefix. 
+			Defaults to False.
+		"""
+
+		super().__init__(field)
+		self.ignore_case = ignore_case
+		self.prefix = prefix.casefold() if ignore_case else prefix
+
+	def test(self, value: Any) -> bool:
+
+		if not isinstance(value, str):
+			return False
+		if self.ignore_case:
+			value = value.casefold()
+		return value.startswith(self.prefix)
+
+class Within(Field):
+	"""The matching rule of search: a string field matches if it is a part 
+	of the value, and any other field if it is equal to it."""
+
+	def __init__(self, field: str, value: Any) -> None:
+		super().__init__(field)
+		self.value = value
 
-			for key, value in filters.items():
-				if isinstance(profile[key], str):
-					checks.append(profile[key] in value)
+	def test(self, value: Any) -> bool:
+
+		try:
+			if isinstance(value, str):
+				return value in self.value
+			return value == self.value
+		except TypeError:
+			return False
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+		return index.lookup(self.field, self.value)
+
+class And(Predicate):
+	"""Every predicate matches."""
+
+	def __init__(self, *predicates: Predicate) -> None:
+		self.predicates: List[Predicate] = []
+		for predicate in predicates:
+			#   Flattened so the index answers as many of them as it can
+			if isinstance(predicate, And):
+				self.predicates.extend(predicate.predicates)
+			else:
+				self.predicates.append(predicate)
+
+	def matches(self, profile: Dict[str, Any]) -> bool:
+		return all(predicate.matches(profile) for predicate in self.predicates)
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+
+		keys = None
+		rest = []
+		for predicate in self.predicates:
+			found = predicate.keys(index) if keys is None or keys else set()
+			if found is None:
+				rest.append(predicate)
+			else:
+				keys = found if keys is None else keys & found
+		if keys is None:
+			return None if self.predicates else set(index.profiles)
+
+		#   The ones the index cannot answer are only checked on what is left
+		if rest:
+			keys = {key for key in keys if all(
+				predicate.matches(index.profiles[key]) for predicate in rest)}
+		return keys
+
+class Or(Predicate):
+	"""Any predicate matches."""
+
+	def __init__(self, *predicates: Predicate) -> None:
+		self.predicates: List[Predicate] = []
+		for predicate in predicates:
+			if isinstance(predicate, Or):
+				self.predicates.extend(predicate.predicates)
+			else:
+				self.predicates.append(predicate)
+
+	def matches(self, profile: Dict[str, Any]) -> bool:
+		return any(predicate.matches(profile) for predicate in self.predicates)
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+
+		keys = set()
+		for predicate in self.predicates:
+			found = predicate.keys(index)
+			if found is None:
+				return None
+			keys |= found
+		return keys
+
+class Not(Predicate):
+	"""The predicate does not match."""
+
+	def __init__(self, predicate: Predicate) -> None:
+		self.predicate = predicate
+
+	def matches(self, profile: Dict[str, Any]) -> bool:
+		return not self.predicate.matches(profile)
+
+	def keys(self, index: Index) -> Optional[Set[str]]:
+
+		keys = self.predicate.keys(index)
+		if keys is None:
+			return None
+		return index.profiles.keys() - keys
+
+def compile_filters(filters: Union[Dict[str, Any], Predicate]) -> Predicate:
+	"""Compile the filters of search into a predicate. Filters that are 
+	already predicates are kept, so they can be mixed with the field: value 
+	filters.
+
+	Args:
+		filters (Union[Dict[str, Any], Predicate]): The filters, or a 
+		predicate.
+
+	Returns:
+		Predicate: The predicate matching every filter.
+	"""
+
+	if isinstance(filters, Predicate):
+		return filters
+	return And(*(value if isinstance(value, Predicate) else Within(field, value) 
+		for field, value in filters.items()))
+
+class PathLoader(ABC):
+	record: Type[DataLoader] = DataLoader
+
+	def __init__(self, path: str, workers: int=0, processes: bool=False, 
+		lazy: bool=False, references: Optional[References]=None) -> None:
+		"""
+		Args:
+			path (str): The directory of the records.
+			workers (int): The number of workers used to read the records in 
+			parallel. Reads them one at a time if less than 2. Defaults to 0.
+			processes (bool): Unpickle the records in worker processes 
+			instead of threads, for when unpickling costs more than reading. 
+			Defaults to False.
+			lazy (bool): Only read the Summary of each record, loading the 
+			whole record through get(). Defaults to False.
+			references (References): Where the records and their references 
+			are indexed, shared with the loaders of the other kinds. A new 
+			one if None.
+		"""
+
+		self.path: str = path
+		self.items: List[Union[DataLoader, Summary]] = []
+		self.workers: int = workers
+		self.processes: bool = processes
+		self.lazy: bool = lazy
+		#   Path -> error of every record the last load() failed to read
+		self.errors: Dict[str, Exception] = {}
+		self.index: Index = Index()
+		self.names: NameIndex = NameIndex()
+		self.references: References = references if references is not None else References()
+		#   ID -> item of every record, for resolving references
+		self.ids: Dict[str, Union[DataLoader, Summary]] = {}
+
+		#   Path -> (mtime, size) of every file the last load() saw
+		self._manifest: Dict[str, Tuple[int, int]] = {}
+		self._records: Dict[str, Type['DataLoader']] = {}
+
+	def get_all(self) -> List[str]:
+		return [os.path.basename(path) for path in self.scan()]
+
+	def scan(self) -> Dict[str, Tuple[int, int]]:
+		"""Get the signature of every record in the directory without 
+		reading it.
+
+		Returns:
+			Dict[str, Tuple[int, int]]: The mtime and size of each record, 
+			keyed by path.
+		"""
+
+		return self.record.storage.scan(self.path)
+
+	def load(self) -> None:
+		"""Bring the items up to date with the directory.
+
+		Only the records that were added or changed since the last load are 
+		read again, and the ones that were removed are dropped. Records that 
+		fail to load are left out of the items and reported in errors.
+		"""
+
+		manifest, changed = self.changes()
+		self.errors = {}
+		self.merge(zip(changed, self.construct_all(changed)))
+		self.finish(manifest)
+
+	def changes(self) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+		"""Scan the directory for the records that were added or changed 
+		since the last load. Nothing is changed, so this may run off the Tk 
+		thread, followed by construct_all, merge and finish on it.
+
+		Returns:
+			Tuple[Dict[str, Tuple[int, int]], List[str]]: The new manifest and 
+			the paths of the changed records.
+		"""
+
+		manifest = self.scan()
+		changed = [path for path, signature in manifest.items() 
+			if self._manifest.get(path) != signature or path not in self._records]
+		return manifest, changed
+
+	def refresh(self, paths: Iterable[str]) -> None:
+		"""Bring only some records up to date, without scanning the whole 
+		directory. Paths outside the directory are ignored.
+
+		Args:
+			paths (Iterable[str]): The paths of the records.
+		"""
+
+		manifest = dict(self._manifest)
+		changed = []
+		for path in paths:
+			if os.path.dirname(path) != self.path:
+				continue
+			signature = self.record.storage.signature(path)
+			if signature is None:
+				manifest.pop(path, None)
+			elif manifest.get(path) != signature or path not in self._records:
+				manifest[path] = signature
+				changed.append(path)
+
+		self.errors = {}
+		self.merge(zip(changed, self.construct_all(changed)))
+		self.finish(dict(sorted(manifest.items())))
+
+	def merge(self, results: Iterable[Tuple[str, Any]]) -> None:
+		"""Index constructed records, as returned by construct_all, and add 
+		the new ones to the end of the items so they show before finish.
+
+		Args:
+			results (Iterable[Tuple[str, Any]]): The paths of the records and 
+			the records, or the exceptions raised constructing them.
+		"""
+
+		for path, result in results:
+			if isinstance(result, Exception):
+				self.errors[path] = result
+				self._forget(path)
+				continue
+			old = self._records.get(path)
+			if old is not None and self.ids.get(old.uid) is old:
+				del self.ids[old.uid]
+			self._records[path] = result
+			self.ids[result.uid] = result
+			self.index.add(path, result)
+			self.names.add(path, result)
+			self.references.add(path, result)
+			if old is None:
+				self.items.append(result)
+
+	def finish(self, manifest: Dict[str, Tuple[int, int]]) -> None:
+		"""Drop the records missing from a manifest and put the items in its 
+		order. Records that failed to load are left out of it so they are 
+		retried.
+
+		Args:
+			manifest (Dict[str, Tuple[int, int]]): The manifest, as returned 
+			by changes.
+		"""
+
+		for path in self._manifest.keys() - manifest.keys():
+			self._forget(path)
+		for path in self.errors:
+			manifest.pop(path, None)
+
+		self._manifest = manifest
+		self.items[:] = [self._records[path] for path in manifest if path in self._records]
+
+	def _forget(self, path: str) -> None:
+
+		record = self._records.pop(path, None)
+		if record is not None and self.ids.get(record.uid) is record:
+			del self.ids[record.uid]
+		self.index.remove(path)
+		self.names.remove(path)
+		self.references.remove(path)
+
+	def search(self, filters: Dict[str, Any]) -> List[Type['DataLoader']]:
+		"""Search the items using the index. See search.
+
+		Args:
+			filters (Dict[str, Any]): The filters to be matched.
+
+		Returns:
+			List[DataLoader]: The matching items.
+		"""
+
+		return search(self.items, filters, self.index)
+
+	def query(self, where: Union[Dict[str, Any], Predicate], 
+		order_by: Optional[Union[str, Callable[[Dict[str, Any]], Any]]]=None, 
+		reverse: bool=False, limit: Optional[int]=None
+		) -> List[Union[DataLoader, Summary]]:
+		"""Get the items matching a query, using the index as far as it can 
+		answer it. Lazy loaders only know the fields of their summaries.
+
+		Args:
+			where (Union[Dict[str, Any], Predicate]): The predicate, or 
+			filters as given to search.
+			order_by (Union[str, Callable[[Dict[str, Any]], Any]]): The field 
+			the items are sorted by, missing ones last, or a function getting 
+			what to sort by from the profile. In the order of the items if 
+			None. Defaults to None.
+			reverse (bool): Sort from the largest. Defaults to False.
+			limit (int): The maximum number of items to return. Defaults to 
+			None.
+
+		Returns:
+			List[Union[DataLoader, Summary]]: The matching items.
+		"""
+
+		keys = compile_filters(where).select(self.index)
+
+		if order_by is None:
+			hits = (item for item in (reversed(self.items) if reverse else self.items) 
+				if item.path in keys)
+			return list(itertools.islice(hits, limit))
+
+		profiles = self.index.profiles
+		#   Ties are broken by path so the order is always the same
+		if callable(order_by):
+			sort_key = lambda key: (order_by(profiles[key]), key)
+		else:
+			def sort_key(key: str) -> Tuple[bool, str, Any, str]:
+				value = Range.scalar(profiles[key].get(order_by))
+				#   Missing values go last either way, and values that cannot be 
+				#   compared, such as a legacy str LRN among int ones, are 
+				#   grouped by type first
+				kind = 'number' if isinstance(value, (int, float)) else type(value).__name__
+				return (value is None) != reverse, kind, value, key
+
+		if limit is None:
+			ordered = sorted(keys, key=sort_key, reverse=reverse)
+		elif reverse:
+			ordered = heapq.nlargest(limit, keys, key=sort_key)
+		else:
+			ordered = heapq.nsmallest(limit, keys, key=sort_key)
+		return [self._records[key] for key in ordered]
+
+	def get(self, item: Union[DataLoader, Summary]) -> DataLoader:
+		"""Get the whole record of an item, loading it if the loader is lazy.
+
+		Args:
+			item (Union[DataLoader, Summary]): The item.
+
+		Returns:
+			DataLoader: The record.
+		"""
+
+		if isinstance(item, Summary):
+			return item.load()
+		return item
+
+	def resolve(self, ref: Optional[str]) -> Optional[Union[DataLoader, Summary]]:
+		"""Get the item a reference is to, without touching the disk.
+
+		Args:
+			ref (str): The ID of the record, or its path if it was referenced 
+			before records had IDs.
+
+		Returns:
+			Optional[Union[DataLoader, Summary]]: The item, or None if it is 
+			not loaded.
+		"""
+
+		item = self.ids.get(ref)
+		if item is None:
+			item = self._records.get(ref)
+		return item
+
+	def relink(self, record: Union['Person', 'Section'], 
+		old: Optional[str]=None) -> Dict[str, List[str]]:
+		"""Bring the records of this loader that reference a record up to date 
+		after it was saved, such as after a rename, so they reference it by 
+		its ID only. References to its old path, and [name, reference] members 
+		of it, are replaced by its ID.
+
+		The records are found through the references rather than a scan of 
+		the items, and copies of them are dumped in one Transaction, joining 
+		the current one if there is one. The items are left as they are until 
+		the save is written and the loader is refreshed, so a failed save 
+		leaves them as they are on disk.
+
+		Args:
+			record (Union[Person, Section]): The saved record.
+			old (str): The path the record had. Defaults to the path it was 
+			moved from in the current Transaction, if any.
+
+		Returns:
+			Dict[str, List[str]]: The fields changed in each updated record, 
+			keyed by its path.
+		"""
+
+		transaction = Transaction.current()
+		if old is None and transaction is not None:
+			old = transaction.origin(record)
+		refs = {ref for ref in (record.uid, record.path, old) if ref is not None}
+
+		paths = set()
+		for ref in refs:
+			paths |= self.references.referencing(ref, self.record.__name__)
+
+		report = {}
+		with Transaction():
+			for path in sorted(paths):
+				item = self._records.get(path)
+				if item is None:
+					continue
+				target = copy.deepcopy(self.get(item))
+
+				changed = []
+				for field in ('adviser', 'section', 'advisory_cls'):
+					if getattr(target, field, None) in refs - {record.uid}:
+						setattr(target, field, record.uid)
+						changed.append(field)
+				for field in ('teachers', 'students', 'sections'):
+					members = getattr(target, field, None) or ()
+					relinked = [self._relink(member, refs, record.uid) for member in members]
+					if any(a is not b for a, b in zip(relinked, members)):
+						setattr(target, field, relinked)
+						changed.append(field)
+
+				if changed:
+					target.dump()
+					report[path] = changed
+		return report
+
+	@staticmethod
+	def _relink(member: Union[str, List[str]], refs: Set[str], 
+		uid: str) -> Union[str, List[str]]:
+		"""Get a reference, or [name, reference] member, as it should be after 
+		relinking, or itself if it is not to the relinked record or is already 
+		its ID."""
+
+		if isinstance(member, (list, tuple)):
+			if len(member) > 1 and member[1] in refs:
+				return uid
+		elif member in refs and member != uid:
+			return uid
+		return member
+
+	def find(self, text: str, limit: Optional[int]=None) -> List[Type['DataLoader']]:
+		"""Find the items whose names match a query. See NameIndex.query.
+
+		Args:
+			text (str): The query.
+			limit (Optional[int]): The maximum number of items to return. 
+			Defaults to None.
+
+		Returns:
+			List[DataLoader]: The matching items, ordered by label.
+		"""
+
+		return [self._records[key] for key in self.names.query(text, limit)]
+
+	def construct_all(self, paths: List[str]) -> List[Union[DataLoader, Exception]]:
+		"""Construct the records of several paths, in parallel if workers is 
+		set.
+
+		Args:
+			paths (List[str]): The paths of the records.
+
+		Returns:
+			List[Union[DataLoader, Exception]]: The record, or the error 
+			raised while constructing it, of each path in the same order.
+		"""
+
+		construct = self._summarize if self.lazy else self._construct
+
+		if self.workers < 2 or len(paths) < 2:
+			return [construct(path) for path in paths]
+
+		with ThreadPoolExecutor(self.workers) as pool:
+			if self.lazy or not self.processes:
+				return list(pool.map(construct, paths))
+			blobs = list(pool.map(self._read, paths))
+
+		#   Imported here as it pulls in multiprocessing
+		from concurrent.futures import ProcessPoolExecutor
+
+		results = []
+		with ProcessPoolExecutor(self.workers) as pool:
+			futures = [blob if isinstance(blob, Exception) else 
+				pool.submit(self.record.constructs, blob) for blob in blobs]
+			for future in futures:
+				if isinstance(future, Exception):
+					results.append(future)
+				elif future.exception() is not None:
+					results.append(future.exception())
 				else:
-					checks.append(profile[key] == value)
-			
-			if all(checks):
-				results.append(p)
+					results.append(future.result())
+		return results
 
-		except KeyError:
-			continue
+	def _construct(self, path: str) -> Union[DataLoader, Exception]:
+		try:
+			return self.record.construct(path)
+		except Exception as e:
+			return e
+
+	def _summarize(self, path: str) -> Union[Summary, Exception]:
+		try:
+			return Summary(path, **self.record.storage.read_summary(path))
+		except Exception as e:
+			return e
+
+	def _read(self, path: str) -> Union[bytes, Exception]:
+		try:
+			return self.record.storage.read(path)
+		except Exception as e:
+			return e
+
+	def invalidate(self) -> None:
+		"""Forget the manifest so the next load reads every record again.
+		"""
+
+		for path in self._records:
+			self.references.remove(path)
+		self._manifest.clear()
+		self._records.clear()
+		self.ids.clear()
+		self.index = Index()
+		self.names = NameIndex()
+
+class SectionLoader(PathLoader):
+	record = Section
 
-	return results
+class StudentLoader(PathLoader):
+	record = Student
+
+class TeacherLoader(PathLoader):
+	record = Teacher
+
+def get_profile(p: Union[Person, Section]) -> Dict[str, Any]:
+	"""Get the fields of a record that can be searched.
+
+	Args:
+		p (Union[Person, Section]): The record.
+
+	Returns:
+		Dict[str, Any]: The public fields of the record, plus its type and, 
+		for a Person, the full name.
+	"""
+
+	if isinstance(p, Summary):
+		return p.profile()
+
+	profile = {key: value for key, value in p.__getstate__().items() if not key.startswith('_')}
+	profile['type'] = type(p).__name__
+
+	try:
+		profile['name'] = p.get_full_name()
+		profile.pop('fname', None)
+		profile.pop('mname', None)
+		profile.pop('lname', None)
+	except AttributeError:
+		pass
+
+	return profile
+
+def search(profiles: List[Union[Person, Section]], 
+	filters: Union[Dict[str, Any], Predicate], index: Optional[Index]=None) -> List[Union[Person, Section]]:
+	"""Search the records matching every filter. String fields match if they 
+	are a part of the filter value, other fields if they are equal to it. 
+	Records without one of the filtered fields never match. The filters are 
+	compiled once, see compile_filters, and may also be predicates.
+
+	Args:
+		profiles (List[Union[Person, Section]]): The records to be searched.
+		filters (Union[Dict[str, Any], Predicate]): The filters to be matched.
+		index (Optional[Index]): An index of the records keyed by path, used 
+		instead of checking them one by one. Defaults to None.
+
+	Returns:
+		List[Union[Person, Section]]: The matching records, in order.
+	"""
+
+	predicate = compile_filters(filters)
+	if index is not None:
+		hits = predicate.select(index)
+		return [p for p in profiles if p.path in hits]
+
+	return [p for p in profiles if predicate.matches(get_profile(p))]
@@ -1,16 +1,17 @@
 #   Handles how the app looks
 
 #   Libraries
+import functools
+import operator
 import os
 import tkinter as tk
 from abc import ABC, abstractmethod
+from datetime import date
 from tkinter import filedialog
+from tkinter import font as tkfont
 from tkinter import messagebox as msgbox
 from tkinter import ttk
-from typing import Any, Dict, List, Tuple, Union
-
-from PIL import Image, ImageTk
-from tkcalendar import DateEntry
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import constants
 import data
@@ -39,8 +40,76 @@ class Page(ABC, tk.Frame):
 	@abstractmethod
 	def reload_page(self, event=None) -> None:
 		pass
-	
+
+	@staticmethod
+	def set_field(widget: tk.Widget, value: Any) -> None:
+		"""Show a value in an entry, combobox or date entry, even while it is 
+		locked.
+
+		Args:
+			widget (tk.Widget): The widget.
+			value (Any): The value, cleared if None.
+		"""
+
+		state = str(widget.cget('state'))
+		widget.config(state='normal')
+		if isinstance(value, date) and hasattr(widget, 'set_date'):
+			widget.set_date(value)
+		else:
+			widget.delete(0, 'end')
+			if value is not None:
+				widget.insert(0, str(value))
+		widget.config(state=state)
+
+	@staticmethod
+	def reference(item: Union[str, List[str]], loader: data.PathLoader) -> List[str]:
+		"""Get a reference as the [name, ID] the lists show. Only the ID is 
+		saved, so the name is always the current one, but older records may 
+		hold [name, ID] lists or paths.
+
+		Args:
+			item (Union[str, List[str]]): The reference.
+			loader (data.PathLoader): The loader of the referenced records.
+
+		Returns:
+			List[str]: The name and the reference.
+		"""
+
+		if isinstance(item, (list, tuple)):
+			item = item[1]
+		record = loader.resolve(item)
+		if record is None:
+			return [os.path.basename(item), item]
+		return [loader.names.labels.get(record.path, os.path.basename(item)), item]
+
+	def show_relinked(self, relinked: Dict[str, List[str]]) -> None:
+		"""Tell which records a save brought up to date, as reported by 
+		data.PathLoader.relink.
+
+		Args:
+			relinked (Dict[str, List[str]]): The fields changed in each record, 
+			keyed by its path.
+		"""
+
+		if not relinked:
+			return
+		lines = []
+		for path, fields in relinked.items():
+			label = os.path.splitext(os.path.basename(path))[0]
+			for loader in (self.master.studentloader, self.master.teacherloader, 
+				self.master.sectionloader):
+				if path in loader.names.labels:
+					label = loader.names.labels[path]
+					break
+			lines.append(f'{label}: {", ".join(fields)}')
+		msgbox.showinfo(constants.TITLE, 
+			'The references in these records were updated:\n' + '\n'.join(lines))
+
 class HomePage(Page):
+	#	Milliseconds to wait after a keystroke before searching
+	SEARCH_DELAY = 150
+	SEARCH_LIMIT = 200
+
 	def __init__(self, master: tk.Widget) -> None:
 		super().__init__(master=master)
 
@@ -52,18 +121,18 @@ class HomePage(Page):
 
 		self.top_search_frm = tk.Frame(master=self.inner_l_frm)
 		self.search_bar_lbl = tk.Label(master=self.top_search_frm, text='Search:')
-		self.search_bar = tk.Entry(master=self.top_search_frm, relief='groove', bd=2)
+		self.search_var = tk.StringVar(master=self)
+		self.search_bar = tk.Entry(master=self.top_search_frm, relief='groove', bd=2, 
+			textvariable=self.search_var)
 		self.search_bar_lbl.pack(side='left')
 		self.search_bar.pack(expand=True, fill='x', side='right')
 		self.top_search_frm.pack(fill='x', padx=20, pady=(20, 6))
 
 		self.bottom_search_frm = tk.Frame(master=self.inner_l_frm)
 		self.list_scrollbar = tk.Scrollbar(master=self.bottom_search_frm)
-		self.list = tk.Listbox(master=self.bottom_search_frm, yscrollcommand=self.list_scrollbar.set, 
+		self.list = VirtualList(master=self.bottom_search_frm, yscrollcommand=self.list_scrollbar.set, 
 			relief='groove', bd=2)
 		self.list_scrollbar.config(command=self.list.yview)
-		for i in range(1, 101):
-			self.list.insert(tk.END, f'Keon Clone {i}')
 		self.list_scrollbar.pack(fill='y', side='right')
 		self.list.pack(expand=True, fill='both', side='left')
 		self.bottom_search_frm.pack(expand=True, fill='both', padx=20, pady=(6, 20))
@@ -95,51 +164,64 @@ class HomePage(Page):
 		self.inner_r_frm.pack(expand=True, fill='x', padx=(10, 30))
 		self.r_frm.pack(expand=True, fill='both', side='right')
 		
-		self.search_bar_tt = Tooltip(self.search_bar, text='Search Bar', 
-			font=('Bahnschrift Light', 10))
-		self.new_btn_tt = Tooltip(self.new_btn, text='Create a New Profile', 
-			font=('Bahnschrift Light', 10))
-		self.open_btn_tt = Tooltip(self.open_btn, text='Access a Profile', 
-			font=('Bahnschrift Light', 10))
-		self.open_recent_btn_tt = Tooltip(self.open_recent_btn, text='Open a recently-accessed profile.', 
-			font=('Bahnschrift Light', 10))
-		self.more_btn_tt = Tooltip(self.more_btn, text='More Actions...', 
-			font=('Bahnschrift Light', 10))
-		self.exit_btn_tt = Tooltip(self.exit_btn, text='Exit SDS', 
-			font=('Bahnschrift Light', 10))
+		self.search_bar_tt = Tooltip(self.search_bar, text='Search Bar')
+		self.new_btn_tt = Tooltip(self.new_btn, text='Create a New Profile')
+		self.open_btn_tt = Tooltip(self.open_btn, text='Access a Profile')
+		self.open_recent_btn_tt = Tooltip(self.open_recent_btn, text='Open a recently-accessed profile.')
+		self.more_btn_tt = Tooltip(self.more_btn, text='More Actions...')
+		self.exit_btn_tt = Tooltip(self.exit_btn, text='Exit SDS')
 
 		self.dynresize = DynamicResize(self)
-		self.dynresize.add_child(self.title, 'Bahnschrift', 36, 40, 10)
-		self.dynresize.add_child(self.search_bar_lbl, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.search_bar, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.list, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.new_btn, 'Bahnschrift Light', 14, 18, 6)
-		self.dynresize.add_child(self.open_btn, 'Bahnschrift Light', 14, 18, 6)
-		self.dynresize.add_child(self.open_recent_btn, 'Bahnschrift Light', 14, 18, 6)
-		self.dynresize.add_child(self.more_btn, 'Bahnschrift Light', 14, 18, 6)
-		self.dynresize.add_child(self.exit_btn, 'Bahnschrift Light', 14, 18, 6)
+		self.dynresize.add_child(self.title, 'heading', 36, 40, 10)
+		self.dynresize.add_child(self.search_bar_lbl, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.search_bar, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.list, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.new_btn, 'body', 14, 18, 6)
+		self.dynresize.add_child(self.open_btn, 'body', 14, 18, 6)
+		self.dynresize.add_child(self.open_recent_btn, 'body', 14, 18, 6)
+		self.dynresize.add_child(self.more_btn, 'body', 14, 18, 6)
+		self.dynresize.add_child(self.exit_btn, 'body', 14, 18, 6)
+
+		#	Search as you type
+		self.results: List[data.DataLoader] = []
+		self._search_id = None
+		self.search_var.trace_add('write', self.schedule_search)
 
 		self.reload_page()
 
 	def reload_page(self, event=None) -> None:
-		
-		#	TODO: Work on themes for customizable look
-		self.title.config(font=('Bahnschrift', 36))
-		self.search_bar_lbl.config(font=('Bahnschrift Light', 16))
-		self.search_bar.config(font=('Bahnschrift Light', 16))
-		self.list.config(font=('Bahnschrift Light', 16))
-		self.new_btn.config(font=('Bahnschrift Light', 14))
-		self.open_btn.config(font=('Bahnschrift Light', 14))
-		self.open_recent_btn.config(font=('Bahnschrift Light', 14))
-		self.more_btn.config(font=('Bahnschrift Light', 14))
-		self.exit_btn.config(font=('Bahnschrift Light', 14))
-
-		self.search_bar_tt.font = ('Bahnschrift Light', 10)
-		self.new_btn_tt.font = ('Bahnschrift Light', 10)
-		self.open_btn_tt.font = ('Bahnschrift Light', 10)
-		self.open_recent_btn_tt.font = ('Bahnschrift Light', 10)
-		self.more_btn_tt.font = ('Bahnschrift Light', 10)
-		self.exit_btn_tt.font = ('Bahnschrift Light', 10)
+
+		self.search()
+
+	def schedule_search(self, *args) -> None:
+		"""Search once the user stops typing, dropping any search still 
+		waiting from an earlier keystroke."""
+
+		if self._search_id is not None:
+			self.after_cancel(self._search_id)
+		self._search_id = self.after(self.SEARCH_DELAY, self.search)
+
+	def search(self, event=None) -> None:
+		"""Fill the list with the profiles matching the search bar."""
+
+		self._search_id = None
+		query = self.search_var.get()
+
+		results = []
+		for loader in (self.master.studentloader, self.master.teacherloader, 
+			self.master.sectionloader):
+			results.extend((loader.names.labels[item.path], item) 
+				for item in loader.find(query, self.SEARCH_LIMIT))
+		results.sort(key=lambda result: result[0])
+		del results[self.SEARCH_LIMIT:]
+
+		self.results = [item for _, item in results]
+		if results:
+			self.list.set_rows(MappedRows(results, operator.itemgetter(0)))
+		elif self.master.loading:
+			self.list.set_rows(['Loading records...'])
+		else:
+			self.list.set_rows(())
 
 	def new(self, event=None) -> None:
 		self.master.pagemng.current_page = 'newpage'
@@ -177,36 +259,25 @@ class NewPage(Page):
 		self.inner_frm.pack(expand=True, fill='x', padx=30)
 
 		self.dynresize = DynamicResize(self)
-		self.dynresize.add_child(self.title, 'Bahnschrift', 36, 40, 10)
-		self.dynresize.add_child(self.student_btn, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.teacher_btn, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.section_btn, 'Bahnschrift Light', 16, 20, 6)
-		self.dynresize.add_child(self.back_btn, 'Bahnschrift Light', 16, 20, 6)
+		self.dynresize.add_child(self.title, 'heading', 36, 40, 10)
+		self.dynresize.add_child(self.student_btn, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.teacher_btn, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.section_btn, 'body', 16, 20, 6)
+		self.dynresize.add_child(self.back_btn, 'body', 16, 20, 6)
 
 		self.student_btn_tt = Tooltip(self.student_btn, 
-			text='Create a New Student Profile', font=('Bahnschrift Light', 10))
+			text='Create a New Student Profile')
 		self.teacher_btn_tt = Tooltip(self.teacher_btn, 
-			text='Create a New Teacher Profile', font=('Bahnschrift Light', 10))
+			text='Create a New Teacher Profile')
 		self.section_btn_tt = Tooltip(self.section_btn, 
-			text='Create a New Section', font=('Bahnschrift Light', 10))
+			text='Create a New Section')
 		self.back_btn_tt = Tooltip(self.back_btn, 
-			text='Go Back to Previous Page', font=('Bahnschrift Light', 10))
+			text='Go Back to Previous Page')
 
 		self.reload_page()
 
 	def reload_page(self) -> None:
-		
-		self.title.config(font=('Bahnschrift', 36))
-		self.student_btn.config(font=('Bahnschrift Light', 16))
-		self.teacher_btn.config(font=('Bahnschrift Light', 16))
-		self.section_btn.config(font=('Bahnschrift Light', 16))
-		self.back_btn.config(font=('Bahnschrift Light', 16))
-
-		self.student_btn_tt.font = ('Bahnschrift Light', 10)
-		self.student_btn_tt.font = ('Bahnschrift Light', 10)
-		self.teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.section_btn_tt.font = ('Bahnschrift Light', 10)
-		self.back_btn_tt.font = ('Bahnschrift Light', 10)
+		pass
 
 	def back(self) -> None:
 
@@ -214,18 +285,15 @@ class NewPage(Page):
 
 	def student(self) -> None:
 		
-		self.master.pagemng.pages['pfppage'] = StudentProfilePage(self.master)
-		self.master.pagemng.current_page = 'pfppage'
+		self.master.pagemng.show('studentpage')
 
 	def teacher(self) -> None:
 
-		self.master.pagemng.pages['pfppage'] = TeacherProfilePage(self.master)
-		self.master.pagemng.current_page = 'pfppage'
+		self.master.pagemng.show('teacherpage')
 
 	def section(self) -> None:
 		
-		self.master.pagemng.pages['pfppage'] = SectionProfilePage(self.master)
-		self.master.pagemng.current_page = 'pfppage'
+		self.master.pagemng.show('sectionpage')
 
 class ProfilePage(Page):
 	def __init__(self, master: tk.Widget) -> None:
@@ -289,6 +357,8 @@ class ProfilePage(Page):
 		#	Birthday
 		self.bday_frm = tk.Frame(master=self.general_frm)
 		self.bday_lbl = tk.Label(master=self.bday_frm, text='Date of Birth')
+		#	Imported here so only showing a profile pays for it
+		from tkcalendar import DateEntry
 		self.bday_entry = DateEntry(master=self.bday_frm, relief='groove', bd=2, state='readonly', 
 			firstweekday='sunday')
 
@@ -345,26 +415,26 @@ class ProfilePage(Page):
 		self.edit_toggle_btn.pack(expand=True, fill='x', padx=(5, 10), pady=10, side='right')
 		self.btns_frm.pack(fill='x')
 		
-		self.dynresize = DynamicResize(self.master)
-		self.dynresize.add_child(self.pic_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.lname_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.lname_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.fname_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.fname_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.mname_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.mname_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.address_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.address_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.bday_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.bday_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.contact_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.contact_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.email_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.email_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.gender_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.gender_cbox, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.edit_toggle_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.back_btn, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize = DynamicResize(self.master, self)
+		self.dynresize.add_child(self.pic_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.lname_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.lname_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.fname_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.fname_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.mname_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.mname_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.address_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.address_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.bday_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.bday_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.contact_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.contact_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.email_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.email_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.gender_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.gender_cbox, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.edit_toggle_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.back_btn, 'body', 14, 16, 6)
 
 		self.pic_btn_tt = Tooltip(self.pic_btn, text='Click to Select Picture')
 		self.lname_entry_tt = Tooltip(self.lname_entry, text='Last Name, Optional')
@@ -378,8 +448,13 @@ class ProfilePage(Page):
 		self.edit_toggle_btn_tt = Tooltip(self.edit_toggle_btn, text='Save the Profile')
 		self.back_btn_tt = Tooltip(self.back_btn, text='Go Back to Menu')
 
+		#	Times load was called, to tell if a finished save is of the record shown
+		self._loads = 0
+		self.active_profile = None
+		#	Fields changed in the sections updated by the last save, by path
+		self.relinked: Dict[str, List[str]] = {}
+
 		#	Note: Call self.reload_page() on subclasses
-		self.master.protocol('WM_DELETE_WINDOW', self.exit)
 	
 	@property
 	def edit(self) -> bool:
@@ -456,6 +531,56 @@ class ProfilePage(Page):
 	def toggle_edit(self) -> None:
 		self.edit = not self.edit
 
+	def saved(self, loads: int, error: Optional[Exception]) -> None:
+		"""Called once the profile is written, with the error if it failed, 
+		in which case the profile is unlocked again if it is still shown."""
+
+		relinked, self.relinked = self.relinked, {}
+		if error is None:
+			self.show_relinked(relinked)
+			return
+		msgbox.showerror(constants.TITLE, 
+			f'An error occured while saving the profile: {error}')
+		if loads == self._loads and not self._edit and self.winfo_exists():
+			self._edit = True
+			self.unlock()
+			self.reload_page()
+
+	def load(self, record: Optional[data.Person]=None) -> None:
+		"""Show a record on the page, reusing its widgets. A new profile is 
+		started if None, and an existing one is shown locked.
+
+		Args:
+			record (data.Person): The record. Defaults to None.
+		"""
+
+		self._loads += 1
+		self.active_profile = record
+		self.tabmng.select(0)
+		self.master.protocol('WM_DELETE_WINDOW', self.exit)
+
+		self.set_field(self.lname_entry, getattr(record, 'lname', None))
+		self.set_field(self.fname_entry, getattr(record, 'fname', None))
+		self.set_field(self.mname_entry, getattr(record, 'mname', None))
+		self.set_field(self.address_entry, getattr(record, 'address', None))
+		self.set_field(self.bday_entry, getattr(record, 'bday', None) or date.today())
+		self.set_field(self.contact_entry, getattr(record, 'contact_no', None))
+		self.set_field(self.email_entry, getattr(record, 'email', None))
+		self.set_field(self.gender_cbox, getattr(record, 'sex', None))
+
+		self.img = None
+		self.img_path = getattr(record, 'pic', None)
+		try:
+			self.show_pic(self.img_path)
+		except Exception:
+			self.pic_btn.config(text='Select Picture', image='')
+
+		self._edit = record is None
+		if self._edit:
+			self.unlock()
+		else:
+			self.lock()
+
 	def select_pic(self, event=None) -> None:
 
 		if not self.edit:
@@ -465,66 +590,37 @@ class ProfilePage(Page):
 			filetypes=constants.SUPPORTED_IMG_TYPES)
 
 		try:
-			with Image.open(self.img_path) as img:
-				self.img = ImageTk.PhotoImage(img.resize((150, 150)))
-				self.pic_btn.config(text='', image=self.img)
+			self.show_pic(self.img_path)
 		except AttributeError:
 			pass
 		except Exception:
 			msgbox.showerror(constants.TITLE, 
 				'An error occured while processing your image.')
 
+	def show_pic(self, path: str) -> None:
+		"""Show a picture on the picture button, from the thumbnail cache.
+
+		Args:
+			path (str): The path of the picture.
+		"""
+
+		if not path:
+			raise AttributeError('No picture selected.')
+		self.img = self.master.thumbnails.get(path)
+		self.pic_btn.config(text='', image=self.img)
+
 	def reload_page(self, event=None) -> None:
-		
-		self.pic_btn.config(font=('Bahnschrift Light', 14))
-
-		self.lname_lbl.config(font=('Bahnschrift Light', 14))
-		self.lname_entry.config(font=('Bahnschrift Light', 14))
-		self.fname_lbl.config(font=('Bahnschrift Light', 14))
-		self.fname_entry.config(font=('Bahnschrift Light', 14))
-		self.mname_lbl.config(font=('Bahnschrift Light', 14))
-		self.mname_entry.config(font=('Bahnschrift Light', 14))
-
-		self.address_lbl.config(font=('Bahnschrift Light', 14))
-		self.address_entry.config(font=('Bahnschrift Light', 14))
-
-		self.bday_lbl.config(font=('Bahnschrift Light', 14))
-		self.bday_entry.config(font=('Bahnschrift Light', 14))
-
-		self.contact_lbl.config(font=('Bahnschrift Light', 14))
-		self.contact_entry.config(font=('Bahnschrift Light', 14))
-		self.email_lbl.config(font=('Bahnschrift Light', 14))
-		self.email_entry.config(font=('Bahnschrift Light', 14))
-
-		self.gender_lbl.config(font=('Bahnschrift Light', 14))
-		self.gender_cbox.config(font=('Bahnschrift Light', 14))
-
-		self.edit_toggle_btn.config(font=('Bahnschrift Light', 14))
-		self.back_btn.config(font=('Bahnschrift Light', 14))
-
-		self.pic_btn_tt.font = ('Bahnschrift Light', 10)
-		self.lname_entry_tt.font = ('Bahnschrift Light', 10)
-		self.fname_entry_tt.font = ('Bahnschrift Light', 10)
-		self.mname_entry_tt.font = ('Bahnschrift Light', 10)
-		self.address_entry_tt.font = ('Bahnschrift Light', 10)
-		self.bday_entry_tt.font = ('Bahnschrift Light', 10)
-		self.contact_entry_tt.font = ('Bahnschrift Light', 10)
-		self.email_entry_tt.font = ('Bahnschrift Light', 10)
-		self.gender_cbox_tt.font = ('Bahnschrift Light', 10)
-		self.edit_toggle_btn_tt.font = ('Bahnschrift Light', 10)
-		self.back_btn_tt.font = ('Bahnschrift Light', 10)
 
 		if self.edit:
 			self.edit_toggle_btn.config(text='Save')
 		else:
 			self.edit_toggle_btn.config(text='Edit')
-	
+
 class StudentProfilePage(ProfilePage):
 	def __init__(self, master: tk.Widget) -> None:
 		super().__init__(master=master)
 
-		self.active_profile = None
-		self.section_path = None
+		self.section_id = None
 
 		#	Parents in General Frame
 		self.parents_frm = tk.Frame(master=self.general_frm)
@@ -605,18 +701,18 @@ class StudentProfilePage(ProfilePage):
 		self.tabmng.add(self.student_frm, text='Student\'s Information')
 		self.tabmng.add(self.grades_frm, text='Grades and Attendance')
 
-		self.dynresize.add_child(self.parents_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.parents_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.lrn_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.lrn_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_cbox, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_from_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_from_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_to_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_to_entry, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.parents_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.parents_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.lrn_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.lrn_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_cbox, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_from_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_from_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_to_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_to_entry, 'body', 14, 16, 6)
 
 		self.parent_entry_tt = Tooltip(self.parents_entry, text='Parents, Separate w/ Comma, Optional')
 		self.lrn_entry_tt = Tooltip(self.lrn_entry, text='Learner\'s Reference Number')
@@ -625,6 +721,21 @@ class StudentProfilePage(ProfilePage):
 
 		self.reload_page()
 	
+	def load(self, record: Optional[data.Student]=None) -> None:
+
+		super().load(record)
+
+		self.set_field(self.parents_entry, 
+			', '.join(record.parents) if record is not None and record.parents else None)
+		self.set_field(self.lrn_entry, getattr(record, 'lrn', None))
+		self.set_field(self.grade_cbox, getattr(record, 'grade_lvl', None))
+		sy = getattr(record, 'sy', None) or (None, None)
+		self.set_field(self.sy_from_entry, sy[0])
+		self.set_field(self.sy_to_entry, sy[1])
+		self.section_id = getattr(record, 'section', None)
+
+		self.reload_page()
+
 	def save(self, event=None) -> bool:
 
 		required = {
@@ -657,51 +768,51 @@ class StudentProfilePage(ProfilePage):
 		# 		self.section_entry.delete(0, 'end')
 		# 		return
 
-		try:
-			self.active_profile.path = os.path.join(constants.PATHS.STUDENTS.value,
-					constants.FILENAME_FORMATS.STUDENT.value.format(
-						lname=self.lname_entry.get().replace(' ', ''),
-						fname=required['First Name'].replace(' ', ''),
-						mname=self.mname_entry.get().replace(' ', '')))
-			self.active_profile.pic = required['Picture']
-			self.active_profile.fname = required['First Name']
-			self.active_profile.bday = self.bday_entry.get_date()
-			self.active_profile.address = required['Address']
-			self.active_profile.sex = required['Gender']
-			self.active_profile.lrn = required['Learner\'s Reference Number']
-			self.active_profile.sy = (required['School Year (From)'], 
-				required['School Year (To)'])
-			self.active_profile.grade_lvl = required['Grade Level']
-			self.active_profile.section = self.section_path
-			self.active_profile.contact_no = misc.convert_blank(self.contact_entry.get())
-			self.active_profile.email = misc.convert_blank(self.email_entry.get())
-			self.active_profile.mname = misc.convert_blank(self.mname_entry.get())
-			self.active_profile.lname = misc.convert_blank(self.lname_entry.get())
-		except (AttributeError, OSError):
-			self.active_profile = data.Student(
-				os.path.join(constants.PATHS.STUDENTS.value,
-					constants.FILENAME_FORMATS.STUDENT.value.format(
-						lname=self.lname_entry.get().replace(' ', ''),
-						fname=required['First Name'].replace(' ', ''),
-						mname=self.mname_entry.get().replace(' ', ''))), 
-				required['Picture'], 
-				required['First Name'],
-				self.bday_entry.get_date(),
-				required['Address'],
-				required['Gender'],
-				required['Learner\'s Reference Number'],
-				(required['School Year (From)'], required['School Year (To)']),
-				required['Parents'].split(','),
-				required['Grade Level'],
-				self.section_path,
-				misc.convert_blank(self.contact_entry.get()),
-				misc.convert_blank(self.email_entry.get()),
-				misc.convert_blank(self.mname_entry.get()),
-				misc.convert_blank(self.lname_entry.get()))
+		with data.Transaction(self.master.saves, functools.partial(self.saved, self._loads)):
+			try:
+				self.active_profile.path = os.path.join(constants.PATHS.STUDENTS.value,
+						constants.FILENAME_FORMATS.STUDENT.value.format(
+							lname=self.lname_entry.get().replace(' ', ''),
+							fname=required['First Name'].replace(' ', ''),
+							mname=self.mname_entry.get().replace(' ', '')))
+				self.active_profile.pic = required['Picture']
+				self.active_profile.fname = required['First Name']
+				self.active_profile.bday = self.bday_entry.get_date()
+				self.active_profile.address = required['Address']
+				self.active_profile.sex = required['Gender']
+				self.active_profile.lrn = required['Learner\'s Reference Number']
+				self.active_profile.sy = (required['School Year (From)'], 
+					required['School Year (To)'])
+				self.active_profile.grade_lvl = required['Grade Level']
+				self.active_profile.section = self.section_id
+				self.active_profile.contact_no = misc.convert_blank(self.contact_entry.get())
+				self.active_profile.email = misc.convert_blank(self.email_entry.get())
+				self.active_profile.mname = misc.convert_blank(self.mname_entry.get())
+				self.active_profile.lname = misc.convert_blank(self.lname_entry.get())
+			except (AttributeError, OSError):
+				self.active_profile = data.Student(
+					os.path.join(constants.PATHS.STUDENTS.value,
+						constants.FILENAME_FORMATS.STUDENT.value.format(
+							lname=self.lname_entry.get().replace(' ', ''),
+							fname=required['First Name'].replace(' ', ''),
+							mname=self.mname_entry.get().replace(' ', ''))), 
+					required['Picture'], 
+					required['First Name'],
+					self.bday_entry.get_date(),
+					required['Address'],
+					required['Gender'],
+					required['Learner\'s Reference Number'],
+					(required['School Year (From)'], required['School Year (To)']),
+					required['Parents'].split(','),
+					required['Grade Level'],
+					self.section_id,
+					misc.convert_blank(self.contact_entry.get()),
+					misc.convert_blank(self.email_entry.get()),
+					misc.convert_blank(self.mname_entry.get()),
+					misc.convert_blank(self.lname_entry.get()))
 			
-		self.active_profile.dump()
-
-		self.master.reload_loaders(event)
+			self.active_profile.dump()
+			self.relinked = self.master.sectionloader.relink(self.active_profile)
 
 		return True
 
@@ -728,46 +839,21 @@ class StudentProfilePage(ProfilePage):
 
 		super().reload_page(event)
 
-		self.parents_lbl.config(font=('Bahnschrift Light', 14))
-		self.parents_entry.config(font=('Bahnschrift Light', 14))
-
-		self.lrn_lbl.config(font=('Bahnschrift Light', 14))
-		self.lrn_entry.config(font=('Bahnschrift Light', 14))
-
-		self.grade_lbl.config(font=('Bahnschrift Light', 14))
-		self.grade_cbox.config(font=('Bahnschrift Light', 14))
-
-		self.section_lbl.config(font=('Bahnschrift Light', 14))
-		self.section_btn.config(font=('Bahnschrift Light', 14))
-
-		self.sy_from_lbl.config(font=('Bahnschrift Light', 14))
-		self.sy_from_entry.config(font=('Bahnschrift Light', 14))
-		self.sy_to_lbl.config(font=('Bahnschrift Light', 14))
-		self.sy_to_entry.config(font=('Bahnschrift Light', 14))
-		
-		self.parent_entry_tt.font = ('Bahnschrift Light', 10) 
-		self.lrn_entry_tt.font = ('Bahnschrift Light', 10)
-		self.grade_cbox_tt.font = ('Bahnschrift Light', 10)
-		self.section_entry_tt.font = ('Bahnschrift Light', 10)
-
 		if self.edit:
 			self.section_entry_tt.text = 'Section, Optional'
 		else:
 			self.section_entry_tt.text = 'Section, Click to Open'
 
-		try:
-			self.section_btn.config(text=data.Section.construct(self.section_path).name)
-		except (TypeError, OSError):
-			self.section_btn.config(text='None')
+		section = self.master.sectionloader.resolve(self.section_id)
+		self.section_btn.config(text=section.name if section is not None else 'None')
 
 	def section(self, event=None) -> None:
 		
-		if not self.edit and self.section_path is not None:
-			if os.path.exists(self.section_path):
-				self.master.protocol('WM_DELETE_WINDOW', self.master.exit)
-
-				self.master.pagemng.pages['pfppage'] = \
-					SectionProfilePage.load(data.Section.construct(self.section_path))
+		if not self.edit and self.section_id is not None:
+			section = self.master.sectionloader.resolve(self.section_id)
+			if section is not None:
+				self.master.pagemng.show('sectionpage', 
+					self.master.sectionloader.get(section))
 				self.master.pagemng.previous_page = None
 
 		else:
@@ -778,7 +864,7 @@ class TeacherProfilePage(ProfilePage):
 	def __init__(self, master: tk.Widget) -> None:
 		super().__init__(master=master)
 
-		self.active_profile = None
+		self.section_id = None
 		self.teacher_frm = tk.Frame(self)
 		self.sections = []
 
@@ -800,7 +886,7 @@ class TeacherProfilePage(ProfilePage):
 		self.section_lbl.pack(fill='x', padx=6, pady=2)
 		self.inner_section_frm = tk.Frame(self.section_frm)
 		self.section_list_scrollbar = tk.Scrollbar(master=self.inner_section_frm)
-		self.section_list = tk.Listbox(master=self.inner_section_frm, yscrollcommand=self.section_list_scrollbar.set, 
+		self.section_list = VirtualList(master=self.inner_section_frm, yscrollcommand=self.section_list_scrollbar.set, 
 			relief='groove', bd=2)
 		self.section_list_scrollbar.config(command=self.section_list.yview)
 		self.section_list_scrollbar.pack(fill='y', side='right')
@@ -830,13 +916,13 @@ class TeacherProfilePage(ProfilePage):
 
 		self.tabmng.add(self.teacher_frm, text='Teacher\'s Information')
 
-		self.dynresize.add_child(self.advisorycls_input_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.advisorycls_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_list, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.add_section_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.remove_section_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.open_section_btn, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.advisorycls_input_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.advisorycls_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_list, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.add_section_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.remove_section_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.open_section_btn, 'body', 14, 16, 6)
 
 		self.advisorycls_btn_tt = Tooltip(self.advisorycls_btn, text='Advisory Class, Optional')
 		self.section_list_tt = Tooltip(self.section_list, text='All the Sections the Teacher Holds')
@@ -861,26 +947,20 @@ class TeacherProfilePage(ProfilePage):
 
 		super().reload_page(event)
 
-		self.advisorycls_input_lbl.config(font=('Bahnschrift Light', 14))
-		self.advisorycls_btn.config(font=('Bahnschrift Light', 14))
-		self.section_lbl.config(font=('Bahnschrift Light', 14))
-		self.section_list.config(font=('Bahnschrift Light', 14))
-		self.add_section_btn.config(font=('Bahnschrift Light', 14))
-		self.remove_section_btn.config(font=('Bahnschrift Light', 14))
-		self.open_section_btn.config(font=('Bahnschrift Light', 14))
+		section = self.master.sectionloader.resolve(self.section_id)
+		self.advisorycls_btn.config(text=section.name if section is not None else 'None')
 
-		self.advisorycls_btn_tt.font = ('Bahnschrift Light', 10)
-		self.section_list_tt.font = ('Bahnschrift Light', 10)
-		self.add_section_btn_tt.font = ('Bahnschrift Light', 10)
-		self.remove_section_btn_tt.font = ('Bahnschrift Light', 10)
-		self.open_section_btn_tt.font = ('Bahnschrift Light', 10)
+		self.upd_section_list()
 
-		try:
-			self.advisorycls_btn.config(text=data.Section.construct(self.section_path).name)
-		except (TypeError, OSError):
-			self.advisorycls_btn.config(text='None')
+	def load(self, record: Optional[data.Teacher]=None) -> None:
 
-		self.upd_section_list()
+		super().load(record)
+
+		self.section_id = getattr(record, 'advisory_cls', None)
+		self.sections = [self.reference(item, self.master.sectionloader) 
+			for item in getattr(record, 'sections', None) or []]
+
+		self.reload_page()
 
 	def save(self, event=None) -> None:
 		
@@ -911,59 +991,59 @@ class TeacherProfilePage(ProfilePage):
 
 		self.upd_section_list(event)
 
-		try:
-			self.active_profile.path = os.path.join(constants.PATHS.STUDENTS.value,
-					constants.FILENAME_FORMATS.STUDENT.value.format(
-						lname=self.lname_entry.get().replace(' ', ''),
-						fname=required['First Name'].replace(' ', ''),
-						mname=self.mname_entry.get().replace(' ', '')))
-			self.active_profile.pic = required['Picture']
-			self.active_profile.fname = required['First Name']
-			self.active_profile.bday = self.bday_entry.get_date()
-			self.active_profile.address = required['Address']
-			self.active_profile.sex = required['Gender']
-			self.active_profile.advisory_cls = self.section_path
-			self.active_profile.contact_no = misc.convert_blank(self.contact_entry.get())
-			self.active_profile.email = misc.convert_blank(self.email_entry.get())
-			self.active_profile.mname = misc.convert_blank(self.mname_entry.get())
-			self.active_profile.lname = misc.convert_blank(self.lname_entry.get())
-		except (AttributeError, OSError):
-			self.active_profile = data.Teacher(
-				os.path.join(constants.PATHS.TEACHERS.value,
-					constants.FILENAME_FORMATS.TEACHER.value.format(
-						lname=self.lname_entry.get().replace(' ', ''),
-						fname=required['First Name'].replace(' ', ''),
-						mname=self.mname_entry.get().replace(' ', ''))), 
-				required['Picture'], 
-				required['First Name'],
-				self.bday_entry.get_date(),
-				required['Address'],
-				required['Gender'],
-				self.section_path,
-				[data.Section.construct(item[1]) for item in self.sections],
-				misc.convert_blank(self.contact_entry.get()),
-				misc.convert_blank(self.email_entry.get()),
-				misc.convert_blank(self.mname_entry.get()),
-				misc.convert_blank(self.lname_entry.get()))
-
-		self.active_profile.sections = self.sections
+		with data.Transaction(self.master.saves, functools.partial(self.saved, self._loads)):
+			try:
+				self.active_profile.path = os.path.join(constants.PATHS.TEACHERS.value,
+						constants.FILENAME_FORMATS.TEACHER.value.format(
+							lname=self.lname_entry.get().replace(' ', ''),
+							fname=required['First Name'].replace(' ', ''),
+							mname=self.mname_entry.get().replace(' ', '')))
+				self.active_profile.pic = required['Picture']
+				self.active_profile.fname = required['First Name']
+				self.active_profile.bday = self.bday_entry.get_date()
+				self.active_profile.address = required['Address']
+				self.active_profile.sex = required['Gender']
+				self.active_profile.advisory_cls = self.section_id
+				self.active_profile.contact_no = misc.convert_blank(self.contact_entry.get())
+				self.active_profile.email = misc.convert_blank(self.email_entry.get())
+				self.active_profile.mname = misc.convert_blank(self.mname_entry.get())
+				self.active_profile.lname = misc.convert_blank(self.lname_entry.get())
+			except (AttributeError, OSError):
+				self.active_profile = data.Teacher(
+					os.path.join(constants.PATHS.TEACHERS.value,
+						constants.FILENAME_FORMATS.TEACHER.value.format(
+							lname=self.lname_entry.get().replace(' ', ''),
+							fname=required['First Name'].replace(' ', ''),
+							mname=self.mname_entry.get().replace(' ', ''))), 
+					required['Picture'], 
+					required['First Name'],
+					self.bday_entry.get_date(),
+					required['Address'],
+					required['Gender'],
+					self.section_id,
+					[item[1] for item in self.sections],
+					misc.convert_blank(self.contact_entry.get()),
+					misc.convert_blank(self.email_entry.get()),
+					misc.convert_blank(self.mname_entry.get()),
+					misc.convert_blank(self.lname_entry.get()))
+
+			self.active_profile.sections = [item[1] for item in self.sections]
 			
-		self.active_profile.dump()
-
-		self.master.reload_loaders(event)
+			self.active_profile.dump()
+			self.relinked = self.master.sectionloader.relink(self.active_profile)
 
 		return True
 
 	def add_section(self, event=None) -> None:
 
 		target = misc.convert_blank(self.section_input_entry.get())
-		self.section_path = None
+		self.section_id = None
 		if target is not None:
-			sections = {section.name: section.path for section in \
+			sections = {section.name: section.uid for section in \
 				self.master.sectionloader.items}
 			try:
-				section_path = sections[target]
-				self.active_profile.append([target, section_path])
+				section_id = sections[target]
+				self.active_profile.append([target, section_id])
 				self.upd_section_list(self, event)
 			except KeyError:
 				msgbox.showerror(constants.TITLE, f'The section \'{target}\' does not exist.')
@@ -971,18 +1051,18 @@ class TeacherProfilePage(ProfilePage):
 
 	def upd_section_list(self, event=None) -> None:
 
-		self.section_list.delete(0, 'end')
-		self.sections = [item for item in self.sections if os.path.exists(item[1])]
-		self.section_list.insert('end', *[item[0] for item in self.sections])
+		#   Sections not loaded yet are kept until the loaders know of them
+		if not self.master.loading:
+			self.sections = self.master.references.prune(self.sections)
+		self.section_list.set_rows(MappedRows(self.sections, operator.itemgetter(0)))
 
 	def section(self, event=None) -> None:
 		
-		if not self.edit and self.section_path is not None:
-			if os.path.exists(self.section_path):
-				self.master.protocol('WM_DELETE_WINDOW', self.master.exit)
-
-				self.master.pagemng.pages['pfppage'] = \
-					SectionProfilePage.load(data.Section.construct(self.section_path))
+		if not self.edit and self.section_id is not None:
+			section = self.master.sectionloader.resolve(self.section_id)
+			if section is not None:
+				self.master.pagemng.show('sectionpage', 
+					self.master.sectionloader.get(section))
 				self.master.pagemng.previous_page = None
 
 		else:
@@ -994,8 +1074,11 @@ class SectionProfilePage(Page):
 		super().__init__(master=master)
 
 		self._edit = True
-		self.adviser_path = None
+		self._loads = 0
+		self.adviser_id = None
 		self.active_section = None
+		#	Fields changed in the records updated by the last save, by path
+		self.relinked: Dict[str, List[str]] = {}
 		self.teachers = []
 		self.students = []
 
@@ -1045,11 +1128,9 @@ class SectionProfilePage(Page):
 		self.teachers_frm = tk.Frame(self.general_frm)
 		self.inner_teachers_frm = tk.Frame(self.teachers_frm)
 		self.teachers_list_scrollbar = tk.Scrollbar(master=self.inner_teachers_frm)
-		self.teachers_list = tk.Listbox(master=self.inner_teachers_frm, yscrollcommand=self.teachers_list_scrollbar.set, 
+		self.teachers_list = VirtualList(master=self.inner_teachers_frm, yscrollcommand=self.teachers_list_scrollbar.set, 
 			relief='groove', bd=2)
 		self.teachers_list_scrollbar.config(command=self.teachers_list.yview)
-		for i in range(1, 101):
-			self.teachers_list.insert(tk.END, f'Keon Clone {i} as Teacher Keon {i}')
 		self.teachers_list_scrollbar.pack(fill='y', side='right')
 		self.teachers_list.pack(expand=True, fill='both', side='left')
 		self.teachers_btns_frm = tk.Frame(self.teachers_frm)
@@ -1076,11 +1157,9 @@ class SectionProfilePage(Page):
 		self.student_frm = tk.Frame(self.general_frm)
 		self.inner_student_frm = tk.Frame(self.student_frm)
 		self.student_list_scrollbar = tk.Scrollbar(master=self.inner_student_frm)
-		self.students_list = tk.Listbox(master=self.inner_student_frm, yscrollcommand=self.student_list_scrollbar.set, 
+		self.students_list = VirtualList(master=self.inner_student_frm, yscrollcommand=self.student_list_scrollbar.set, 
 			relief='groove', bd=2)
 		self.student_list_scrollbar.config(command=self.students_list.yview)
-		for i in range(1, 101):
-			self.students_list.insert(tk.END, f'Keon Clone {i} as Student Keon {i}')
 		self.student_list_scrollbar.pack(fill='y', side='right')
 		self.students_list.pack(expand=True, fill='both', side='left')
 		self.student_btns_frm = tk.Frame(self.student_frm)
@@ -1115,25 +1194,25 @@ class SectionProfilePage(Page):
 		self.edit_toggle_btn.pack(expand=True, fill='x', padx=(5, 10), pady=10, side='right')
 		self.btns_frm.pack(fill='x')
 
-		self.dynresize = DynamicResize(self.master)
-		self.dynresize.add_child(self.name_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.name_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_cbox, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.adviser_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.adviser_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.teachers_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.teachers_list, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.add_teacher_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.remove_teacher_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.open_teacher_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.students_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.students_list, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.add_student_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.remove_student_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.open_student_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.back_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.edit_toggle_btn, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize = DynamicResize(self.master, self)
+		self.dynresize.add_child(self.name_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.name_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_cbox, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.adviser_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.adviser_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.teachers_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.teachers_list, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.add_teacher_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.remove_teacher_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.open_teacher_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.students_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.students_list, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.add_student_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.remove_student_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.open_student_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.back_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.edit_toggle_btn, 'body', 14, 16, 6)
 
 		self.name_entry_tt = Tooltip(self.name_entry, text='Name of the Section')
 		self.grade_cbox_tt = Tooltip(self.grade_cbox, text='Grade Level of the Section')
@@ -1149,7 +1228,6 @@ class SectionProfilePage(Page):
 		self.open_teacher_btn_tt = Tooltip(self.open_teacher_btn, text='Open a Teacher\'s Profile')
 		self.back_btn_tt = Tooltip(self.back_btn, text='Go Back to Menu')
 
-		self.master.protocol('WM_DELETE_WINDOW', self.exit)
 		self.reload_page()
 
 	@property
@@ -1172,41 +1250,8 @@ class SectionProfilePage(Page):
 
 	def reload_page(self, event=None) -> None:
 
-		self.name_lbl.config(font=('Bahnschrift Light', 14))
-		self.name_entry.config(font=('Bahnschrift Light', 14))
-		self.grade_lbl.config(font=('Bahnschrift Light', 14))
-		self.grade_cbox.config(font=('Bahnschrift Light', 14))
-		self.adviser_lbl.config(font=('Bahnschrift Light', 14))
-		self.adviser_entry.config(font=('Bahnschrift Light', 14))
-		self.teachers_lbl.config(font=('Bahnschrift Light', 14))
-		self.teachers_list.config(font=('Bahnschrift Light', 14))
-		self.add_teacher_btn.config(font=('Bahnschrift Light', 14))
-		self.remove_teacher_btn.config(font=('Bahnschrift Light', 14))
-		self.open_teacher_btn.config(font=('Bahnschrift Light', 14))
-		self.students_lbl.config(font=('Bahnschrift Light', 14))
-		self.students_list.config(font=('Bahnschrift Light', 14))
-		self.add_student_btn.config(font=('Bahnschrift Light', 14))
-		self.remove_student_btn.config(font=('Bahnschrift Light', 14))
-		self.open_student_btn.config(font=('Bahnschrift Light', 14))
-		self.back_btn.config(font=('Bahnschrift Light', 14))
-		self.edit_toggle_btn.config(font=('Bahnschrift Light', 14))
-
-		self.name_entry_tt.font = ('Bahnschrift Light', 10)
-		self.grade_cbox_tt.font = ('Bahnschrift Light', 10)
-		self.adviser_entry_tt.font = ('Bahnschrift Light', 10)
-		self.edit_toggle_btn_tt.font = ('Bahnschrift Light', 10)
-		self.teachers_list_tt.font = ('Bahnschrift Light', 10)
-		self.add_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.remove_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.open_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.student_list_tt.font = ('Bahnschrift Light', 10)
-		self.add_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.remove_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.open_teacher_btn_tt.font = ('Bahnschrift Light', 10)
-		self.back_btn_tt.font = ('Bahnschrift Light', 10)
-		
 		self.upd_lists()
-	
+
 	def back(self, event=None) -> None:
 
 		if self.edit:
@@ -1270,55 +1315,114 @@ class SectionProfilePage(Page):
 				return False
 
 		adviser = misc.convert_blank(self.adviser_entry.get())
-		self.adviser_path = None
-		if adviser is not None:
-			advisers = {adviser.name: adviser.path for adviser in \
-				self.master.teacherloader.items}
-			try:
-				self.adviser_path: str = advisers[adviser]
-			except KeyError:
+		teacherloader = self.master.teacherloader
+		current = teacherloader.resolve(self.adviser_id)
+		if adviser is None:
+			self.adviser_id = None
+		elif current is None or adviser != teacherloader.names.labels.get(current.path):
+			#	Changed from the adviser shown, so the teacher is found by name
+			name = adviser[:-len(' (Teacher)')] if adviser.endswith(' (Teacher)') else adviser
+			matches = teacherloader.find(name)
+			exact = [teacher for teacher in matches if 
+				teacherloader.names.labels[teacher.path].lower() == f'{name} (teacher)'.lower()]
+			if len(exact) == 1 or len(matches) == 1:
+				self.adviser_id = (exact or matches)[0].uid
+			elif matches:
+				msgbox.showerror(constants.TITLE, 
+					f'More than one teacher is named \'{adviser}\'.')
+				return False
+			else:
 				msgbox.showerror(constants.TITLE, f'Teacher \'{adviser}\' does not exist.')
-				return
+				return False
 
 		self.upd_lists(event)
 
-		try:
-			self.active_section.path = os.path.join(constants.PATHS.SECTIONS.value,
-					constants.FILENAME_FORMATS.SECTION.value.format(
-						glvl=required['Grade Level'].replace(' ', ''),
-						name=required['Name'].replace(' ', '')))
-			self.active_section.grade = required['Grade Level']
-			self.active_section.name = required['Name']
-		except (AttributeError, OSError):
-			self.active_section = data.Section(
-				os.path.join(constants.PATHS.SECTIONS.value,
-					constants.FILENAME_FORMATS.SECTION.value.format(
-						glvl=required['Grade Level'].replace(' ', ''),
-						name=required['Name'].replace(' ', ''))),
-				required['Name'],
-				required['Grade Level'])
-
-		self.active_section.students = self.students
-		self.active_section.teachers = self.teachers
+		with data.Transaction(self.master.saves, functools.partial(self.saved, self._loads)):
+			try:
+				self.active_section.path = os.path.join(constants.PATHS.SECTIONS.value,
+						constants.FILENAME_FORMATS.SECTION.value.format(
+							glvl=required['Grade Level'].replace(' ', ''),
+							name=required['Name'].replace(' ', '')))
+				self.active_section.grade = required['Grade Level']
+				self.active_section.name = required['Name']
+			except (AttributeError, OSError):
+				self.active_section = data.Section(
+					os.path.join(constants.PATHS.SECTIONS.value,
+						constants.FILENAME_FORMATS.SECTION.value.format(
+							glvl=required['Grade Level'].replace(' ', ''),
+							name=required['Name'].replace(' ', ''))),
+					required['Name'],
+					required['Grade Level'])
+
+			self.active_section.adviser = self.adviser_id
+			#	Only the IDs are saved, the names are looked up when shown
+			self.active_section.students = [item[1] for item in self.students]
+			self.active_section.teachers = [item[1] for item in self.teachers]
 			
-		self.active_section.dump()
-
-		self.master.reload_loaders(event)
+			self.active_section.dump()
+			self.relinked = {**self.master.teacherloader.relink(self.active_section), 
+				**self.master.studentloader.relink(self.active_section)}
 
 		return True
 
 	def toggle_edit(self, event=None) -> None:
 		self.edit = not self.edit
 
+	def saved(self, loads: int, error: Optional[Exception]) -> None:
+		"""Called once the section is written, with the error if it failed, 
+		in which case the section is unlocked again if it is still shown."""
+
+		relinked, self.relinked = self.relinked, {}
+		if error is None:
+			self.show_relinked(relinked)
+			return
+		msgbox.showerror(constants.TITLE, 
+			f'An error occured while saving the profile: {error}')
+		if loads == self._loads and not self._edit and self.winfo_exists():
+			self._edit = True
+			self.unlock()
+			self.reload_page()
+
+	def load(self, record: Optional[data.Section]=None) -> None:
+		"""Show a section on the page, reusing its widgets. A new section is 
+		started if None, and an existing one is shown locked.
+
+		Args:
+			record (data.Section): The section. Defaults to None.
+		"""
+
+		self._loads += 1
+		self.active_section = record
+		self.tabmng.select(0)
+		self.master.protocol('WM_DELETE_WINDOW', self.exit)
+
+		self.set_field(self.name_entry, getattr(record, 'name', None))
+		self.set_field(self.grade_cbox, getattr(record, 'grade', None))
+		self.adviser_id = getattr(record, 'adviser', None)
+		adviser = self.master.teacherloader.resolve(self.adviser_id)
+		self.set_field(self.adviser_entry, self.master.teacherloader.names.labels.get(
+			adviser.path) if adviser is not None else None)
+		self.teachers = [self.reference(item, self.master.teacherloader) 
+			for item in getattr(record, 'teachers', None) or []]
+		self.students = [self.reference(item, self.master.studentloader) 
+			for item in getattr(record, 'students', None) or []]
+
+		self._edit = record is None
+		if self._edit:
+			self.unlock()
+		else:
+			self.lock()
+		self.reload_page()
+
 	def upd_lists(self, event=None) -> None:
 		
-		self.teachers_list.delete(0, 'end')
-		self.teachers = [item for item in self.teachers if os.path.exists(item[1])]
-		self.teachers_list.insert('end', *[item[0] for item in self.teachers])
+		#   Members not loaded yet are kept until the loaders know of them
+		if not self.master.loading:
+			self.teachers = self.master.references.prune(self.teachers)
+			self.students = self.master.references.prune(self.students)
 
-		self.students_list.delete(0, 'end')
-		self.students = [item for item in self.students if os.path.exists(item[1])]
-		self.students_list.insert('end', *[item[0] for item in self.students])
+		self.teachers_list.set_rows(MappedRows(self.teachers, operator.itemgetter(0)))
+		self.students_list.set_rows(MappedRows(self.students, operator.itemgetter(0)))
 
 	def add_student(self, event=None) -> None:
 		pass
@@ -1346,7 +1450,7 @@ class OpenPage(Page):
 		self.search_frm.pack(fill='x', padx=10, pady=2)
 		self.inner_open_frm = tk.Frame(self.open_frm)
 		self.open_list_scrollbar = tk.Scrollbar(master=self.inner_open_frm)
-		self.open_list = tk.Listbox(master=self.inner_open_frm, yscrollcommand=self.open_list_scrollbar.set, 
+		self.open_list = VirtualList(master=self.inner_open_frm, yscrollcommand=self.open_list_scrollbar.set, 
 			relief='groove', bd=2)
 		self.open_list_scrollbar.config(command=self.open_list.yview)
 		self.open_list_scrollbar.pack(fill='y', side='right')
@@ -1367,17 +1471,17 @@ class OpenPage(Page):
 		self.inner_frm.pack(expand=True, fill='x', padx=30)
 
 		self.dynresize = DynamicResize(self)
-		self.dynresize.add_child(self.title, 'Bahnschrift', 36, 40, 10)
-		self.dynresize.add_child(self.search_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.open_btn, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.back_btn, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.title, 'heading', 36, 40, 10)
+		self.dynresize.add_child(self.search_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.open_btn, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.back_btn, 'body', 14, 16, 6)
 
 		self.back_btn_tt = Tooltip(self.back_btn, 
-			text='Go Back to Previous Page', font=('Bahnschrift Light', 10))
+			text='Go Back to Previous Page')
 		self.search_entry_tt = Tooltip(self.search_entry, 
-			text='Search for a Profile', font=('Bahnschrift Light', 10))
+			text='Search for a Profile')
 		self.open_btn_tt = Tooltip(self.open_btn, 
-			text='Open the Selected Profile', font=('Bahnschrift Light', 10))
+			text='Open the Selected Profile')
 
 		self.reload_page()
 
@@ -1466,16 +1570,16 @@ class PersonPanel(Page):
 		self.email_frm.pack(fill='x', padx=10, pady=2)
 
 		self.dynresize = dynresize
-		self.dynresize.add_child(self.name_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.name_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.address_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.address_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.gender_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.gender_cbox, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.contactno_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.contactno_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.email_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.email_entry, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.name_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.name_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.address_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.address_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.gender_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.gender_cbox, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.contactno_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.contactno_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.email_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.email_entry, 'body', 14, 16, 6)
 
 		self.name_entry_tt = Tooltip(self.name_entry, text='Name')
 		self.address_entry_tt = Tooltip(self.address_entry, text='Address')
@@ -1484,23 +1588,7 @@ class PersonPanel(Page):
 		self.email_entry_tt = Tooltip(self.email_entry, text='E-mail Address')
 
 	def reload_page(self, event=None) -> None:
-
-		self.name_lbl.config(font=('Bahnschrift Light', 14))
-		self.name_entry.config(font=('Bahnschrift Light', 14))
-		self.address_lbl.config(font=('Bahnschrift Light', 14))
-		self.address_entry.config(font=('Bahnschrift Light', 14))
-		self.gender_lbl.config(font=('Bahnschrift Light', 14))
-		self.gender_cbox.config(font=('Bahnschrift Light', 14))
-		self.contactno_lbl.config(font=('Bahnschrift Light', 14))
-		self.contactno_lbl.config(font=('Bahnschrift Light', 14))
-		self.email_entry.config(font=('Bahnschrift Light', 14))
-		self.email_entry.config(font=('Bahnschrift Light', 14))
-
-		self.name_entry_tt.font=('Bahnschrift Light', 10)
-		self.address_entry_tt.font=('Bahnschrift Light', 10)
-		self.gender_cbox_tt.font=('Bahnschrift Light', 10)
-		self.contactno_entry_tt.font=('Bahnschrift Light', 10)
-		self.email_entry_tt.font=('Bahnschrift Light', 10)
+		pass
 
 class StudentPanel(PersonPanel):
 	def __init__(self, master: tk.Widget, dynresize: 'DynamicResize') -> None:
@@ -1565,18 +1653,18 @@ class StudentPanel(PersonPanel):
 
 		self.section_frm.pack(fill='x', padx=10, pady=2)
 
-		self.dynresize.add_child(self.lrn_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.lrn_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_from_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_from_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_to_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sy_to_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.parents_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.parents_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_cbox, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.section_entry, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.lrn_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.lrn_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_from_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_from_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_to_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sy_to_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.parents_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.parents_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_cbox, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.section_entry, 'body', 14, 16, 6)
 
 		self.lrn_entry_tt = Tooltip(self.lrn_entry, text='Learner\'s Reference Number')
 		self.sy_from_entry_tt = Tooltip(self.sy_from_entry, text='School Year (From)')
@@ -1591,26 +1679,6 @@ class StudentPanel(PersonPanel):
 		
 		super().reload_page(event)
 
-		self.lrn_lbl.config(font=('Bahnschrift Light', 14))
-		self.lrn_entry.config(font=('Bahnschrift Light', 14))
-		self.sy_from_lbl.config(font=('Bahnschrift Light', 14))
-		self.sy_from_entry.config(font=('Bahnschrift Light', 14))
-		self.sy_to_lbl.config(font=('Bahnschrift Light', 14))
-		self.sy_to_entry.config(font=('Bahnschrift Light', 14))
-		self.parents_lbl.config(font=('Bahnschrift Light', 14))
-		self.parents_entry.config(font=('Bahnschrift Light', 14))
-		self.grade_lbl.config(font=('Bahnschrift Light', 14))
-		self.grade_cbox.config(font=('Bahnschrift Light', 14))
-		self.section_lbl.config(font=('Bahnschrift Light', 14))
-		self.section_entry.config(font=('Bahnschrift Light', 14))
-
-		self.lrn_entry_tt.font=('Bahnschrift Light', 10)
-		self.sy_from_entry_tt.font=('Bahnschrift Light', 10)
-		self.sy_to_entry_tt.font=('Bahnschrift Light', 10)
-		self.parents_entry_tt.font=('Bahnschrift Light', 10)
-		self.grade_cbox_tt.font=('Bahnschrift Light', 10)
-		self.section_entry_tt.font=('Bahnschrift Light', 10)
-
 class TeacherPanel(PersonPanel):
 	def __init__(self, master: tk.Widget, dynresize: 'DynamicResize') -> None:
 		super().__init__(master, dynresize)
@@ -1635,10 +1703,10 @@ class TeacherPanel(PersonPanel):
 
 		self.sections_frm.pack(fill='x', padx=10, pady=2)
 
-		self.dynresize.add_child(self.advisorycls_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.advisorycls_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sections_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.sections_entry, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.advisorycls_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.advisorycls_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sections_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.sections_entry, 'body', 14, 16, 6)
 
 		self.advisorycls_entry_tt = Tooltip(self.advisorycls_entry, 'Adivsory Class')
 		self.sections_entry_tt = Tooltip(self.sections_entry, 'Sections the Teacher Handles, Separated with Comma')
@@ -1649,14 +1717,6 @@ class TeacherPanel(PersonPanel):
 		
 		super().reload_page(event)
 
-		self.advisorycls_lbl.config(font=('Bahnschrift Light', 14))
-		self.advisorycls_entry.config(font=('Bahnschrift Light', 14))
-		self.sections_lbl.config(font=('Bahnschrift Light', 14))
-		self.sections_entry.config(font=('Bahnschrift Light', 14))
-
-		self.advisorycls_entry_tt.font=('Bahnschrift Light', 10)
-		self.sections_entry_tt.font=('Bahnschrift Light', 10)
-
 class SectionPanel(Page):
 	def __init__(self, master: tk.Widget, dynresize: 'DynamicResize') -> None:
 		super().__init__(master)
@@ -1684,10 +1744,10 @@ class SectionPanel(Page):
 		self.grade_frm.pack(fill='x', padx=10, pady=2)
 
 		self.dynresize = dynresize
-		self.dynresize.add_child(self.name_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.name_entry, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_lbl, 'Bahnschrift Light', 14, 16, 6)
-		self.dynresize.add_child(self.grade_cbox, 'Bahnschrift Light', 14, 16, 6)
+		self.dynresize.add_child(self.name_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.name_entry, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_lbl, 'body', 14, 16, 6)
+		self.dynresize.add_child(self.grade_cbox, 'body', 14, 16, 6)
 
 		self.name_entry_tt = Tooltip(self.name_entry, 'Name of Section')
 		self.grade_cbox_tt = Tooltip(self.grade_cbox, 'Grade')
@@ -1695,20 +1755,15 @@ class SectionPanel(Page):
 		self.reload_page()
 
 	def reload_page(self, event=None) -> None:
-		
-		self.name_lbl.config(font=('Bahnschrift Light', 14))
-		self.name_entry.config(font=('Bahnschrift Light', 14))
-		self.grade_lbl.config(font=('Bahnschrift Light', 14))
-		self.grade_cbox.config(font=('Bahnschrift Light', 14))
-
-		self.name_entry_tt.font=('Bahnschrift Light', 10)
-		self.grade_cbox_tt.font=('Bahnschrift Light', 10)
+		pass
 
 class PageManager:
 	def __init__(self) -> None:
 		
 		self._current_page: str = None
 		self.pages: Dict[str, Page] = {}
+		#	Pages not built yet -> what builds them
+		self.factories: Dict[str, Callable[[], Page]] = {}
 		self.previous_page: str = None
 
 	@property
@@ -1724,7 +1779,7 @@ class PageManager:
 				pass
 
 			try:
-				self.pages[value].visible = True
+				self.get_page(value).visible = True
 			except KeyError:
 				raise KeyError(f'Page \"{value}\" not found.')
 			else:
@@ -1737,24 +1792,91 @@ class PageManager:
 
 		self.current_page = self.previous_page
 
-	def add_page(self, name: str, page: Page, overwrite: bool=True) -> None:
+	def add_page(self, name: str, page: Union[Page, Callable[[], Page]], 
+		overwrite: bool=True) -> None:
 		"""Add a page to the page manager.
 
 		Args:
 			name (str): The name of the page.
-			page (Page): The page to be added.
+			page (Union[Page, Callable[[], Page]]): The page to be added, or 
+			a factory building it the first time it is shown.
 			overwrite (bool): Overwrite page with same name if True. 
 			Defaults to True.
 		"""
 
-		if overwrite:
+		if not overwrite and (name in self.pages or name in self.factories):
+			raise ValueError(
+				f'Page with name \"{page}\" already exists. Consider setting overwrite to True to overwrite page with same name.')
+
+		self.pages.pop(name, None)
+		self.factories.pop(name, None)
+		if isinstance(page, Page):
 			self.pages[name] = page
 		else:
-			if name in self.pages:
-				raise ValueError(
-					f'Page with name \"{page}\" already exists. Consider setting overwrite to True to overwrite page with same name.')
-			else:
-				self.pages[name] = page
+			self.factories[name] = page
+
+	def get_page(self, name: str) -> Page:
+		"""Get a page, building it first if it was added as a factory.
+
+		Args:
+			name (str): The name of the page.
+
+		Returns:
+			Page: The page.
+		"""
+
+		page = self.pages.get(name)
+		if page is None:
+			try:
+				factory = self.factories.pop(name)
+			except KeyError:
+				raise KeyError(f'Page \"{name}\" not found.')
+			page = self.pages[name] = factory()
+		return page
+
+	def show(self, name: str, record: Optional[data.DataLoader]=None) -> Page:
+		"""Show a profile page bound to a record. There is one page of each 
+		kind, so it is rebound with load instead of being built again.
+
+		Args:
+			name (str): The name of the page.
+			record (data.DataLoader): The record, or None for a new one. 
+			Defaults to None.
+
+		Returns:
+			Page: The page.
+		"""
+
+		page = self.get_page(name)
+		page.load(record)
+		self.current_page = name
+		return page
+
+	def prewarm(self, widget: tk.Misc, names: Iterable[str]=None, 
+		delay: int=500) -> None:
+		"""Build pages added as factories while the app is idle, one at a 
+		time, so they show at once when first navigated to.
+
+		Args:
+			widget (tk.Misc): Any widget, to schedule the building on.
+			names (Iterable[str]): The pages to build. Defaults to every 
+			page not built yet.
+			delay (int): Milliseconds to wait before starting. Defaults to 
+			500.
+		"""
+
+		names = list(self.factories if names is None else names)
+
+		def build() -> None:
+			while names:
+				name = names.pop(0)
+				if name in self.factories:
+					self.get_page(name)
+					break
+			if names:
+				widget.after_idle(build)
+
+		widget.after(delay, lambda: widget.after_idle(build))
 
 	def del_page(self, name: str) -> None:
 		"""Remove a page from the page manager.
@@ -1762,11 +1884,267 @@ class PageManager:
 		Args:
 			name (str): The name of the page to be removed.
 		"""
-		try:
-			self.pages.pop(name)
-		except KeyError:
+		if self.pages.pop(name, None) is None and self.factories.pop(name, None) is None:
 			raise KeyError(f'Page \"{name}\" not found.')
 
+class MappedRows:
+	"""The rows of a VirtualList made from a sequence of items as they are 
+	shown, so they are never all made at once."""
+
+	def __init__(self, items: Sequence[Any], label: Callable[[Any], str]) -> None:
+		"""
+		Args:
+			items (Sequence[Any]): The items.
+			label (Callable[[Any], str]): Makes the row of an item.
+		"""
+
+		self.items = items
+		self.label = label
+
+	def __len__(self) -> int:
+		return len(self.items)
+
+	def __getitem__(self, index: int) -> str:
+		return self.label(self.items[index])
+
+class VirtualList(tk.Listbox):
+	"""A Listbox that only holds the rows that fit in it, pulling them from a 
+	sequence of rows as it is scrolled, so it stays fast with any number of 
+	them. Anything with __len__ and __getitem__ may be given as the rows, 
+	such as a MappedRows.
+
+	It scrolls through yview and yscrollcommand like a Listbox, so it is 
+	used with a Scrollbar the same way. Indexes given to and returned by 
+	curselection, selection_set, get and see are those of the rows.
+	"""
+
+	def __init__(self, master: tk.Widget, rows: Sequence[str]=(), 
+		yscrollcommand: Optional[Callable[..., Any]]=None, **kwargs) -> None:
+
+		super().__init__(master, **kwargs)
+		self.rows = rows
+		self.yscrollcommand = yscrollcommand
+		self._top = 0
+		self._visible = 1
+		self._selected: Optional[int] = None
+
+		self.bind('<Configure>', lambda event: self._render())
+		self.bind('<<ListboxSelect>>', self._select, add='+')
+		self.bind('<MouseWheel>', self._wheel)
+		self.bind('<Button-4>', self._wheel)
+		self.bind('<Button-5>', self._wheel)
+		for key, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', -2), ('<Next>', 2)):
+			self.bind(key, lambda event, step=step: self._key(step))
+
+	def set_rows(self, rows: Sequence[str]) -> None:
+		"""Show other rows, scrolled back to the top and with nothing selected.
+
+		Args:
+			rows (Sequence[str]): The rows.
+		"""
+
+		self.rows = rows
+		self._top = 0
+		self._selected = None
+		self._render()
+
+	def yview(self, *args) -> Optional[Tuple[float, float]]:
+
+		if not args:
+			return self._fractions()
+		if args[0] == 'moveto':
+			self._scroll_to(round(float(args[1]) * len(self.rows)))
+		elif args[0] == 'scroll':
+			step = self._visible if args[2].startswith('page') else 1
+			self._scroll_to(self._top + int(args[1]) * step)
+
+	def see(self, index: int) -> None:
+
+		if index < self._top:
+			self._scroll_to(index)
+		elif index >= self._top + self._visible:
+			self._scroll_to(index - self._visible + 1)
+
+	def curselection(self) -> Tuple[int, ...]:
+		return () if self._selected is None else (self._selected,)
+
+	def selection_set(self, first: int, last: Optional[int]=None) -> None:
+
+		self._selected = first
+		self._render()
+
+	def selection_clear(self, first: int=0, last: Optional[int]=None) -> None:
+
+		self._selected = None
+		self._render()
+
+	def get(self, first: int, last: Optional[int]=None) -> str:
+		return self.rows[first]
+
+	def size(self) -> int:
+		return len(self.rows)
+
+	def _scroll_to(self, top: int) -> None:
+
+		top = max(0, min(top, len(self.rows) - self._visible))
+		if top != self._top:
+			self._top = top
+			self._render()
+
+	def _fractions(self) -> Tuple[float, float]:
+
+		if not self.rows:
+			return 0.0, 1.0
+		return self._top / len(self.rows), \
+			min(1.0, (self._top + self._visible) / len(self.rows))
+
+	def _render(self) -> None:
+		"""Fill the Listbox with the rows that fit in it."""
+
+		#	Each line is the height of the font plus a pixel and the selection border
+		line = int(self.tk.call('font', 'metrics', self.cget('font'), '-linespace')) + \
+			1 + 2 * int(self.cget('selectborderwidth'))
+		inset = 2 * (int(self.cget('bd')) + int(self.cget('highlightthickness')))
+		self._visible = max(1, (self.winfo_height() - inset) // line)
+		self._top = max(0, min(self._top, len(self.rows) - self._visible))
+
+		end = min(self._top + self._visible, len(self.rows))
+		super().delete(0, 'end')
+		if end > self._top:
+			super().insert('end', *[self.rows[i] for i in range(self._top, end)])
+		if self._selected is not None and self._top <= self._selected < end:
+			super().selection_set(self._selected - self._top)
+
+		if self.yscrollcommand is not None:
+			self.yscrollcommand(*self._fractions())
+
+	def _select(self, event=None) -> None:
+
+		selection = super().curselection()
+		if selection:
+			self._selected = self._top + selection[0]
+
+	def _wheel(self, event) -> str:
+
+		if event.num == 4 or event.delta > 0:
+			self._scroll_to(self._top - 3)
+		else:
+			self._scroll_to(self._top + 3)
+		return 'break'
+
+	def _key(self, step: int) -> str:
+
+		if abs(step) == 2:
+			step = step // 2 * self._visible
+		if self._selected is None:
+			self._selected = self._top
+		else:
+			self._selected = max(0, min(self._selected + step, len(self.rows) - 1))
+		self.see(self._selected)
+		self._render()
+		self.event_generate('<<ListboxSelect>>')
+		return 'break'
+
+class Theme:
+	"""The fonts shared by every widget. Widgets are bound to a named font 
+	once, so changing the theme only reconfigures the fonts, and Tk updates 
+	the widgets using them.
+
+	Each theme gives the family of a few roles. Theme.font gets the font of a 
+	role kept at one size, such as the tooltips, and Theme.scaled the fonts 
+	DynamicResize scales, which are made once and shared by every page using 
+	the same sizes.
+	"""
+
+	#	Theme -> role -> family
+	THEMES: Dict[str, Dict[str, str]] = {
+		'default': {
+			'heading': 'Bahnschrift',
+			'body': 'Bahnschrift Light',
+			'tooltip': 'Bahnschrift Light'
+		},
+		'classic': {
+			'heading': 'Segoe UI Semibold',
+			'body': 'Segoe UI',
+			'tooltip': 'Segoe UI'
+		}
+	}
+	#	Role -> size, of the roles whose fonts are not scaled
+	SIZES: Dict[str, int] = {
+		'tooltip': 10
+	}
+
+	name: str = 'default'
+	_fonts: Dict[str, tkfont.Font] = {}
+	#	(role, fontsize, maxfontsize, minfontsize) -> font scaled from it
+	_scaled: Dict[Tuple[str, int, int, int], tkfont.Font] = {}
+
+	@classmethod
+	def font(cls, role: str) -> tkfont.Font:
+		"""Get the named font of a role kept at one size, made the first 
+		time it is needed.
+
+		Args:
+			role (str): The role, a key of SIZES such as 'tooltip'.
+
+		Returns:
+			tkfont.Font: The font.
+		"""
+
+		font = cls._fonts.get(role)
+		if font is None:
+			font = cls._fonts[role] = tkfont.Font(name=f'SDS{role.title()}Font', 
+				family=cls.family(role), size=cls.SIZES[role])
+		return font
+
+	@classmethod
+	def family(cls, role: str) -> str:
+		"""Get the family of a role in the current theme."""
+
+		return cls.THEMES[cls.name][role]
+
+	@classmethod
+	def scaled(cls, role: str, fontsize: int, maxfontsize: int, 
+		minfontsize: int) -> tkfont.Font:
+		"""Get the shared font scaled between two sizes in the family of a 
+		role, made the first time it is needed.
+
+		Args:
+			role (str): The role, such as 'body'.
+			fontsize (int): The fontsize it is scaled from.
+			maxfontsize (int): The maximum fontsize.
+			minfontsize (int): The minimum fontsize.
+
+		Returns:
+			tkfont.Font: The font.
+		"""
+
+		key = (role, fontsize, maxfontsize, minfontsize)
+		font = cls._scaled.get(key)
+		if font is None:
+			font = cls._scaled[key] = tkfont.Font(name='SDS{}Font{}_{}_{}'.format(
+				role.title(), fontsize, maxfontsize, minfontsize), family=cls.family(role), 
+				size=max(minfontsize, min(fontsize, maxfontsize)))
+		return font
+
+	@classmethod
+	def use(cls, name: str) -> None:
+		"""Change the theme, reconfiguring every font made so far.
+
+		Args:
+			name (str): The name of the theme, a key of THEMES.
+
+		Raises:
+			KeyError: If there is no such theme.
+		"""
+
+		roles = cls.THEMES[name]
+		cls.name = name
+		for role, font in cls._fonts.items():
+			font.configure(family=roles[role])
+		for (role, *_), font in cls._scaled.items():
+			font.configure(family=roles[role])
+
 #   From Erik Bethke from
 #   https://stackoverflow.com/questions/3221966/how-do-i-display-tts-in-tkinter
 #   Though I have added some modifications
@@ -1774,7 +2152,7 @@ class PageManager:
 #   - Add fade in and out
 class Tooltip:
 	def __init__(self, widget, *, bd=1, bg='#FFFFEA', pad=(6, 3, 6, 3), 
-		text='This is a tooltip', font=('Bahnschrift Light', 10), waittime=300, 
+		text='This is a tooltip', font=None, waittime=300, 
 		wraplength=260):
 
 		self.widget = widget
@@ -1819,7 +2197,7 @@ class Tooltip:
 
 		win = tk.Frame(self._tw, bg=self.bg, bd=self.bd, relief=tk.SOLID)
 		label = tk.Label(win, text=self.text, justify=tk.LEFT, 
-			bg=self.bg, wraplength=self.wraplength, font=self.font)
+			bg=self.bg, wraplength=self.wraplength, font=self.font or Theme.font('tooltip'))
 
 		label.grid(padx=(pad[0], pad[2]), pady=(pad[1], pad[3]), sticky=tk.NSEW)
 		win.grid()
@@ -1880,52 +2258,127 @@ class Tooltip:
 		return x1, y1
 
 class DynamicResize:
-	def __init__(self, parent: tk.Widget) -> None:
+	"""Scales the fonts of children with the size of a parent.
+
+	Children added with the same font and sizes, on any page, share one named 
+	font made by Theme.scaled, so a resize only reconfigures each font once 
+	and Tk updates the children. 
+	Bursts of Configure events while the parent is being resized are 
+	coalesced into one resize once they stop.
+	"""
+
+	#	Milliseconds to wait for the parent to stop resizing
+	DELAY = 50
+
+	def __init__(self, parent: tk.Widget, owner: Optional[tk.Widget]=None) -> None:
+		"""
+		Args:
+			parent (tk.Widget): The widget whose size the fonts follow.
+			owner (tk.Widget): The widget this belongs to, such as a page 
+			following the size of the window. The binding on the parent is 
+			removed when it is destroyed. Defaults to the parent.
+		"""
 
 		self.parent = parent
+		self.owner = owner if owner is not None else parent
 		self.children: Dict[tk.Widget, Dict[str, Any]] = {}
-		self.parent.bind('<Configure>', self)
+		#	(font, fontsize, maxfontsize, minfontsize) -> the shared font of the 
+		#	Theme its children use, scaled on resize
+		self.fonts: Dict[Tuple[str, int, int, int], tkfont.Font] = {}
+		self._size: Optional[Tuple[int, int]] = None
+		self._id = None
+		#	Added to the bindings of the parent, which several pages may follow
+		self._bind_id = self.parent.bind('<Configure>', self.schedule, add='+')
+		self.owner.bind('<Destroy>', self._destroyed, add='+')
 
-	def add_child(self, child: tk.Widget, font: str='Bahnschrift Light', 
+	def add_child(self, child: tk.Widget, font: str='body', 
 		fontsize: int=16, maxfontsize: int=20, minfontsize: int=6) -> None:
 		"""Add a child.
 
 		Args:
 			child (tk.Widget): The child to be added.
-			font (str): The font to be used. Defaults to 'Bahnschrift Light.'
+			font (str): The role in the Theme whose family is used. Defaults 
+			to 'body'.
 			fontsize (int): The fontsize to scale the child from. Defaults to 
 			16.
 			maxfontsize (int): The maximum fontsize. Defaults to 20.
 			minfontsize (int): The minimum fontsize. Defaults to 6.
-			overwrite (bool): Determines whether to overwrite an existing child
-			or not. Defaults to True
 		"""
-			
+
+		key = (font, fontsize, maxfontsize, minfontsize)
+		named = self.fonts.get(key)
+		if named is None:
+			named = self.fonts[key] = Theme.scaled(*key)
+
 		self.children[child] = {
 			'font': font,
 			'fontsize': fontsize,
 			'maxfontsize': maxfontsize,
-			'minfontsize': minfontsize
+			'minfontsize': minfontsize,
+			'named': named
 		}
+		try:
+			child.config(font=named)
+		except tk.TclError:
+			pass
 
 	def del_child(self, child: tk.Widget) -> None:
 
 		if self.children.pop(child, None) is None:
 			raise KeyError(f'Child not in children.')
 
+	def unbind(self) -> None:
+		"""Stop following the size of the parent, keeping the other bindings 
+		on it."""
+
+		if self._bind_id is None:
+			return
+		try:
+			if self._id is not None:
+				self.parent.after_cancel(self._id)
+			#	Misc.unbind with a funcid drops every binding of the sequence
+			script = self.parent.bind('<Configure>')
+			self.parent.bind('<Configure>', '\n'.join(line for line in 
+				script.split('\n') if self._bind_id not in line))
+			self.parent.deletecommand(self._bind_id)
+		except tk.TclError:
+			#	The parent was destroyed along with its bindings
+			pass
+		self._id = None
+		self._bind_id = None
+
+	def _destroyed(self, event) -> None:
+
+		if event.widget is self.owner:
+			self.unbind()
+
+	def schedule(self, event=None) -> None:
+		"""Resize once the parent stops changing size. Configure events of 
+		other widgets, which reach the parent if it is a window, are ignored.
+		"""
+
+		if event is not None:
+			if event.widget is not self.parent:
+				return
+			size = (event.width, event.height)
+			if size == self._size:
+				return
+			self._size = size
+
+		if self._id is not None:
+			self.parent.after_cancel(self._id)
+		self._id = self.parent.after(self.DELAY, self)
+
 	def __call__(self, _=None) -> None:
-		
-		for child, values in self.children.items():
-			try:
-				if self.parent.winfo_height() > self.parent.winfo_width():
-					ratio = (self.parent.winfo_width()/self.parent.winfo_screenwidth())
-				else:
-					ratio = (self.parent.winfo_height()/self.parent.winfo_screenheight())
-				fontsize = round(ratio * values['fontsize'])
-				if fontsize > values['maxfontsize']:
-					fontsize = values['maxfontsize']
-				elif fontsize < values['minfontsize']:
-					fontsize = values['minfontsize']
-				child.config(font=(values['font'], fontsize))
-			except Exception:
-				continue
+
+		self._id = None
+		width, height = self.parent.winfo_width(), self.parent.winfo_height()
+		if height > width:
+			ratio = width/self.parent.winfo_screenwidth()
+		else:
+			ratio = height/self.parent.winfo_screenheight()
+
+		for (_, fontsize, maxfontsize, minfontsize), named in self.fonts.items():
+			size = max(minfontsize, min(round(ratio * fontsize), maxfontsize))
+			if int(named.cget('size')) != size:
+				named.configure(size=size)
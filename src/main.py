@@ -1,32 +1,82 @@
 
 #   Libraries
 import sys
+
+import misc
+
+#   Started before the other imports so they are timed too
+if __name__ == '__main__' and '--profile-startup' in sys.argv[1:]:
+	misc.StartupProfile.start()
+
+import os
+import queue
+import threading
+import time
 import tkinter as tk
+from tkinter import messagebox as msgbox
+from typing import Iterable
 
 import constants
 import data
 import gui
-import misc
+import storage
+import thumbnails
 
 
 #   Code 
 class App(tk.Tk):
-	def __init__(self) -> None:
+	#	Records handed to the Tk thread at a time while loading in the background
+	LOAD_CHUNK = 500
+	#	Milliseconds between checks for loaded records, and the most to spend 
+	#	on them in one check
+	LOAD_POLL = 50
+	LOAD_BUDGET = 30
+	#	Milliseconds between checks for finished saves
+	SAVE_POLL = 100
 
-		super().__init__()
+	def __init__(self) -> None:
 
-		self.sectionloader = data.SectionLoader(constants.PATHS.SECTIONS.value)
-		self.studentloader = data.StudentLoader(constants.PATHS.STUDENTS.value)
-		self.teacherloader = data.TeacherLoader(constants.PATHS.TEACHERS.value)
+		with misc.StartupProfile.step('Tk'):
+			super().__init__()
+		self.loading = False
+		self._loaded = queue.Queue()
+		self._refresh_after_load = set()
+		self.saves = data.SaveQueue()
+		self.thumbnails = thumbnails.ThumbnailCache(constants.PATHS.THUMBNAILS.value)
+
+		with misc.StartupProfile.step('Storage'):
+			if constants.DEFAULT_SETTINGS.STORAGE.value == 'sqlite':
+				self.use_database(constants.PATHS.DATABASE.value)
+			if constants.DEFAULT_SETTINGS.JOURNAL.value:
+				data.DataLoader.storage = storage.JournalStorage(data.DataLoader.storage, 
+					constants.PATHS.JOURNAL.value)
+
+		gui.Theme.use(constants.DEFAULT_SETTINGS.THEME.value)
+
+		self.references = data.References()
+		self.sectionloader = data.SectionLoader(constants.PATHS.SECTIONS.value, 
+			references=self.references)
+		self.studentloader = data.StudentLoader(constants.PATHS.STUDENTS.value, 
+			references=self.references)
+		self.teacherloader = data.TeacherLoader(constants.PATHS.TEACHERS.value, 
+			references=self.references)
 
 		self.pagemng = gui.PageManager()
-		self.homepage = gui.HomePage(self)
-		self.newpage = gui.NewPage(self)
-		self.openpage = gui.OpenPage(self)
+		with misc.StartupProfile.step('HomePage'):
+			self.homepage = gui.HomePage(self)
 
 		self.pagemng.add_page('homepage', self.homepage)
-		self.pagemng.add_page('newpage', self.newpage)
-		self.pagemng.add_page('openpage', self.openpage)
+		#	Built the first time they are shown, or once the app is idle
+		timed = misc.StartupProfile.timed
+		self.pagemng.add_page('newpage', timed('NewPage', lambda: gui.NewPage(self)))
+		self.pagemng.add_page('openpage', timed('OpenPage', lambda: gui.OpenPage(self)))
+		#	One of each, rebound to whichever record is opened
+		self.pagemng.add_page('studentpage', 
+			timed('StudentProfilePage', lambda: gui.StudentProfilePage(self)))
+		self.pagemng.add_page('teacherpage', 
+			timed('TeacherProfilePage', lambda: gui.TeacherProfilePage(self)))
+		self.pagemng.add_page('sectionpage', 
+			timed('SectionProfilePage', lambda: gui.SectionProfilePage(self)))
 
 		w = round((self.winfo_screenwidth()/5)*4)
 		h = round((self.winfo_screenheight()/5)*4)
@@ -34,7 +84,14 @@ class App(tk.Tk):
 		y = round((self.winfo_screenheight()/2)-(h/2))
 		self.geometry(f'{w}x{h}+{x}+{y}')
 		self.pagemng.current_page = 'homepage'
-		self.reload_window()
+		self.title(constants.TITLE)
+		self.load_in_background()
+		self.after(self.SAVE_POLL, self._receive_saved)
+		self.pagemng.prewarm(self)
+
+		#	Reported once the window is up and idle
+		if misc.StartupProfile.current is not None:
+			self.after(0, lambda: self.after_idle(misc.StartupProfile.current.report))
 
 		self.protocol('WM_DELETE_WINDOW', self.exit)
 		self.mainloop()
@@ -53,8 +110,117 @@ class App(tk.Tk):
 		self.studentloader.load()
 		self.teacherloader.load()
 
+	def load_in_background(self) -> None:
+		"""Load the records on a worker thread so the window shows at once. 
+		They are handed to the Tk thread in chunks, where the loaders are 
+		updated and the current page reloaded as they arrive."""
+
+		if self.loading:
+			return
+		self.loading = True
+		for loader in (self.sectionloader, self.studentloader, self.teacherloader):
+			loader.errors = {}
+		threading.Thread(target=self._load_worker, daemon=True).start()
+		self.after(self.LOAD_POLL, self._receive_loaded)
+
+	def _load_worker(self) -> None:
+		"""Read the records off the Tk thread. The loaders are only read 
+		here; everything that changes them is queued for _receive_loaded."""
+
+		try:
+			for loader in (self.sectionloader, self.studentloader, self.teacherloader):
+				manifest, changed = loader.changes()
+				for i in range(0, len(changed), self.LOAD_CHUNK):
+					chunk = changed[i:i + self.LOAD_CHUNK]
+					self._loaded.put((loader, list(zip(chunk, loader.construct_all(chunk))), None))
+				self._loaded.put((loader, [], manifest))
+		except Exception as e:
+			self._loaded.put(e)
+		self._loaded.put(None)
+
+	def _receive_loaded(self) -> None:
+		"""Merge the records loaded so far into the loaders, for as long as 
+		the budget allows, then check again later until loading is done."""
+
+		done = False
+		deadline = time.perf_counter() + self.LOAD_BUDGET/1000
+		while time.perf_counter() < deadline:
+			try:
+				item = self._loaded.get_nowait()
+			except queue.Empty:
+				break
+			if item is None:
+				done = True
+				break
+			if isinstance(item, Exception):
+				msgbox.showerror(constants.TITLE, f'Failed to load the records: {item}')
+				continue
+			loader, results, manifest = item
+			loader.merge(results)
+			if manifest is not None:
+				loader.finish(manifest)
+
+		if done:
+			self.loading = False
+			misc.StartupProfile.mark('Records loaded')
+			if self._refresh_after_load:
+				self.refresh_loaders(self._refresh_after_load)
+				self._refresh_after_load.clear()
+		else:
+			self.after(self.LOAD_POLL, self._receive_loaded)
+		self.pagemng.pages[self.pagemng.current_page].reload_page()
+
+	def _receive_saved(self) -> None:
+		"""Refresh the records written by the save queue and tell the pages 
+		that saved them, then check again later."""
+
+		while True:
+			try:
+				paths, error, callbacks = self.saves.done.get_nowait()
+			except queue.Empty:
+				break
+			if paths:
+				self.refresh_loaders(paths)
+			for callback in callbacks:
+				callback(error)
+		self.after(self.SAVE_POLL, self._receive_saved)
+
+	def refresh_loaders(self, paths: Iterable[str]) -> None:
+		"""Bring only the records at some paths up to date, such as the ones 
+		written by a data.Transaction. While loading in the background, they 
+		are refreshed once it is done instead.
+
+		Args:
+			paths (Iterable[str]): The paths of the records.
+		"""
+
+		paths = list(paths)
+		if self.loading:
+			self._refresh_after_load.update(paths)
+			return
+		self.sectionloader.refresh(paths)
+		self.studentloader.refresh(paths)
+		self.teacherloader.refresh(paths)
+
+	def use_database(self, path: str) -> None:
+		"""Keep the records in a database, copying the pickle files into it 
+		the first time it is created.
+
+		Args:
+			path (str): The path of the database.
+		"""
+
+		new = not os.path.exists(path)
+		data.DataLoader.storage = storage.SQLiteStorage(path)
+		if new:
+			data.DataLoader.storage.migrate((constants.PATHS.SECTIONS.value, 
+				constants.PATHS.STUDENTS.value, constants.PATHS.TEACHERS.value))
+
 	def exit(self) -> None:
 
+		self.saves.flush()
+		if isinstance(data.DataLoader.storage, storage.JournalStorage):
+			data.DataLoader.storage.close()
 		self.destroy()
 
 if __name__ == '__main__':
@@ -1,7 +1,11 @@
 #   Provides miscellaneous functionality.
 
 #   Libraries
-from typing import Optional, Tuple
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
 
 
 #   Code
@@ -32,3 +36,118 @@ def convert_blank(value: str) -> Optional[str]:
     except AttributeError:
         return None
     return value
+
+class StartupProfile:
+    """Times what startup spends on each import and step, for the 
+    --profile-startup option of main.py.
+
+    Imports are timed by wrapping __import__, so only the ones after start()
+    are seen. The time of an import excludes the imports it makes itself.
+    """
+
+    #   The profile being recorded, if any
+    current: Optional['StartupProfile'] = None
+
+    def __init__(self) -> None:
+
+        self.started = time.perf_counter()
+        #   Module -> seconds spent importing it
+        self.imports: Dict[str, float] = {}
+        #   (step, seconds spent on it, seconds since start when it ended)
+        self.steps: List[Tuple[str, float, float]] = []
+        self.reported = False
+        self._import = builtins.__import__
+        #   Seconds spent in the imports made by each import in progress
+        self._nested: List[float] = []
+
+    @classmethod
+    def start(cls) -> 'StartupProfile':
+        """Start recording, timing every import from now on.
+
+        Returns:
+            StartupProfile: The profile.
+        """
+
+        profile = cls.current = cls()
+        builtins.__import__ = profile._timed_import
+        return profile
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+
+        if level or name in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.imports[name] = self.imports.get(name, 0.0) + elapsed - nested
+
+    @classmethod
+    @contextmanager
+    def step(cls, name: str) -> Iterator[None]:
+        """Time a step of startup, if a profile is being recorded. Steps 
+        after the report are printed as they end.
+
+        Args:
+            name (str): The name of the step.
+        """
+
+        profile = cls.current
+        if profile is None:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            profile.steps.append((name, end - start, end - profile.started))
+            if profile.reported:
+                print(f'{name:<40}{(end - start)*1000:>9.1f} ms  '
+                    f'(at {(end - profile.started)*1000:.0f} ms)', file=sys.stderr)
+
+    @classmethod
+    def mark(cls, name: str) -> None:
+        """Note when something happened, such as the records finishing 
+        loading, if a profile is being recorded."""
+
+        with cls.step(name):
+            pass
+
+    @classmethod
+    def timed(cls, name: str, function: Callable) -> Callable:
+        """Wrap a function so each call is timed as a step."""
+
+        def wrapper(*args, **kwargs):
+            with cls.step(name):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def report(self, file: Optional[TextIO]=None, top: int=15) -> None:
+        """Print the slowest imports and every step so far, and stop timing
+        imports.
+
+        Args:
+            file (TextIO): Where to print. Defaults to sys.stderr.
+            top (int): How many imports to print. Defaults to 15.
+        """
+
+        file = file or sys.stderr
+        builtins.__import__ = self._import
+        self.reported = True
+
+        total = time.perf_counter() - self.started
+        print(f'Startup took {total*1000:.1f} ms', file=file)
+        print(f'Imports, {sum(self.imports.values())*1000:.1f} ms in all:', file=file)
+        for name, seconds in sorted(self.imports.items(), key=lambda item: -item[1])[:top]:
+            print(f'  {name:<38}{seconds*1000:>9.1f} ms', file=file)
+        print('Steps:', file=file)
+        for name, seconds, end in self.steps:
+            print(f'  {name:<38}{seconds*1000:>9.1f} ms  (at {end*1000:.0f} ms)', file=file)
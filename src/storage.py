@@ -0,0 +1,678 @@
+#   Handles where the records are kept
+
+#   Libraries
+import os
+import pickle
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+#   Code
+class Storage(ABC):
+	"""Where the pickled records live. Records are addressed by their path,
+	even when the backend does not keep them as files."""
+
+	@abstractmethod
+	def read(self, path: str) -> bytes:
+		"""Read a record.
+
+		Args:
+			path (str): The path of the record.
+
+		Returns:
+			bytes: The pickled record.
+
+		Raises:
+			FileNotFoundError: If the record does not exist.
+		"""
+
+	@abstractmethod
+	def read_summary(self, path: str) -> Dict[str, Any]:
+		"""Read the summary of a record without reading all of it.
+
+		Args:
+			path (str): The path of the record.
+
+		Returns:
+			Dict[str, Any]: The fields of the summary.
+
+		Raises:
+			FileNotFoundError: If the record does not exist.
+		"""
+
+	@abstractmethod
+	def write(self, path: str, s: bytes, record: Any=None) -> None:
+		"""Write a record, replacing the old one if there is any.
+
+		Args:
+			path (str): The path of the record.
+			s (bytes): The pickled record.
+			record (Any): The record itself, whose summary is stored
+			along with it. Defaults to None.
+		"""
+
+	@abstractmethod
+	def delete(self, path: str) -> None:
+		"""Delete a record.
+
+		Args:
+			path (str): The path of the record.
+
+		Raises:
+			FileNotFoundError: If the record does not exist.
+		"""
+
+	@abstractmethod
+	def scan(self, directory: str) -> Dict[str, Tuple[int, int]]:
+		"""Get the signature of every record in a directory without reading
+		them. The signature changes whenever the record is written.
+
+		Args:
+			directory (str): The directory to scan.
+
+		Returns:
+			Dict[str, Tuple[int, int]]: The mtime and size of each record,
+			keyed by path.
+		"""
+
+	@abstractmethod
+	def exists(self, path: str) -> bool:
+		"""Check if a record exists.
+
+		Args:
+			path (str): The path of the record.
+		"""
+
+	@abstractmethod
+	def signature(self, path: str) -> Optional[Tuple[int, int]]:
+		"""Get the signature of a single record. See scan.
+
+		Args:
+			path (str): The path of the record.
+
+		Returns:
+			Optional[Tuple[int, int]]: The mtime and size of the record, or 
+			None if it does not exist.
+		"""
+
+	def apply(self, ops: List[Tuple]) -> None:
+		"""Apply several writes, moves and deletes together. Each operation is 
+		the name of the method followed by its arguments, such as 
+		('write', path, s, record).
+
+		Args:
+			ops (List[Tuple]): The operations, applied in order.
+		"""
+
+		for op, *args in ops:
+			getattr(self, op)(*args)
+
+	def move(self, old: str, new: str, s: bytes, record: Any=None) -> None:
+		"""Move a record to a new path, writing the new one before deleting
+		the old one so a crash never loses it.
+
+		Args:
+			old (str): The current path of the record.
+			new (str): The new path of the record.
+			s (bytes): The pickled record.
+			record (Any): The record itself. Defaults to None.
+
+		Raises:
+			FileNotFoundError: If the record does not exist.
+		"""
+
+		if not self.exists(old):
+			raise FileNotFoundError(old)
+		self.write(new, s, record)
+		if new != old:
+			self.delete(old)
+
+class FileStorage(Storage):
+	"""Keeps each record in its own pickle file. The summary of the record is
+	written before it, after a marker and its length, so it can be read
+	alone. Files without it are still read."""
+
+	HEADER = b'SDS\x01'
+
+	def read(self, path: str) -> bytes:
+		with open(path, 'rb') as f:
+			s = f.read()
+		if s.startswith(self.HEADER):
+			start = len(self.HEADER) + 4
+			return s[start + int.from_bytes(s[len(self.HEADER):start], 'little'):]
+		return s
+
+	def read_summary(self, path: str) -> Dict[str, Any]:
+		with open(path, 'rb') as f:
+			head = f.read(len(self.HEADER) + 4)
+			if head.startswith(self.HEADER):
+				size = int.from_bytes(head[len(self.HEADER):], 'little')
+				return pickle.loads(f.read(size))
+			return pickle.loads(head + f.read()).summary()
+
+	def write(self, path: str, s: bytes, record: Any=None) -> None:
+		#   Written beside it first so the old file is intact until replaced
+		with open(path + '.tmp', 'wb') as f:
+			if record is not None:
+				header = pickle.dumps(record.summary())
+				f.write(self.HEADER + len(header).to_bytes(4, 'little') + header)
+			f.write(s)
+		os.replace(path + '.tmp', path)
+
+	@staticmethod
+	def _sync_directory(directory: str) -> None:
+		"""Flush the entries of a directory to the disk, where the platform
+		allows it."""
+
+		try:
+			fd = os.open(directory or '.', os.O_RDONLY)
+		except OSError:
+			return
+		try:
+			os.fsync(fd)
+		except OSError:
+			pass
+		finally:
+			os.close(fd)
+
+	def apply(self, ops: List[Tuple]) -> None:
+		#   Every new file is written and flushed to the disk beside the old
+		#   one first, so none is replaced until all of them are intact
+		staged = []
+		try:
+			for i, (op, *args) in enumerate(ops):
+				if op == 'delete':
+					staged.append((op, args[0], None, None))
+					continue
+				if op == 'move':
+					old, path, s, record = args
+					if not os.path.exists(old) and not any(o != 'delete' and p == old
+						for o, p, _, _ in staged):
+						raise FileNotFoundError(old)
+				else:
+					old = None
+					path, s, record = args
+				tmp = '%s.%d.tmp' % (path, i)
+				with open(tmp, 'wb') as f:
+					staged.append((op, path, tmp, old))
+					if record is not None:
+						header = pickle.dumps(record.summary())
+						f.write(self.HEADER + len(header).to_bytes(4, 'little') + header)
+					f.write(s)
+					f.flush()
+					os.fsync(f.fileno())
+		except BaseException:
+			for _, _, tmp, _ in staged:
+				if tmp is not None and os.path.exists(tmp):
+					os.remove(tmp)
+			raise
+
+		directories = {os.path.dirname(path) for _, path, _, old in staged}
+		directories.update(os.path.dirname(old) for _, _, _, old in staged 
+			if old is not None)
+		for directory in directories:
+			self._sync_directory(directory)
+		for op, path, tmp, old in staged:
+			if op == 'delete':
+				os.remove(path)
+				continue
+			os.replace(tmp, path)
+			if op == 'move' and old != path:
+				os.remove(old)
+		for directory in directories:
+			self._sync_directory(directory)
+
+	def delete(self, path: str) -> None:
+		os.remove(path)
+
+	def scan(self, directory: str) -> Dict[str, Tuple[int, int]]:
+		manifest = {}
+		with os.scandir(directory) as entries:
+			for entry in entries:
+				if entry.name.endswith('.pkl') and entry.is_file():
+					stat = entry.stat()
+					manifest[os.path.join(directory, entry.name)] = \
+						(stat.st_mtime_ns, stat.st_size)
+		return dict(sorted(manifest.items()))
+
+	def exists(self, path: str) -> bool:
+		return os.path.exists(path)
+
+	def signature(self, path: str) -> Optional[Tuple[int, int]]:
+		try:
+			stat = os.stat(path)
+		except FileNotFoundError:
+			return None
+		return (stat.st_mtime_ns, stat.st_size)
+
+class SQLiteStorage(Storage):
+	"""Keeps every record in a single SQLite database, with the fields used
+	for listing and searching stored as indexed columns."""
+
+	SCHEMA = '''
+		CREATE TABLE IF NOT EXISTS records (
+			path TEXT PRIMARY KEY,
+			directory TEXT NOT NULL,
+			kind TEXT,
+			lname TEXT,
+			fname TEXT,
+			mname TEXT,
+			name TEXT,
+			lrn TEXT,
+			grade TEXT,
+			section TEXT,
+			uid TEXT,
+			mtime INTEGER NOT NULL,
+			size INTEGER NOT NULL,
+			data BLOB NOT NULL
+		);
+		CREATE INDEX IF NOT EXISTS records_directory ON records (directory);
+		CREATE INDEX IF NOT EXISTS records_names ON records (lname, fname, mname);
+		CREATE INDEX IF NOT EXISTS records_name ON records (name);
+		CREATE INDEX IF NOT EXISTS records_lrn ON records (lrn);
+		CREATE INDEX IF NOT EXISTS records_grade ON records (grade);
+		CREATE INDEX IF NOT EXISTS records_section ON records (section);
+	'''
+
+	def __init__(self, path: str) -> None:
+		self.path = path
+		self._lock = threading.RLock()
+		#   Imported here so the pickle backend does not load it
+		import sqlite3
+
+		self._conn = sqlite3.connect(path, check_same_thread=False)
+		self._conn.executescript(self.SCHEMA)
+		#   Databases made before records had IDs
+		columns = {row[1] for row in self._conn.execute('PRAGMA table_info(records)')}
+		if 'uid' not in columns:
+			with self._conn:
+				self._conn.execute('ALTER TABLE records ADD COLUMN uid TEXT')
+		self._conn.execute('CREATE INDEX IF NOT EXISTS records_uid ON records (uid)')
+
+	COLUMNS = ('kind', 'lname', 'fname', 'mname', 'name', 'lrn', 'grade', 'section', 'uid')
+
+	@classmethod
+	def columns(cls, record: Any) -> Dict[str, Optional[str]]:
+		"""Extract the searchable columns of a record from its summary.
+
+		Args:
+			record (Any): The record to extract the columns from.
+
+		Returns:
+			Dict[str, Optional[str]]: The value of each column.
+		"""
+
+		summary = record.summary()
+		return {column: summary.get(column) for column in cls.COLUMNS}
+
+	def read(self, path: str) -> bytes:
+		with self._lock:
+			row = self._conn.execute(
+				'SELECT data FROM records WHERE path = ?', (path,)).fetchone()
+		if row is None:
+			raise FileNotFoundError(path)
+		return row[0]
+
+	def read_summary(self, path: str) -> Dict[str, Any]:
+		with self._lock:
+			row = self._conn.execute(
+				f'SELECT {", ".join(self.COLUMNS)} FROM records WHERE path = ?', 
+				(path,)).fetchone()
+		if row is None:
+			raise FileNotFoundError(path)
+		return {column: value for column, value in zip(self.COLUMNS, row) 
+			if value is not None}
+
+	def write(self, path: str, s: bytes, record: Any=None) -> None:
+		with self._lock, self._conn:
+			self._write(path, s, record)
+
+	def _write(self, path: str, s: bytes, record: Any) -> None:
+		if record is None:
+			record = pickle.loads(s)
+		columns = self.columns(record)
+		self._conn.execute('''
+			INSERT OR REPLACE INTO records (path, directory, kind, lname,
+				fname, mname, name, lrn, grade, section, uid, mtime, size, data)
+			VALUES (:path, :directory, :kind, :lname, :fname, :mname, :name,
+				:lrn, :grade, :section, :uid, :mtime, :size, :data)''',
+			{**columns, 'path': path, 'directory': os.path.dirname(path),
+			'mtime': time.time_ns(), 'size': len(s), 'data': s})
+
+	def delete(self, path: str) -> None:
+		with self._lock, self._conn:
+			self._delete(path)
+
+	def scan(self, directory: str) -> Dict[str, Tuple[int, int]]:
+		with self._lock:
+			rows = self._conn.execute(
+				'SELECT path, mtime, size FROM records WHERE directory = ? ORDER BY path',
+				(directory,)).fetchall()
+		return {path: (mtime, size) for path, mtime, size in rows}
+
+	def exists(self, path: str) -> bool:
+		with self._lock:
+			return self._conn.execute(
+				'SELECT 1 FROM records WHERE path = ?', (path,)).fetchone() is not None
+
+	def signature(self, path: str) -> Optional[Tuple[int, int]]:
+		with self._lock:
+			row = self._conn.execute(
+				'SELECT mtime, size FROM records WHERE path = ?', (path,)).fetchone()
+		return None if row is None else tuple(row)
+
+	def move(self, old: str, new: str, s: bytes, record: Any=None) -> None:
+		with self._lock, self._conn:
+			self._move(old, new, s, record)
+
+	def _move(self, old: str, new: str, s: bytes, record: Any) -> None:
+		if not self.exists(old):
+			raise FileNotFoundError(old)
+		self._conn.execute('DELETE FROM records WHERE path = ?', (old,))
+		self._write(new, s, record)
+
+	def _delete(self, path: str) -> None:
+		if self._conn.execute('DELETE FROM records WHERE path = ?', (path,)).rowcount == 0:
+			raise FileNotFoundError(path)
+
+	def apply(self, ops: List[Tuple]) -> None:
+		#   All in one transaction, so either every operation is applied or none
+		with self._lock, self._conn:
+			for op, *args in ops:
+				getattr(self, '_' + op)(*args)
+
+	def migrate(self, directories: Iterable[str]) -> int:
+		"""Copy every pickle file in the directories into the database in a
+		single transaction. The pickle files are left untouched.
+
+		Args:
+			directories (Iterable[str]): The directories to migrate.
+
+		Returns:
+			int: The number of records migrated.
+		"""
+
+		source = FileStorage()
+		count = 0
+		with self._lock, self._conn:
+			for directory in directories:
+				if not os.path.isdir(directory):
+					continue
+				for path in source.scan(directory):
+					self._write(path, source.read(path), None)
+					count += 1
+		return count
+
+	def close(self) -> None:
+		with self._lock:
+			self._conn.close()
+
+class Summarized:
+	"""Stands in for a record whose summary is already known, for writing it
+	without unpickling it again."""
+
+	__slots__ = ('_summary',)
+
+	def __init__(self, summary: Dict[str, Any]) -> None:
+		self._summary = summary
+
+	def summary(self) -> Dict[str, Any]:
+		return self._summary
+
+class JournalStorage(Storage):
+	"""Wraps another storage, appending writes, moves and deletes to a journal
+	instead of applying them right away. Saving then costs one small append
+	whatever the size of the directory, and a crash never leaves a record half
+	written or lost between a delete and a write.
+
+	The journal is replayed when opened, and applied to the wrapped storage by
+	compact(), which runs in the background once the journal grows past
+	COMPACT_SIZE. Each entry is its length, a CRC32 and the pickled entry, so a
+	torn last entry is detected and dropped.
+	"""
+
+	COMPACT_SIZE = 4 * 1024 * 1024
+
+	def __init__(self, base: Storage, path: str, sync: bool=True) -> None:
+		"""
+		Args:
+			base (Storage): The storage the journal is applied to.
+			path (str): The path of the journal.
+			sync (bool): Flush every entry to the disk before returning.
+			Defaults to True.
+		"""
+
+		self.base = base
+		self.path = path
+		self.sync = sync
+		self._lock = threading.RLock()
+		self._compact_lock = threading.Lock()
+		self._compactor: Optional[threading.Thread] = None
+		#   Path -> (pickled record, summary, signature), or None if deleted
+		self._pending: Dict[str, Optional[Tuple[bytes, Dict[str, Any], Tuple[int, int]]]] = {}
+
+		#   A journal left over from a compaction that did not finish
+		old = self.path + '.old'
+		if os.path.exists(old):
+			self._replay(old)
+			self._replay(self.path)
+			self._rewrite()
+			os.remove(old)
+		else:
+			self._replay(self.path)
+
+		self._file = open(self.path, 'ab')
+		if self._pending:
+			self.compact_later()
+
+	def _replay(self, path: str) -> None:
+		try:
+			with open(path, 'rb') as f:
+				s = f.read()
+		except FileNotFoundError:
+			return
+
+		offset = 0
+		while offset + 8 <= len(s):
+			size = int.from_bytes(s[offset:offset + 4], 'little')
+			body = s[offset + 8:offset + 8 + size]
+			if len(body) < size or zlib.crc32(body) != int.from_bytes(
+				s[offset + 4:offset + 8], 'little'):
+				break
+			self._apply(pickle.loads(body))
+			offset += 8 + size
+
+		#   Drop the torn entry so new ones are not appended after it
+		if offset < len(s):
+			with open(path, 'r+b') as f:
+				f.truncate(offset)
+
+	def _rewrite(self) -> None:
+		"""Replace the journal with one entry for each pending record."""
+
+		with open(self.path + '.tmp', 'wb') as f:
+			for path, entry in self._pending.items():
+				if entry is None:
+					f.write(self._encode(('delete', path)))
+				else:
+					f.write(self._encode(('write', path, entry[0], entry[1])))
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(self.path + '.tmp', self.path)
+
+	@staticmethod
+	def _encode(entry: Tuple) -> bytes:
+		body = pickle.dumps(entry)
+		return len(body).to_bytes(4, 'little') + zlib.crc32(body).to_bytes(4, 'little') + body
+
+	def _apply(self, entry: Tuple) -> None:
+		op, *args = entry
+		if op == 'write':
+			path, s, summary = args
+			self._pending[path] = (s, summary, self._signature(s))
+		elif op == 'move':
+			old, new, s, summary = args
+			self._pending[new] = (s, summary, self._signature(s))
+			if old != new:
+				self._pending[old] = None
+		elif op == 'delete':
+			self._pending[args[0]] = None
+		elif op == 'batch':
+			for batched in args[0]:
+				self._apply(batched)
+
+	@staticmethod
+	def _signature(s: bytes) -> Tuple[int, int]:
+		"""Get the signature of a journaled record from its content, so it is 
+		the same every time the journal is replayed and the record is not read 
+		again on every start."""
+
+		return (zlib.crc32(s), len(s))
+
+	def _append(self, entry: Tuple) -> None:
+		with self._lock:
+			self._file.write(self._encode(entry))
+			self._file.flush()
+			if self.sync:
+				os.fsync(self._file.fileno())
+			self._apply(entry)
+			size = self._file.tell()
+		if size > self.COMPACT_SIZE:
+			self.compact_later()
+
+	@staticmethod
+	def _summarize(s: bytes, record: Any) -> Dict[str, Any]:
+		if record is None:
+			record = pickle.loads(s)
+		return record.summary()
+
+	def read(self, path: str) -> bytes:
+		with self._lock:
+			if path in self._pending:
+				entry = self._pending[path]
+				if entry is None:
+					raise FileNotFoundError(path)
+				return entry[0]
+		return self.base.read(path)
+
+	def read_summary(self, path: str) -> Dict[str, Any]:
+		with self._lock:
+			if path in self._pending:
+				entry = self._pending[path]
+				if entry is None:
+					raise FileNotFoundError(path)
+				return dict(entry[1])
+		return self.base.read_summary(path)
+
+	def write(self, path: str, s: bytes, record: Any=None) -> None:
+		self._append(('write', path, s, self._summarize(s, record)))
+
+	def move(self, old: str, new: str, s: bytes, record: Any=None) -> None:
+		with self._lock:
+			if not self.exists(old):
+				raise FileNotFoundError(old)
+			self._append(('move', old, new, s, self._summarize(s, record)))
+
+	def delete(self, path: str) -> None:
+		with self._lock:
+			if not self.exists(path):
+				raise FileNotFoundError(path)
+			self._append(('delete', path))
+
+	def apply(self, ops: List[Tuple]) -> None:
+		#   A single entry, so a single flush to the disk for all of them
+		entries = []
+		with self._lock:
+			for op, *args in ops:
+				if op == 'write':
+					path, s, record = args
+					entries.append(('write', path, s, self._summarize(s, record)))
+				elif op == 'move':
+					old, new, s, record = args
+					if not self.exists(old) and not any(e[0] == 'move' and e[2] == old 
+						for e in entries):
+						raise FileNotFoundError(old)
+					entries.append(('move', old, new, s, self._summarize(s, record)))
+				elif op == 'delete':
+					entries.append(('delete', args[0]))
+			self._append(('batch', entries))
+
+	def scan(self, directory: str) -> Dict[str, Tuple[int, int]]:
+		#   Held while scanning the wrapped storage too, so a record being
+		#   compacted is always found in one or the other
+		with self._lock:
+			manifest = self.base.scan(directory)
+			for path, entry in self._pending.items():
+				if os.path.dirname(path) != directory:
+					continue
+				if entry is None:
+					manifest.pop(path, None)
+				else:
+					manifest[path] = entry[2]
+		return dict(sorted(manifest.items()))
+
+	def exists(self, path: str) -> bool:
+		with self._lock:
+			if path in self._pending:
+				return self._pending[path] is not None
+			return self.base.exists(path)
+
+	def signature(self, path: str) -> Optional[Tuple[int, int]]:
+		with self._lock:
+			if path in self._pending:
+				entry = self._pending[path]
+				return None if entry is None else entry[2]
+			return self.base.signature(path)
+
+	def compact(self) -> None:
+		"""Apply the journal to the wrapped storage and empty it. Records 
+		saved meanwhile are kept for the next compaction.
+		"""
+
+		with self._compact_lock:
+			with self._lock:
+				if not self._pending:
+					return
+				snapshot = dict(self._pending)
+				self._file.close()
+				os.replace(self.path, self.path + '.old')
+				self._file = open(self.path, 'ab')
+
+			#   Applied as one batch, so the records are on the disk before the
+			#   old journal is removed
+			ops = []
+			for path, entry in snapshot.items():
+				if entry is None:
+					if self.base.exists(path):
+						ops.append(('delete', path))
+				else:
+					ops.append(('write', path, entry[0], Summarized(entry[1])))
+			self.base.apply(ops)
+
+			with self._lock:
+				for path, entry in snapshot.items():
+					if self._pending.get(path, entry) is entry:
+						self._pending.pop(path, None)
+				os.remove(self.path + '.old')
+
+	def compact_later(self) -> None:
+		"""Compact the journal on a background thread, unless it already is.
+		"""
+
+		with self._lock:
+			if self._compactor is not None and self._compactor.is_alive():
+				return
+			self._compactor = threading.Thread(target=self.compact, daemon=True)
+			self._compactor.start()
+
+	def close(self) -> None:
+		"""Compact the journal and close it."""
+
+		if self._compactor is not None:
+			self._compactor.join()
+		self.compact()
+		with self._lock:
+			self._file.close()
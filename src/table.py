@@ -0,0 +1,230 @@
+#   Keeps the students in columns for fast filtering and reports
+
+#   Libraries
+import itertools
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+try:
+	import numpy as np
+except ImportError:
+	np = None
+
+import data
+
+
+#   Code
+class StudentTable:
+	"""The fields of many students kept as columns, so filters and counts run
+	over whole columns at once instead of over each Student.
+
+	Filters return masks that are combined with & and |, and inverted with
+	invert(). A mask is a NumPy boolean array if NumPy is installed, and an
+	int used as a bitset, where bit i is row i, if it is not.
+	"""
+
+	#   Strings stored as codes into a list of their distinct values
+	ENCODED = ('grade_lvl', 'sex', 'section')
+	NUMERIC = ('sy_from', 'sy_to', 'bday')
+
+	def __init__(self, students: Iterable[data.Student]) -> None:
+
+		self.paths: List[str] = []
+		#   Column -> distinct values, the code of a value being its index
+		self.categories: Dict[str, List[Optional[str]]] = {c: [] for c in self.ENCODED}
+		codes = {c: {} for c in self.ENCODED}
+		columns = {c: [] for c in self.ENCODED + self.NUMERIC}
+
+		for student in students:
+			self.paths.append(student.path)
+			for column in self.ENCODED:
+				value = getattr(student, column, None)
+				code = codes[column].get(value)
+				if code is None:
+					code = codes[column][value] = len(self.categories[column])
+					self.categories[column].append(value)
+				columns[column].append(code)
+
+			sy = getattr(student, 'sy', None) or (None, None)
+			columns['sy_from'].append(self._int(sy[0]))
+			columns['sy_to'].append(self._int(sy[1]))
+			columns['bday'].append(self._int(getattr(student, 'bday', None)))
+
+		self._codes = codes
+		self._all = (1 << len(self.paths)) - 1
+		if np is not None:
+			self.columns = {c: np.array(v, dtype=np.int64) for c, v in columns.items()}
+		else:
+			self.columns = {c: array('q', v) for c, v in columns.items()}
+			#   Numeric column -> its rows sorted by value, and the sorted 
+			#   values, so a range is found by bisecting instead of a scan
+			self._order: Dict[str, List[int]] = {}
+			self._sorted: Dict[str, List[int]] = {}
+			for column in self.NUMERIC:
+				values = columns[column]
+				order = sorted(range(len(values)), key=values.__getitem__)
+				self._order[column] = order
+				self._sorted[column] = [values[row] for row in order]
+			#   Column -> code -> bitset of the rows holding it
+			self._bitsets: Dict[str, List[int]] = {}
+			for column in self.ENCODED:
+				bitsets = [0] * len(self.categories[column])
+				for row, code in enumerate(columns[column]):
+					bitsets[code] |= 1 << row
+				self._bitsets[column] = bitsets
+
+	@classmethod
+	def from_loader(cls, loader: data.StudentLoader) -> 'StudentTable':
+		"""Build a table from the items of a loader, loading the whole record
+		of each if the loader is lazy.
+
+		Args:
+			loader (data.StudentLoader): The loader of the students.
+
+		Returns:
+			StudentTable: The built table.
+		"""
+
+		return cls(loader.get(item) for item in loader.items)
+
+	@staticmethod
+	def _int(value: Any) -> int:
+		"""Convert a school year or birthday into an int, -1 if missing."""
+
+		if isinstance(value, date):
+			return value.toordinal()
+		try:
+			return int(value)
+		except (TypeError, ValueError):
+			return -1
+
+	@staticmethod
+	def _bit_count(mask: int) -> int:
+		"""Count the rows in a bitset. int.bit_count needs Python 3.10."""
+
+		return bin(mask).count('1')
+
+	def __len__(self) -> int:
+		return len(self.paths)
+
+	def eq(self, column: str, value: Any) -> Any:
+		"""Get the mask of the rows where a column is equal to a value.
+
+		Args:
+			column (str): The column.
+			value (Any): The value.
+		"""
+
+		if column in self.ENCODED:
+			return self.isin(column, (value,))
+		return self.between(column, value, value)
+
+	def isin(self, column: str, values: Iterable[Any]) -> Any:
+		"""Get the mask of the rows where an encoded column is one of several
+		values.
+
+		Args:
+			column (str): The column.
+			values (Iterable[Any]): The values.
+		"""
+
+		codes = [self._codes[column][v] for v in values if v in self._codes[column]]
+		if np is not None:
+			return np.isin(self.columns[column], codes)
+
+		mask = 0
+		for code in codes:
+			mask |= self._bitsets[column][code]
+		return mask
+
+	def between(self, column: str, low: Any=None, high: Any=None) -> Any:
+		"""Get the mask of the rows where a numeric column is within a range.
+		Both ends are included, and missing values never match.
+
+		Args:
+			column (str): The column.
+			low (Any): The lowest value, a date for bday. No limit if None.
+			high (Any): The highest value, a date for bday. No limit if None.
+		"""
+
+		low = 0 if low is None else self._int(low)
+		high = None if high is None else self._int(high)
+		values = self.columns[column]
+
+		if np is not None:
+			mask = values >= low
+			if high is not None:
+				mask &= values <= high
+			return mask
+
+		keys = self._sorted[column]
+		start = bisect_left(keys, low)
+		stop = len(keys) if high is None else bisect_right(keys, high)
+		bits = bytearray((len(values) + 7) // 8)
+		for row in itertools.islice(self._order[column], start, stop):
+			bits[row >> 3] |= 1 << (row & 7)
+		return int.from_bytes(bits, 'little')
+
+	def invert(self, mask: Any) -> Any:
+		"""Get the mask of the rows not in a mask."""
+
+		if np is not None:
+			return ~mask
+		return self._all & ~mask
+
+	def count(self, mask: Any=None) -> int:
+		"""Count the rows in a mask, or every row if None."""
+
+		if mask is None:
+			return len(self)
+		if np is not None:
+			return int(np.count_nonzero(mask))
+		return self._bit_count(mask)
+
+	def rows(self, mask: Any) -> List[str]:
+		"""Get the paths of the rows in a mask, in order."""
+
+		if np is not None:
+			return [self.paths[i] for i in np.flatnonzero(mask)]
+
+		paths = []
+		while mask:
+			low = mask & -mask
+			paths.append(self.paths[low.bit_length() - 1])
+			mask ^= low
+		return paths
+
+	def group_count(self, column: str, mask: Any=None) -> Dict[Union[str, int], int]:
+		"""Count the rows of each value of a column.
+
+		Args:
+			column (str): The column to group by.
+			mask (Any): Only count the rows in this mask. Defaults to None.
+
+		Returns:
+			Dict[Union[str, int], int]: The number of rows of each value that
+			has any.
+		"""
+
+		if column not in self.ENCODED:
+			values = self.columns[column]
+			if np is not None:
+				found, counts = np.unique(values if mask is None else values[mask],
+					return_counts=True)
+				return dict(zip(found.tolist(), counts.tolist()))
+			counts = {}
+			for row, value in enumerate(values):
+				if mask is None or mask >> row & 1:
+					counts[value] = counts.get(value, 0) + 1
+			return counts
+
+		categories = self.categories[column]
+		if np is not None:
+			codes = self.columns[column] if mask is None else self.columns[column][mask]
+			counts = np.bincount(codes, minlength=len(categories)).tolist()
+		else:
+			bitsets = self._bitsets[column]
+			counts = [self._bit_count(b if mask is None else b & mask) for b in bitsets]
+		return {value: count for value, count in zip(categories, counts) if count}
@@ -0,0 +1,133 @@
+#   Keeps small copies of the profile pictures so they are not decoded again
+
+#   Libraries
+import glob
+import hashlib
+import os
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, Tuple
+
+#   PIL is imported when the first thumbnail is needed, not at startup
+if TYPE_CHECKING:
+	from PIL import Image, ImageTk
+
+
+#   Code
+class ThumbnailCache:
+	"""Thumbnails of pictures, kept on disk so a picture is only decoded at
+	full size once, and the latest PhotoImages kept in memory.
+
+	A thumbnail on disk is keyed by the path, mtime and size of its picture,
+	so it is made again whenever the picture changes.
+	"""
+
+	def __init__(self, directory: str, size: Tuple[int, int]=(150, 150),
+		max_bytes: int=16 * 1024 * 1024) -> None:
+		"""
+		Args:
+			directory (str): Where the thumbnails are kept.
+			size (Tuple[int, int]): The size of the thumbnails. Defaults to
+			(150, 150).
+			max_bytes (int): The most memory the PhotoImages in memory may
+			take, counting 4 bytes a pixel. Defaults to 16 MiB.
+		"""
+
+		self.directory = directory
+		self.size = size
+		self.max_bytes = max_bytes
+		#   Key -> PhotoImage, the least recently used first
+		self._images: 'OrderedDict[str, ImageTk.PhotoImage]' = OrderedDict()
+		self._bytes = 0
+
+	def get(self, path: str) -> 'ImageTk.PhotoImage':
+		"""Get the thumbnail of a picture, making it if needed. Must be
+		called on the Tk thread.
+
+		Args:
+			path (str): The path of the picture.
+
+		Returns:
+			ImageTk.PhotoImage: The thumbnail.
+
+		Raises:
+			OSError: If the picture cannot be read.
+		"""
+
+		key = self.key(path)
+		image = self._images.get(key)
+		if image is not None:
+			self._images.move_to_end(key)
+			return image
+
+		from PIL import Image, ImageTk
+
+		thumbnail = os.path.join(self.directory, key + '.png')
+		try:
+			with Image.open(thumbnail) as img:
+				image = ImageTk.PhotoImage(img)
+		except OSError:
+			image = ImageTk.PhotoImage(self.make(path, thumbnail))
+
+		self._images[key] = image
+		self._bytes += image.width() * image.height() * 4
+		while self._bytes > self.max_bytes and len(self._images) > 1:
+			_, old = self._images.popitem(last=False)
+			self._bytes -= old.width() * old.height() * 4
+		return image
+
+	def key(self, path: str) -> str:
+		"""Get the key of the thumbnail of a picture. Its first part only
+		depends on the path, so older thumbnails of it can be found.
+
+		Args:
+			path (str): The path of the picture.
+
+		Returns:
+			str: The key.
+		"""
+
+		path = os.path.abspath(path)
+		stat = os.stat(path)
+		name = hashlib.sha1(path.encode('utf-8')).hexdigest()[:16]
+		version = hashlib.sha1(
+			f'{stat.st_mtime_ns}:{stat.st_size}:{self.size}'.encode()).hexdigest()[:8]
+		return f'{name}_{version}'
+
+	def make(self, path: str, thumbnail: Optional[str]=None) -> 'Image.Image':
+		"""Make the thumbnail of a picture, saving it if given where.
+
+		Args:
+			path (str): The path of the picture.
+			thumbnail (str): Where to save the thumbnail, replacing older
+			ones of the picture. Defaults to None.
+
+		Returns:
+			Image.Image: The thumbnail.
+		"""
+
+		from PIL import Image
+
+		with Image.open(path) as img:
+			#   Lets JPEGs decode at a fraction of their size
+			img.draft('RGB', self.size)
+			img = img.resize(self.size)
+		if img.mode not in ('1', 'L', 'LA', 'P', 'RGB', 'RGBA'):
+			img = img.convert('RGBA')
+
+		if thumbnail is not None:
+			try:
+				os.makedirs(self.directory, exist_ok=True)
+				for old in glob.glob(thumbnail.rsplit('_', 1)[0] + '_*.png'):
+					os.remove(old)
+				img.save(thumbnail + '.tmp', 'PNG')
+				os.replace(thumbnail + '.tmp', thumbnail)
+			except OSError:
+				#   Still usable, just made again next time
+				pass
+		return img
+
+	def clear(self) -> None:
+		"""Drop the thumbnails kept in memory."""
+
+		self._images.clear()
+		self._bytes = 0